@@ -5,7 +5,22 @@ Contains fixtures and setup/teardown logic
 
 import pytest
 from utils.WebDriverFactory import WebDriverFactory
+from utils.DriverPool import DriverPool
+from utils.DriverBinaryCache import DriverBinaryCache
+from utils.DataCache import DataCache
+from utils.DurationStore import DurationStore
+from utils.SuiteScheduler import SuiteScheduler
+from utils.EventWaitUtility import EventWaitUtility
+from utils.CommandProfiler import CommandProfiler
+from utils.PageMetrics import PageMetricsCollector
+from utils.FailureArtifacts import FailureArtifacts
+from pages.BasePage import BasePage
 import os
+import warnings
+
+
+# Per-test durations of the current run, flushed to the duration history at session end
+_test_durations = {}
 
 
 def pytest_addoption(parser):
@@ -28,17 +43,135 @@ def pytest_addoption(parser):
         default=f"file:///{os.getcwd().replace(chr(92), '/')}",
         help="Base URL of the application"
     )
+    parser.addoption(
+        "--api-url",
+        action="store",
+        default=None,
+        help="Backend URL for ApiClient (default: API_BASE_URL or http://localhost:3000)"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=0,
+        help="Number of warm browser sessions to reuse across tests (0 disables the pool)"
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        action="store",
+        type=int,
+        default=20,
+        help="Tests served by a pooled browser before it is relaunched"
+    )
+    parser.addoption(
+        "--driver-scope",
+        action="store",
+        default="function",
+        choices=["function", "session"],
+        help="function: new browser per test; session: one browser per run (per worker), "
+             "reset between tests and relaunched only when a reset fails"
+    )
+    parser.addoption(
+        "--slowest-first",
+        action="store_true",
+        default=False,
+        help="Run tests in order of their historical duration, slowest first"
+    )
+    parser.addoption(
+        "--wait-engine",
+        action="store",
+        default="polling",
+        choices=["polling", "event"],
+        help="Page object wait engine: polling (WebDriverWait) or event (in-page MutationObserver)"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=False,
+        help="Time every WebDriver command, wait and sleep; writes test_results/command_profile.json"
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=False,
+        help="Capture load timing for every page-object navigation into test_results/page_metrics.jsonl"
+    )
+    parser.addoption(
+        "--isolate-db",
+        action="store_true",
+        default=False,
+        help="Snapshot jewelry_store_db (DB_* variables) once and restore tables changed by "
+             "tests that use isolated_db; serial runs only"
+    )
+    parser.addoption(
+        "--serve-website",
+        action="store_true",
+        default=False,
+        help="Serve website/ from a local HTTP server (keep-alive, ETag/Cache-Control) instead of file:// URLs"
+    )
+    parser.addoption(
+        "--no-gzip",
+        action="store_true",
+        default=False,
+        help="Disable gzip compression of the local website server"
+    )
+    parser.addoption(
+        "--stand-in-backend",
+        action="store_true",
+        default=False,
+        help="Serve website/ and the /api/* endpoints from an in-memory stand-in for backend/server.js "
+             "(overrides --base-url and --api-url)"
+    )
+
+
+def _uses_driver_pool(config):
+    return config.getoption("--pool-size") > 0 or config.getoption("--driver-scope") == "session"
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Fixture providing the shared DriverPool
+    Scope: session - sessions are warmed once and reused by the driver fixture
+    
+    With --driver-scope=session the pool holds a single browser that is only
+    recycled when resetting it between tests fails.
+    """
+    if request.config.getoption("--driver-scope") == "session":
+        pool = DriverPool(size=max(request.config.getoption("--pool-size"), 1), max_uses=0)
+    else:
+        pool = DriverPool(
+            size=request.config.getoption("--pool-size"),
+            max_uses=request.config.getoption("--pool-max-uses")
+        )
+    pool.warm(
+        browser=request.config.getoption("--browser"),
+        headless=request.config.getoption("--headless")
+    )
+    
+    yield pool
+    
+    pool.close()
+    request.config.driver_pool_stats = dict(pool.stats)
 
 
 @pytest.fixture(scope="function")
 def driver(request):
     """
     Fixture to create and teardown WebDriver
-    Scope: function - creates new driver for each test
+    Scope: function - creates new driver for each test, or leases a warm
+    session from the driver pool when --pool-size is greater than 0 or
+    --driver-scope is session
     """
     browser = request.config.getoption("--browser")
     headless = request.config.getoption("--headless")
     
+    if _uses_driver_pool(request.config):
+        pool = request.getfixturevalue("driver_pool")
+        with pool.lease(browser=browser, headless=headless) as driver_instance:
+            yield driver_instance
+        return
+    
     # Create driver
     driver_instance = WebDriverFactory.create_driver(browser=browser, headless=headless)
     
@@ -49,9 +182,95 @@ def driver(request):
     driver_instance.quit()
 
 
+@pytest.fixture(scope="session")
+def api_session():
+    """
+    Keep-alive HTTP session shared by every ApiClient of the run
+    Scope: session - connections to the backend are reused across tests
+    """
+    from utils.ApiClient import ApiClient
+    session = ApiClient.create_session()
+    
+    yield session
+    
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def api_client(request, api_session):
+    """
+    Fixture providing a logged-out ApiClient for the backend /api/* endpoints
+    Use it to set up state (login, cart) over HTTP before the UI assertion
+    """
+    from utils.ApiClient import ApiClient
+    client = ApiClient(request.config.getoption("--api-url"), session=api_session)
+    
+    yield client
+    
+    client.logout()
+
+
+@pytest.fixture(scope="session")
+def db_snapshot(request):
+    """
+    Snapshot of the jewelry_store_db tables, taken once per session
+    Yields None without touching MySQL unless --isolate-db is given (or when
+    --stand-in-backend is used), and None with a warning when the database
+    is not reachable
+    """
+    if not request.config.getoption("--isolate-db") or request.config.stand_in_backend is not None:
+        yield None
+        return
+    try:
+        from utils.Database import Database
+        from utils.DatabaseSnapshot import DatabaseSnapshot
+        db = Database()
+    except (ImportError, RuntimeError) as e:
+        warnings.warn(f"Database snapshot disabled: {e}")
+        yield None
+        return
+    
+    snapshot = DatabaseSnapshot(db).take()
+    
+    yield snapshot
+    
+    db.close()
+
+
+@pytest.fixture(scope="function")
+def isolated_db(request, db_snapshot):
+    """
+    Fixture that restores the tables a test changed once it finishes
+    Only tables whose checksum changed are truncated and reloaded from the snapshot;
+    with --stand-in-backend the in-memory store is reseeded instead
+    """
+    yield db_snapshot.db if db_snapshot is not None else None
+    
+    if db_snapshot is not None:
+        db_snapshot.restore()
+    elif request.config.stand_in_backend is not None:
+        request.config.stand_in_backend.store.reset()
+
+
+@pytest.fixture(scope="session")
+def website_server(request):
+    """
+    Threaded local HTTP server for website/
+    Scope: session - one server (on a free port) per run and per xdist worker
+    """
+    from utils.StaticSiteServer import StaticSiteServer
+    server = StaticSiteServer(gzip=not request.config.getoption("--no-gzip")).start()
+    
+    yield server
+    
+    server.stop()
+
+
 @pytest.fixture(scope="function")
 def base_url(request):
     """Fixture to provide base URL"""
+    if request.config.getoption("--serve-website") and request.config.stand_in_backend is None:
+        return request.getfixturevalue("website_server").url
     return request.config.getoption("--base-url")
 
 
@@ -64,6 +283,13 @@ def driver_class(request):
     browser = request.config.getoption("--browser")
     headless = request.config.getoption("--headless")
     
+    if _uses_driver_pool(request.config):
+        pool = request.getfixturevalue("driver_pool")
+        with pool.lease(browser=browser, headless=headless) as driver_instance:
+            request.cls.driver = driver_instance
+            yield driver_instance
+        return
+    
     driver_instance = WebDriverFactory.create_driver(browser=browser, headless=headless)
     request.cls.driver = driver_instance
     
@@ -76,7 +302,9 @@ def driver_class(request):
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook to capture test results and take screenshots on failure
+    Hook to capture test results and failure artifacts
+    Screenshot, page source and console log are grabbed here; compression and
+    disk writes happen on the FailureArtifacts thread pool
     """
     outcome = yield
     report = outcome.get_result()
@@ -91,14 +319,141 @@ def pytest_runtest_makereport(item, call):
                 driver = item.funcargs['driver']
         
         if driver:
-            screenshot_dir = "test_results/screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)
-            screenshot_path = f"{screenshot_dir}/{item.name}.png"
-            driver.save_screenshot(screenshot_path)
-            print(f"\nScreenshot saved: {screenshot_path}")
+            artifact_path = item.config.failure_artifacts.capture(
+                driver, item.name, {"nodeid": item.nodeid, "error": report.longreprtext[-2000:]}
+            )
+            print(f"\nFailure artifacts queued: {artifact_path}.*")
 
 
 def pytest_configure(config):
     """Create test results directory"""
     os.makedirs("test_results", exist_ok=True)
     os.makedirs("test_results/screenshots", exist_ok=True)
+    config.duration_store = DurationStore()
+    config.failure_artifacts = FailureArtifacts()
+    if config.getoption("--isolate-db") and (os.getenv("TEST_WORKER_ID") or os.getenv("PYTEST_XDIST_WORKER")):
+        # Every worker would restore the shared database to its own snapshot,
+        # wiping rows that tests on other workers are still using
+        raise pytest.UsageError("--isolate-db cannot be used with parallel workers sharing one database")
+    if config.getoption("--wait-engine") == "event":
+        BasePage.WAIT_UTILITY = EventWaitUtility
+    if config.getoption("--page-metrics"):
+        BasePage.PAGE_METRICS = PageMetricsCollector()
+    config.command_profiler = None
+    if config.getoption("--profile-commands"):
+        config.command_profiler = CommandProfiler()
+        config.command_profiler.install()
+    config.stand_in_backend = None
+    if config.getoption("--stand-in-backend"):
+        # One server per process, so every xdist worker gets its own store and port
+        from utils.StandInBackend import StandInBackend
+        config.stand_in_backend = StandInBackend(gzip=not config.getoption("--no-gzip")).start()
+        config.option.base_url = config.stand_in_backend.url
+        config.option.api_url = config.stand_in_backend.url
+
+
+def pytest_unconfigure(config):
+    """Restore functions patched by the command profiler and stop the stand-in backend"""
+    if getattr(config, "command_profiler", None) is not None:
+        config.command_profiler.uninstall()
+    if getattr(config, "stand_in_backend", None) is not None:
+        config.stand_in_backend.stop()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    """Attribute profiled commands to the running test"""
+    profiler = item.config.command_profiler
+    if profiler is not None:
+        profiler.start_test(item.nodeid)
+    yield
+    if profiler is not None:
+        profiler.end_test()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Reorder collected tests slowest-first when --slowest-first is given"""
+    if not config.getoption("--slowest-first"):
+        return
+    estimates = config.duration_store.estimates(
+        [item.nodeid for item in items],
+        browser=config.getoption("--browser")
+    )
+    order = {node_id: i for i, node_id in enumerate(
+        SuiteScheduler.order_slowest_first([item.nodeid for item in items], estimates)
+    )}
+    items.sort(key=lambda item: order[item.nodeid])
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate setup + call + teardown time per test"""
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    """Record this run's test durations and write the command profile"""
+    config = session.config
+    config.failure_artifacts.wait()
+    if config.command_profiler is not None:
+        config.command_profiler.write_report()
+    if BasePage.PAGE_METRICS is not None:
+        BasePage.PAGE_METRICS.save()
+    if not _test_durations:
+        return
+    browser = config.getoption("--browser")
+    for node_id, duration in _test_durations.items():
+        config.duration_store.record(node_id, duration, browser)
+    config.duration_store.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report driver cache savings, failure artifacts, browser reuse and the command profile"""
+    stats = DriverBinaryCache.stats()
+    if stats["hits"] or stats["misses"]:
+        terminalreporter.write_line(
+            f"Driver binary cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"~{stats['saved_seconds']:.1f}s of driver resolution saved"
+        )
+    
+    data_stats = DataCache.stats()
+    if data_stats["hits"] or data_stats["misses"]:
+        terminalreporter.write_line(
+            f"Test data cache: {data_stats['hits']} hits, {data_stats['misses']} files parsed"
+        )
+    
+    artifact_stats = config.failure_artifacts.stats()
+    if artifact_stats["captured"]:
+        terminalreporter.write_line(
+            f"Failure artifacts: {artifact_stats['files']} files for {artifact_stats['captured']} failures "
+            f"in {artifact_stats['directory']} ({artifact_stats['capture_seconds']:.2f}s in teardown, "
+            f"{artifact_stats['errors']} write errors)"
+        )
+    
+    pool_stats = getattr(config, "driver_pool_stats", None)
+    if pool_stats:
+        terminalreporter.write_line(
+            f"Browser reuse: {pool_stats['launches']} launches, {pool_stats['resets']} verified resets, "
+            f"{pool_stats['relaunches']} relaunches after a failed reset"
+        )
+    
+    if config.command_profiler is not None:
+        summary = config.command_profiler.summarize(top=5)
+        totals = summary["totals"]
+        terminalreporter.write_sep("-", "WebDriver command profile")
+        terminalreporter.write_line(
+            f"{totals['commands']} commands in {totals['command_seconds']:.1f}s, "
+            f"waits {totals['wait_seconds']:.1f}s, sleeps {totals['sleep_seconds']:.1f}s"
+        )
+        for entry in summary["top_commands"]:
+            terminalreporter.write_line(f"  {entry['seconds']:8.2f}s {entry['count']:6d}x  {entry['name']}")
+        terminalreporter.write_line("Full profile: test_results/command_profile.json")
+    
+    if BasePage.PAGE_METRICS is not None and BasePage.PAGE_METRICS.samples:
+        terminalreporter.write_sep("-", "Page load metrics (median ms)")
+        for path, metrics in sorted(BasePage.PAGE_METRICS.summarize().items()):
+            terminalreporter.write_line(
+                f"  {path:24s} ttfb {metrics.get('ttfb')}  dcl {metrics.get('dom_content_loaded')}  "
+                f"load {metrics.get('load')}  fcp {metrics.get('first_contentful_paint')}  "
+                f"images {metrics.get('image_bytes')} B  ({metrics['navigations']} navigations)"
+            )
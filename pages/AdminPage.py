@@ -3,20 +3,21 @@ AdminPage - Page object for the administration dashboard
 """
 
 from selenium.webdriver.common.by import By
+from pages.BasePage import BasePage
 
 
-class AdminPage:
+class AdminPage(BasePage):
     """Page object for the product admin dashboard."""
 
     PRODUCT_ROWS = (By.CSS_SELECTOR, "#productsTable tbody tr")
     LOGOUT_LINK = (By.ID, "logoutLink")
 
     def __init__(self, driver, base_url):
-        self.driver = driver
+        super().__init__(driver)
         self.base_url = base_url.rstrip('/')
 
     def navigate(self):
-        self.driver.get(f"{self.base_url}/admin.html")
+        self.navigate_to(f"{self.base_url}/admin.html")
 
     def is_loaded(self):
         return self.driver.current_url.lower().endswith("/admin.html")
@@ -1,13 +1,56 @@
 
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from utils.WaitUtility import WaitUtility
+from utils.DomScripts import FIND_ELEMENTS, IS_VISIBLE
 
 
 class BasePage:
     """Base class for all page objects"""
     
+    # Wait engine used by page objects; conftest switches it with --wait-engine
+    WAIT_UTILITY = WaitUtility
+    
+    # PageMetricsCollector fed by every navigation; set by conftest with --page-metrics
+    PAGE_METRICS = None
+    
+    # arguments: [[using, value, field value], ...]; returns locators not found
+    FILL_FORM_SCRIPT = FIND_ELEMENTS + """
+        var missing = [];
+        arguments[0].forEach(function (item) {
+            var el = findElements(item[0], item[1])[0];
+            if (!el) { missing.push([item[0], item[1]]); return; }
+            if (el.type === 'checkbox' || el.type === 'radio') {
+                el.checked = !!item[2];
+            } else {
+                // Use the native setter so framework-tracked values are updated too
+                var proto = Object.getPrototypeOf(el);
+                var setter = Object.getOwnPropertyDescriptor(proto, 'value');
+                if (setter && setter.set) { setter.set.call(el, String(item[2])); } else { el.value = String(item[2]); }
+            }
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        return missing;
+    """
+    
+    # arguments: using, value, attribute names
+    QUERY_ELEMENTS_SCRIPT = FIND_ELEMENTS + IS_VISIBLE + """
+        var attributes = arguments[2];
+        return findElements(arguments[0], arguments[1]).map(function (el) {
+            var visible = isVisible(el), rect = el.getBoundingClientRect(), attrs = {};
+            attributes.forEach(function (name) { attrs[name] = el.getAttribute(name); });
+            return {
+                element: el,
+                visible: visible,
+                text: visible ? el.innerText.trim() : '',
+                attributes: attrs,
+                rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+            };
+        });
+    """
+    
     def __init__(self, driver):
         """
         Initialize BasePage
@@ -16,11 +59,22 @@ class BasePage:
             driver: WebDriver instance
         """
         self.driver = driver
-        self.wait_utility = WaitUtility(driver)
+        self.wait_utility = self.WAIT_UTILITY(driver)
     
-    def navigate_to(self, url):
-        """Navigate to a specific URL"""
+    def navigate_to(self, url, collect_metrics=None):
+        """
+        Navigate to a specific URL
+        
+        Args:
+            url (str): URL to load
+            collect_metrics (bool): Capture page-load metrics for this navigation
+                (default: whenever a PAGE_METRICS collector is configured)
+        """
         self.driver.get(url)
+        if collect_metrics is None:
+            collect_metrics = self.PAGE_METRICS is not None
+        if collect_metrics and self.PAGE_METRICS is not None:
+            return self.PAGE_METRICS.collect(self.driver, type(self).__name__)
     
     def get_current_url(self):
         """Get current page URL"""
@@ -57,6 +111,34 @@ class BasePage:
         """
         return self.driver.find_elements(*locator)
     
+    def query_elements(self, locator, attributes=()):
+        """
+        Read the state of every element matching a locator in one round trip
+        
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            attributes (tuple): Attribute names to read for each element
+            
+        Returns:
+            list: One dict per match with 'element' (WebElement), 'visible',
+            'text' (rendered text, empty when hidden), 'attributes' and
+            'rect' (x, y, width, height)
+        """
+        by, value = locator
+        return self.driver.execute_script(self.QUERY_ELEMENTS_SCRIPT, by, value, list(attributes))
+    
+    def query_visible_texts(self, locator):
+        """
+        Get the text of all visible elements matching a locator in one round trip
+        
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            
+        Returns:
+            list: Texts of the visible matches, in document order
+        """
+        return [match["text"] for match in self.query_elements(locator) if match["visible"]]
+    
     def click(self, locator):
         """
         Click on an element
@@ -79,6 +161,34 @@ class BasePage:
         element.clear()
         element.send_keys(text)
     
+    def fill_form(self, fields, realistic=False):
+        """
+        Fill several form controls at once
+        
+        By default all values are set in one scripted pass that fires the same
+        'input' and 'change' events typing would, so page listeners (formatting,
+        validation) still run. Text inputs, textareas, selects (by value) and
+        checkboxes/radios (by truthiness) are supported.
+        
+        Args:
+            fields (dict): Mapping of locator tuple to value
+            realistic (bool): Type each text field with send_keys instead
+        """
+        if realistic:
+            for locator, value in fields.items():
+                element = self.wait_utility.wait_for_element_visible(locator)
+                if element.tag_name == "select":
+                    Select(element).select_by_value(value)
+                else:
+                    element.clear()
+                    element.send_keys(value)
+            return
+        
+        items = [[by, value, field_value] for (by, value), field_value in fields.items()]
+        missing = self.execute_script(self.FILL_FORM_SCRIPT, items)
+        if missing:
+            raise NoSuchElementException(f"Form fields not found: {[tuple(m) for m in missing]}")
+    
     def get_text(self, locator):
         """
         Get text from an element
@@ -4,7 +4,6 @@ CartPage - Page Object Model for shopping cart page
 
 from selenium.webdriver.common.by import By
 from pages.BasePage import BasePage
-import time
 
 
 class CartPage(BasePage):
@@ -30,6 +29,7 @@ class CartPage(BasePage):
     CITY_INPUT = (By.ID, "city")
     STATE_INPUT = (By.ID, "state")
     ZIP_INPUT = (By.ID, "zip")
+    COUNTRY_SELECT = (By.ID, "country")
     CARD_NUMBER_INPUT = (By.ID, "card-number")
     CARD_NAME_INPUT = (By.ID, "card-name")
     EXPIRY_INPUT = (By.ID, "card-expiry")
@@ -41,6 +41,25 @@ class CartPage(BasePage):
     PREV_STEP_BUTTON = (By.CLASS_NAME, "prev-step")
     FORM_STEPS = (By.CLASS_NAME, "form-step")
     
+    # Remove confirmation modal created by cart.js
+    MODAL_CONFIRM_BUTTON = (By.ID, "modal-confirm")
+    
+    # Post-conditions of checkout actions (evaluated in the page)
+    SHIPPING_STEP = "1"
+    PAYMENT_STEP = "2"
+    STEP_SHOWN_SCRIPT = """
+        var steps = Array.from(document.querySelectorAll('.checkout-step'));
+        if (steps.length === 0) return true;
+        var shown = steps.filter(function (s) { return s.style.display !== 'none'; });
+        return shown.length === 1 && shown[0].getAttribute('data-step') === arguments[0];
+    """
+    ORDER_SUBMIT_SETTLED_SCRIPT = """
+        var success = document.getElementById('order-success');
+        if (success && success.style.display === 'block') return true;
+        var button = document.querySelector('#checkout-form button[type="submit"]');
+        return !(button && button.disabled);
+    """
+    
     def __init__(self, driver, base_url):
         """
         Initialize CartPage
@@ -63,7 +82,7 @@ class CartPage(BasePage):
     
     def get_cart_item_titles(self):
         """Get all cart item titles"""
-        return [item.text.strip() for item in self.find_elements(self.ITEM_TITLES)]
+        return [item["text"] for item in self.query_elements(self.ITEM_TITLES)]
     
     def get_total_amount(self):
         """Get total cart amount"""
@@ -85,13 +104,47 @@ class CartPage(BasePage):
     
     def remove_first_item(self):
         """Remove first item from cart"""
+        rows = self.find_elements(self.CART_ITEMS)
         buttons = self.find_elements(self.REMOVE_BUTTONS)
         if buttons:
             buttons[0].click()
-            time.sleep(0.5)
+            self.click(self.MODAL_CONFIRM_BUTTON)
+            self.wait_utility.wait_for_staleness(rows[0])
     
     # Checkout form methods
-    def fill_personal_info(self, name, email, phone):
+    def _personal_info_fields(self, name, email, phone):
+        """Map personal information onto the checkout form fields"""
+        # Split name into first/last when possible
+        parts = name.split(None, 1)
+        first = parts[0] if parts else ''
+        last = parts[1] if len(parts) > 1 else ''
+        return {
+            self.FULL_NAME_INPUT: first,
+            self.LAST_NAME_INPUT: last,
+            self.EMAIL_INPUT: email,
+            self.PHONE_INPUT: phone,
+        }
+    
+    def _shipping_address_fields(self, address, city, state, zip_code, country="us"):
+        """Map a shipping address onto the checkout form fields"""
+        return {
+            self.ADDRESS_INPUT: address,
+            self.CITY_INPUT: city,
+            self.STATE_INPUT: state,
+            self.ZIP_INPUT: zip_code,
+            self.COUNTRY_SELECT: country,
+        }
+    
+    def _payment_info_fields(self, card_number, card_name, expiry, cvv):
+        """Map payment information onto the checkout form fields"""
+        return {
+            self.CARD_NUMBER_INPUT: card_number,
+            self.CARD_NAME_INPUT: card_name,
+            self.EXPIRY_INPUT: expiry,
+            self.CVV_INPUT: cvv,
+        }
+    
+    def fill_personal_info(self, name, email, phone, realistic=False):
         """
         Fill personal information
         
@@ -99,18 +152,11 @@ class CartPage(BasePage):
             name (str): Full name
             email (str): Email address
             phone (str): Phone number
+            realistic (bool): Type each field instead of filling them in one pass
         """
-        # Split name into first/last when possible
-        parts = name.split(None, 1)
-        first = parts[0] if parts else ''
-        last = parts[1] if len(parts) > 1 else ''
-        self.type_text(self.FULL_NAME_INPUT, first)
-        if hasattr(self, 'LAST_NAME_INPUT'):
-            self.type_text(self.LAST_NAME_INPUT, last)
-        self.type_text(self.EMAIL_INPUT, email)
-        self.type_text(self.PHONE_INPUT, phone)
+        self.fill_form(self._personal_info_fields(name, email, phone), realistic=realistic)
     
-    def fill_shipping_address(self, address, city, state, zip_code):
+    def fill_shipping_address(self, address, city, state, zip_code, country="us", realistic=False):
         """
         Fill shipping address
         
@@ -119,13 +165,12 @@ class CartPage(BasePage):
             city (str): City
             state (str): State
             zip_code (str): ZIP code
+            country (str): Option value of the required country select (e.g. 'us', 'co')
+            realistic (bool): Type each field instead of filling them in one pass
         """
-        self.type_text(self.ADDRESS_INPUT, address)
-        self.type_text(self.CITY_INPUT, city)
-        self.type_text(self.STATE_INPUT, state)
-        self.type_text(self.ZIP_INPUT, zip_code)
+        self.fill_form(self._shipping_address_fields(address, city, state, zip_code, country), realistic=realistic)
     
-    def fill_payment_info(self, card_number, card_name, expiry, cvv):
+    def fill_payment_info(self, card_number, card_name, expiry, cvv, realistic=False):
         """
         Fill payment information
         
@@ -134,39 +179,46 @@ class CartPage(BasePage):
             card_name (str): Name on card
             expiry (str): Expiry date
             cvv (str): CVV code
+            realistic (bool): Type each field instead of filling them in one pass
         """
-        self.type_text(self.CARD_NUMBER_INPUT, card_number)
-        self.type_text(self.CARD_NAME_INPUT, card_name)
-        self.type_text(self.EXPIRY_INPUT, expiry)
-        self.type_text(self.CVV_INPUT, cvv)
+        self.fill_form(self._payment_info_fields(card_number, card_name, expiry, cvv), realistic=realistic)
     
     def click_next_step(self):
         """Click next step button in multi-step form"""
         # Use the page's JS flow functions to advance steps
-        try:
-            self.driver.execute_script('if(window.goToPayment) window.goToPayment();')
-            time.sleep(0.5)
-        except Exception:
-            time.sleep(0.5)
+        self.driver.execute_script('if(window.goToPayment) window.goToPayment();')
+        self._wait_for_step_shown(self.PAYMENT_STEP, "payment")
     
     def click_previous_step(self):
         """Click previous step button in multi-step form"""
-        try:
-            self.driver.execute_script('if(window.goToShipping) window.goToShipping();')
-            time.sleep(0.5)
-        except Exception:
-            time.sleep(0.5)
+        self.driver.execute_script('if(window.goToShipping) window.goToShipping();')
+        self._wait_for_step_shown(self.SHIPPING_STEP, "shipping")
+    
+    def _wait_for_step_shown(self, step, name):
+        """
+        Wait until the given checkout step is the only one shown
+        
+        Args:
+            step (str): data-step value of the target step
+            name (str): Step name for the timeout message
+        """
+        self.wait_utility.wait_for_script_condition(
+            self.STEP_SHOWN_SCRIPT, step,
+            message=f"Checkout did not move to the {name} step (data-step={step}); "
+                    f"the form may have rejected the step change"
+        )
     
     def click_place_order(self):
         """Click place order button"""
-        # Submit the checkout form
-        try:
-            self.driver.execute_script("document.getElementById('checkout-form') && document.getElementById('checkout-form').dispatchEvent(new Event('submit',{cancelable:true,bubbles:true}));")
-            time.sleep(1)
-        except Exception:
-            time.sleep(1)
+        # Submit the checkout form, then wait for the order confirmation or
+        # for validation to reject the submit (button is only disabled while processing)
+        self.driver.execute_script("document.getElementById('checkout-form') && document.getElementById('checkout-form').dispatchEvent(new Event('submit',{cancelable:true,bubbles:true}));")
+        self.wait_utility.wait_for_script_condition(
+            self.ORDER_SUBMIT_SETTLED_SCRIPT,
+            message="Order submission did not complete"
+        )
     
-    def complete_checkout(self, personal_info, shipping_info, payment_info):
+    def complete_checkout(self, personal_info, shipping_info, payment_info, realistic=False):
         """
         Complete entire checkout process
         
@@ -174,31 +226,32 @@ class CartPage(BasePage):
             personal_info (dict): Personal information
             shipping_info (dict): Shipping information
             payment_info (dict): Payment information
+            realistic (bool): Type each field instead of filling them in one pass
         """
         self.click_checkout_button()
         
-        # Step 1: Personal Info
-        self.fill_personal_info(
+        # Step 1: Personal Info and Shipping Address share the first form step
+        fields = self._personal_info_fields(
             personal_info['name'],
             personal_info['email'],
             personal_info['phone']
         )
-        self.click_next_step()
-        
-        # Step 2: Shipping Address
-        self.fill_shipping_address(
+        fields.update(self._shipping_address_fields(
             shipping_info['address'],
             shipping_info['city'],
             shipping_info['state'],
-            shipping_info['zip']
-        )
+            shipping_info['zip'],
+            shipping_info.get('country', 'us')
+        ))
+        self.fill_form(fields, realistic=realistic)
         self.click_next_step()
         
-        # Step 3: Payment Info
+        # Step 2: Payment Info
         self.fill_payment_info(
             payment_info['card_number'],
             payment_info['card_name'],
             payment_info['expiry'],
-            payment_info['cvv']
+            payment_info['cvv'],
+            realistic=realistic
         )
         self.click_place_order()
@@ -5,7 +5,6 @@ CatalogPage - Page Object Model for catalog page
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from pages.BasePage import BasePage
-import time
 
 
 class CatalogPage(BasePage):
@@ -24,6 +23,20 @@ class CatalogPage(BasePage):
     DATETIME_DISPLAY = (By.ID, "datetime-display")
     CART_COUNT = (By.ID, "cart-count")
     
+    # Post-conditions of catalog actions (evaluated in the page)
+    SEARCH_APPLIED_SCRIPT = """
+        var term = arguments[0].toLowerCase();
+        return Array.from(document.querySelectorAll('.product-card')).every(function (card) {
+            var title = card.querySelector('.product-title').textContent.toLowerCase();
+            return (card.style.display === 'none') !== title.includes(term);
+        });
+    """
+    SUBCATEGORIES_LOADED_SCRIPT = """
+        var category = document.getElementById('filter-category').value;
+        var subcategory = document.getElementById('filter-subcategory');
+        return category ? !subcategory.disabled && subcategory.options.length > 1 : subcategory.disabled;
+    """
+    
     def __init__(self, driver, base_url):
         """
         Initialize CatalogPage
@@ -48,7 +61,10 @@ class CatalogPage(BasePage):
             search_term (str): Search term
         """
         self.type_text(self.SEARCH_INPUT, search_term)
-        time.sleep(1)  # Wait for search results to filter
+        self.wait_utility.wait_for_script_condition(
+            self.SEARCH_APPLIED_SCRIPT, search_term,
+            message=f"Product grid not filtered for '{search_term}'"
+        )
     
     def select_category(self, category):
         """
@@ -60,7 +76,11 @@ class CatalogPage(BasePage):
         category_element = self.wait_utility.wait_for_element_visible(self.CATEGORY_SELECT)
         select = Select(category_element)
         select.select_by_visible_text(category)
-        time.sleep(1)  # Wait for subcategories to load
+        self.wait_utility.wait_for_script_condition(
+            self.SUBCATEGORIES_LOADED_SCRIPT,
+            message=f"Subcategories not loaded for '{category}'"
+        )
+        self.wait_utility.wait_for_elements_stable(self.PRODUCT_CARDS)
     
     def select_subcategory(self, subcategory):
         """
@@ -72,7 +92,7 @@ class CatalogPage(BasePage):
         subcategory_element = self.wait_utility.wait_for_element_visible(self.SUBCATEGORY_SELECT)
         select = Select(subcategory_element)
         select.select_by_visible_text(subcategory)
-        time.sleep(1)
+        self.wait_utility.wait_for_elements_stable(self.PRODUCT_CARDS)
     
     def select_price_range(self, price_range):
         """
@@ -84,7 +104,7 @@ class CatalogPage(BasePage):
         price_element = self.wait_utility.wait_for_element_visible(self.PRICE_RANGE_SELECT)
         select = Select(price_element)
         select.select_by_value(price_range)
-        time.sleep(1)
+        self.wait_utility.wait_for_elements_stable(self.PRODUCT_CARDS)
     
     def select_sort_option(self, sort_option):
         """
@@ -96,38 +116,23 @@ class CatalogPage(BasePage):
         sort_element = self.wait_utility.wait_for_element_visible(self.SORT_SELECT)
         select = Select(sort_element)
         select.select_by_value(sort_option)
-        time.sleep(1)
+        self.wait_utility.wait_for_elements_stable(self.PRODUCT_CARDS)
     
     def get_product_count(self):
         """Get number of visible products"""
-        visible_products = [p for p in self.find_elements(self.PRODUCT_CARDS) 
-                           if p.is_displayed()]
-        return len(visible_products)
+        return sum(1 for card in self.query_elements(self.PRODUCT_CARDS) if card["visible"])
     
     def get_product_titles(self):
         """Get all visible product titles"""
-        titles = []
-        for title in self.find_elements(self.PRODUCT_TITLES):
-            if title.is_displayed():
-                titles.append(title.text)
-        return titles
+        return self.query_visible_texts(self.PRODUCT_TITLES)
     
     def get_product_prices(self):
         """Get all visible product prices"""
-        prices = []
-        for price in self.find_elements(self.PRODUCT_PRICES):
-            if price.is_displayed():
-                prices.append(price.text)
-        return prices
+        return self.query_visible_texts(self.PRODUCT_PRICES)
     
     def add_first_product_to_cart(self):
         """Add first visible product to cart"""
-        buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
-        for button in buttons:
-            if button.is_displayed():
-                button.click()
-                time.sleep(0.5)
-                break
+        self.add_product_to_cart_by_index(0)
     
     def add_product_to_cart_by_index(self, index):
         """
@@ -136,11 +141,16 @@ class CatalogPage(BasePage):
         Args:
             index (int): Product index (0-based)
         """
-        buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
-        visible_buttons = [b for b in buttons if b.is_displayed()]
+        visible_buttons = [b["element"] for b in self.query_elements(self.ADD_TO_CART_BUTTONS)
+                           if b["visible"]]
         if index < len(visible_buttons):
-            visible_buttons[index].click()
-            time.sleep(0.5)
+            self._click_and_wait_for_cart_update(visible_buttons[index])
+    
+    def _click_and_wait_for_cart_update(self, button):
+        """Click an add-to-cart button and wait for #cart-count to change"""
+        previous_count = self.get_cart_count()
+        button.click()
+        self.wait_utility.wait_for_text_to_change(self.CART_COUNT, previous_count)
     
     def get_cart_count(self):
         """Get cart item count"""
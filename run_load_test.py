@@ -0,0 +1,109 @@
+"""
+Load Test Runner - Concurrent shoppers against the backend API
+
+Starts N virtual users with asyncio (ramped up linearly or in steps), each
+looping over weighted journeys (browse / shopper / buyer) against the
+/api/* endpoints of backend/server.js, then prints latency percentiles,
+throughput and error rates per endpoint and writes the report to
+test_results/load/load_<run_id>.json. Pass --compare with an earlier report
+to see the deltas between runs.
+
+Requires aiohttp (pip install aiohttp) and a running backend.
+
+Usage:
+    python run_load_test.py --users 50 --duration 60 --ramp-up 20
+    python run_load_test.py --users 100 --journeys buyer:1,browse:3 --ramp-up 30 --ramp-steps 5
+    python run_load_test.py --users 50 --compare test_results/load/load_<previous>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from utils.LoadGenerator import LoadGenerator
+
+
+def parse_journeys(value):
+    """Parse 'buyer:1,browse:3' into {'buyer': 1.0, 'browse': 3.0}"""
+    journeys = {}
+    for item in value.split(","):
+        name, _, weight = item.strip().partition(":")
+        journeys[name] = float(weight) if weight else 1.0
+    return journeys
+
+
+def print_report(report, deltas=None):
+    """Print the per-endpoint table"""
+    print("\n" + "="*100)
+    print(f"  LOAD TEST {report['run_id']}: {report['config']['users']} users, "
+          f"{report['elapsed_seconds']}s against {report['base_url']}")
+    print("="*100)
+    header = f"  {'endpoint':28s} {'requests':>9s} {'req/s':>8s} {'errors':>7s} {'p50 ms':>8s} {'p90 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s}"
+    if deltas is not None:
+        header += f" {'Δp95 ms':>9s}"
+    print(header)
+    rows = list(report["endpoints"].items()) + [("TOTAL", report["total"])]
+    for name, summary in rows:
+        latency = summary["latency_ms"]
+        line = (f"  {name:28s} {summary['requests']:9d} {summary['throughput_rps']:8.1f} "
+                f"{summary['error_rate']:7.1%} {latency['p50'] or 0:8.1f} {latency['p90'] or 0:8.1f} "
+                f"{latency['p95'] or 0:8.1f} {latency['p99'] or 0:8.1f}")
+        if deltas is not None and name in deltas and deltas[name]["p95_ms"] is not None:
+            line += f" {deltas[name]['p95_ms']:+9.1f}"
+        print(line)
+    for name, summary in report["journeys"].items():
+        print(f"  journey {name}: {summary['requests']} runs, "
+              f"{summary['error_rate']:.1%} failed, p95 {summary['latency_ms']['p95']} ms")
+    if report.get("registration_failures"):
+        print(f"  {report['registration_failures']} users skipped: registration failed")
+    for name, summary in report["endpoints"].items():
+        if summary["errors"]:
+            print(f"  {name} errors: {summary['errors']}")
+    print("="*100)
+
+
+def main():
+    """Run the load test"""
+    parser = argparse.ArgumentParser(description="Simulate concurrent shoppers against the backend API")
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", "http://localhost:3000"), help="Backend URL")
+    parser.add_argument("-u", "--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("-d", "--duration", type=float, default=60, help="Seconds of full load after ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds over which users are started")
+    parser.add_argument("--ramp-steps", type=int, default=0, help="Start users in N equal batches instead of one by one")
+    parser.add_argument("--journeys", type=parse_journeys, default={"buyer": 1.0},
+                        help="Weighted journeys, e.g. buyer:1,shopper:2,browse:5")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Maximum random pause between steps (s)")
+    parser.add_argument("--username", default=None, help="Share one existing account instead of registering users")
+    parser.add_argument("--password", default=None, help="Password for --username")
+    parser.add_argument("--compare", default=None, help="Earlier report to compare against")
+    options = parser.parse_args()
+
+    generator = LoadGenerator(
+        options.base_url,
+        users=options.users,
+        duration=options.duration,
+        ramp_up=options.ramp_up,
+        ramp_steps=options.ramp_steps,
+        journeys=options.journeys,
+        think_time=options.think_time,
+        credentials=(options.username, options.password) if options.username else None,
+    )
+    report = asyncio.run(generator.run())
+
+    deltas = None
+    if options.compare:
+        with open(options.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        deltas = LoadGenerator.compare(report, baseline)
+        report["compared_to"] = {"run_id": baseline.get("run_id"), "deltas": deltas}
+
+    path = LoadGenerator.save_report(report)
+    print_report(report, deltas)
+    print(f"  Report: {path}")
+    return 0 if report["total"]["error_rate"] == 0 and not report["registration_failures"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Parallel Test Runner - Shard the suite across worker processes
+
+Collects node IDs once (honouring tests/selected_tests.txt), packs them into
+shards slowest-first with LPT scheduling over the duration history recorded
+by previous runs (test_results/duration_history.json), runs each shard
+in its own pytest process with its own long-lived browser, and merges the
+per-shard JUnit reports into test_results/parallel_report.xml.
+
+Usage:
+    python run_parallel_tests.py -n 4
+    python run_parallel_tests.py -n 2 --browser firefox --headless -- -m smoke
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import uuid
+import xml.etree.ElementTree as ET
+
+from utils.DurationStore import DurationStore
+from utils.SuiteScheduler import SuiteScheduler
+
+
+RESULTS_DIR = "test_results"
+SHARD_DIR = os.path.join(RESULTS_DIR, "shards")
+MERGED_REPORT = os.path.join(RESULTS_DIR, "parallel_report.xml")
+
+# Options that select tests; they only apply to collection, workers get node IDs instead
+SELECTION_OPTIONS = ("-k", "-m", "--deselect", "--ignore", "--ignore-glob")
+SELECTION_FLAGS = ("--lf", "--last-failed")
+
+# Options written as "-x VALUE" whose value must stay with them, with the number of values
+VALUE_OPTIONS = {
+    "-c": 1, "--config-file": 1, "-o": 1, "--override-ini": 1, "-p": 1, "-W": 1, "--pythonwarnings": 1,
+    "-r": 1, "--rootdir": 1, "--basetemp": 1, "--confcutdir": 1, "--junitxml": 1, "--junit-xml": 1,
+    "--junit-prefix": 1, "--html": 1, "--css": 1, "--maxfail": 1, "--tb": 1, "--capture": 1,
+    "--durations": 1, "--durations-min": 1, "--color": 1, "--import-mode": 1, "--log-level": 1,
+    "--log-file": 1, "--log-file-level": 1, "--log-cli-level": 1, "--log-format": 1,
+    "--metadata": 2, "--metadata-from-json": 1, "--metadata-from-json-file": 1,
+    "--browser": 1, "--base-url": 1, "--api-url": 1, "--pool-size": 1, "--pool-max-uses": 1,
+    "--driver-scope": 1, "--wait-engine": 1,
+}
+
+def collect_node_ids(pytest_args):
+    """Collect test node IDs without running them"""
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", *pytest_args]
+    result = subprocess.run(command, capture_output=True, text=True)
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line and not line.startswith(" ")]
+    if result.returncode not in (0, 5) and not node_ids:
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+        raise SystemExit("Test collection failed")
+    return node_ids
+
+
+def worker_args(pytest_args):
+    """
+    Drop test paths and selectors from the extra pytest arguments
+
+    Each worker already receives its shard as node IDs, so passing
+    'tests/test_shopping.py' or '-m smoke' again would make every worker run
+    that selection on top of its shard. Values of the options in VALUE_OPTIONS
+    are kept even when they are existing paths; pass other value-taking
+    options as --option=value.
+
+    Returns:
+        list: The option-style arguments (--tb=long, -x, -p no:cacheprovider, ...)
+    """
+    args = []
+    index = 0
+    while index < len(pytest_args):
+        arg = pytest_args[index]
+        index += 1
+        if arg in SELECTION_OPTIONS:
+            index += 1
+            continue
+        if arg in VALUE_OPTIONS:
+            # Values such as '-c pytest.ini' or '--basetemp /tmp/x' are not test paths
+            count = VALUE_OPTIONS[arg]
+            args.extend(pytest_args[index - 1:index + count])
+            index += count
+            continue
+        if arg in SELECTION_FLAGS or arg.startswith(tuple(f"{option}=" for option in SELECTION_OPTIONS)):
+            continue
+        if arg.startswith(("-k", "-m")) and not arg.startswith("--"):
+            continue
+        if not arg.startswith("-") and ("::" in arg or arg.endswith(".py") or os.path.exists(arg)):
+            continue
+        args.append(arg)
+    return args
+
+
+def start_worker(index, node_ids, options, pytest_args, run_id):
+    """Start one pytest worker process for a shard"""
+    args_file = os.path.join(SHARD_DIR, f"shard_{index}.args")
+    with open(args_file, "w", encoding="utf-8") as file:
+        file.write("\n".join(node_ids))
+
+    command = [
+        sys.executable, "-m", "pytest", f"@{args_file}",
+        "-o", "addopts=",
+        "-o", f"log_file={os.path.join(SHARD_DIR, f'shard_{index}.log')}",
+        "--tb=short", "--strict-markers", "-q",
+        f"--junitxml={os.path.join(SHARD_DIR, f'shard_{index}.xml')}",
+        f"--browser={options.browser}",
+        "--driver-scope=session",
+        *(["--headless"] if options.headless else []),
+        *([f"--base-url={options.base_url}"] if options.base_url else []),
+        *pytest_args,
+    ]
+    output = open(os.path.join(SHARD_DIR, f"shard_{index}.out"), "w", encoding="utf-8")
+    # One run ID for every shard, so failure artifacts land in one folder
+    env = dict(os.environ, TEST_RUN_ID=run_id, TEST_WORKER_ID=f"shard_{index}")
+    process = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT, env=env)
+    return process, output
+
+
+def merge_reports(shard_count):
+    """Merge shard JUnit reports into one report"""
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+
+    for index in range(shard_count):
+        path = os.path.join(SHARD_DIR, f"shard_{index}.xml")
+        if not os.path.exists(path):
+            totals["errors"] += 1
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            suite.set("name", f"shard_{index}")
+            for key in totals:
+                totals[key] += type(totals[key])(suite.get(key, 0))
+            merged.append(suite)
+
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    ET.ElementTree(merged).write(MERGED_REPORT, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def main():
+    """Run the suite sharded across worker processes"""
+    parser = argparse.ArgumentParser(description="Run the test suite across parallel worker processes")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 2, help="Number of worker processes")
+    parser.add_argument("--browser", default="chrome", help="Browser for every worker: chrome or firefox")
+    parser.add_argument("--headless", action="store_true", help="Run browsers in headless mode")
+    parser.add_argument("--base-url", default=None, help="Base URL of the application")
+    parser.add_argument("pytest_args", nargs="*", help="Extra arguments passed to pytest (after --)")
+    options = parser.parse_args()
+
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    for name in os.listdir(SHARD_DIR):
+        os.remove(os.path.join(SHARD_DIR, name))
+
+    node_ids = collect_node_ids(options.pytest_args)
+    if not node_ids:
+        print("No tests collected.")
+        return 0
+
+    estimates = DurationStore().estimates(node_ids, percentile=75, browser=options.browser)
+    shards = SuiteScheduler.lpt_schedule(node_ids, options.workers, estimates)
+
+    print("\n" + "="*70)
+    print(f"  PARALLEL RUN: {len(node_ids)} tests across {len(shards)} workers")
+    print("="*70)
+    for index, shard in enumerate(shards):
+        print(f"  Worker {index}: {len(shard['node_ids'])} tests, ~{shard['expected']:.1f}s expected")
+
+    start = time.perf_counter()
+    extra_args = worker_args(options.pytest_args)
+    run_id = os.getenv("TEST_RUN_ID") or f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    workers = [start_worker(i, s["node_ids"], options, extra_args, run_id) for i, s in enumerate(shards)]
+    exit_codes = []
+    for process, output in workers:
+        exit_codes.append(process.wait())
+        output.close()
+    wall_time = time.perf_counter() - start
+
+    totals = merge_reports(len(shards))
+    test_time = totals["time"]
+    passed = totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]
+    print("\n" + "="*70)
+    print("  PARALLEL EXECUTION SUMMARY")
+    print("="*70)
+    for index, code in enumerate(exit_codes):
+        status = "✓" if code in (0, 5) else "✗"
+        print(f"{status} Worker {index}: exit code {code} (output: {os.path.join(SHARD_DIR, f'shard_{index}.out')})")
+    print(f"\n  {passed} passed, {totals['failures']} failed, {totals['errors']} errors, {totals['skipped']} skipped")
+    print(f"  Wall time: {wall_time:.1f}s, summed test time: {test_time:.1f}s")
+    print(f"  Merged report: {MERGED_REPORT}")
+    print(f"  Failure artifacts: {os.path.join(RESULTS_DIR, 'screenshots', run_id)}")
+    print("="*70)
+
+    return 0 if all(code in (0, 5) for code in exit_codes) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -29,7 +29,8 @@ def main():
             "description": "1. Smoke Test - Login Page Elements"
         },
         {
-            "command": "pytest tests/test_authentication.py::TestAuthentication::test_login_with_csv_data -v -k 'credentials0 or credentials1'",
+            "command": "pytest \"tests/test_authentication.py::TestAuthentication::test_login_with_csv_data[user1]\" "
+                       "\"tests/test_authentication.py::TestAuthentication::test_login_with_csv_data[testuser]\" -v",
             "description": "2. Data-Driven Test - CSV Login (2 samples)"
         },
         {
@@ -78,6 +79,8 @@ def main():
     
     print("\nTo run ALL tests, use:")
     print("  pytest -v")
+    print("\nTo run ALL tests in parallel worker processes:")
+    print("  python run_parallel_tests.py -n 4")
     print("\nTo run with HTML report:")
     print("  pytest --html=test_results/report.html --self-contained-html")
     print("\nTo run specific test categories:")
@@ -0,0 +1,72 @@
+"""Benchmark order verification queries: sync Database vs AsyncDatabase
+
+Run from project root (database from db_setup.sql, DB_* environment variables,
+aiomysql installed):
+    python scripts/benchmark_async_db.py
+    python scripts/benchmark_async_db.py --queries 500 --pool-size 20
+
+Each query is the kind of check a checkout test makes after placing an order.
+The sync run issues them one after another over a pooled connection; the async
+run issues them all at once from one event loop over a connection pool.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.Database import Database  # noqa: E402
+from utils.AsyncDatabase import AsyncDatabase, get_async_pool, close_async_pools  # noqa: E402
+
+
+QUERY = (
+    "SELECT o.order_id, o.status, COUNT(d.detail_id) AS items "
+    "FROM orders o LEFT JOIN order_details d ON d.order_id = o.order_id "
+    "WHERE o.user_id = %s GROUP BY o.order_id, o.status"
+)
+
+
+def run_sync(user_ids):
+    start = time.perf_counter()
+    with Database(pooled=True) as db:
+        for user_id in user_ids:
+            db.execute(QUERY, (user_id,))
+            db.fetchall()
+    return time.perf_counter() - start
+
+
+async def run_async(user_ids, pool_size):
+    await get_async_pool(size=pool_size)
+
+    async def verify(user_id):
+        async with AsyncDatabase() as db:
+            return await db.fetch(QUERY, (user_id,))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(verify(user_id) for user_id in user_ids))
+    elapsed = time.perf_counter() - start
+    await close_async_pools()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sync and async verification query throughput")
+    parser.add_argument("--queries", type=int, default=300, help="Number of verification queries")
+    parser.add_argument("--pool-size", type=int, default=10, help="Async connection pool size")
+    args = parser.parse_args()
+
+    user_ids = [1 + i % 50 for i in range(args.queries)]
+    sync_seconds = run_sync(user_ids)
+    async_seconds = asyncio.run(run_async(user_ids, args.pool_size))
+
+    print(f"{args.queries} verification queries")
+    print(f"  sync  Database       {sync_seconds:7.2f}s  {args.queries / sync_seconds:8.0f} queries/s")
+    print(f"  async AsyncDatabase  {async_seconds:7.2f}s  {args.queries / async_seconds:8.0f} queries/s "
+          f"(pool of {args.pool_size})")
+    print(f"Speedup: {sync_seconds / async_seconds:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark ExcelUtility.write_excel: streaming (write-only) vs in-memory workbook
+
+Run from project root:
+    python scripts/benchmark_write_excel.py
+    python scripts/benchmark_write_excel.py --rows 200000 --columns 8
+
+Reports rows/second and peak Python memory (tracemalloc) for each mode.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.ExcelUtility import ExcelUtility  # noqa: E402
+
+
+def generate_rows(count, columns):
+    for i in range(count):
+        row = {"id": i, "username": f"user{i}", "password": f"pass{i % 997}", "expected_result": "success" if i % 3 else "fail"}
+        for c in range(columns - len(row)):
+            row[f"col{c}"] = i * c
+        yield row
+
+
+def run(mode, rows, columns, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    written = ExcelUtility.write_excel(path, generate_rows(rows, columns), streaming=(mode == "streaming"))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = os.path.getsize(path)
+    return written, elapsed, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs in-memory Excel writing")
+    parser.add_argument("--rows", type=int, default=100000, help="Data rows to write")
+    parser.add_argument("--columns", type=int, default=6, help="Columns per row (minimum 4)")
+    args = parser.parse_args()
+
+    print(f"Writing {args.rows} rows x {max(args.columns, 4)} columns")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for mode in ("in-memory", "streaming"):
+            path = os.path.join(tmp, f"{mode}.xlsx")
+            written, elapsed, peak, size = run(mode, args.rows, args.columns, path)
+            results[mode] = elapsed
+            print(f"  {mode:10s} {elapsed:8.2f}s  {written / elapsed:10.0f} rows/s  "
+                  f"peak {peak / 1024 / 1024:8.1f} MiB  file {size / 1024:8.0f} KiB")
+    print(f"Speedup: {results['in-memory'] / results['streaming']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,20 +7,24 @@ powershell
 python scripts/convert_csv_to_xlsx.py
 
 This will create .xlsx versions of CSVs placed next to the originals.
+Rows are streamed through a write-only workbook, so large CSVs convert in
+constant memory; CSVs longer than Excel's row limit continue on extra sheets.
 """
 import csv
+import sys
 from pathlib import Path
-from openpyxl import Workbook
+from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def convert(csv_path: Path, xlsx_path: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
+from utils.ExcelUtility import ExcelUtility  # noqa: E402
+
+
+def convert(csv_path: Path, xlsx_path: Path, max_rows_per_sheet: Optional[int] = None) -> int:
     with csv_path.open(newline="", encoding="utf-8") as fh:
         reader = csv.reader(fh)
-        for row in reader:
-            ws.append(row)
-    wb.save(xlsx_path)
+        header = next(reader, None) or []
+        return ExcelUtility.write_rows(str(xlsx_path), header, reader, max_rows_per_sheet=max_rows_per_sheet)
 
 
 def main() -> None:
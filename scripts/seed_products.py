@@ -0,0 +1,53 @@
+"""Seed the products table with generated rows for catalog scale tests
+
+Run from project root (database from db_setup.sql, DB_* environment variables):
+    python scripts/seed_products.py --count 100000
+
+Rows are written with Database.bulk_insert (multi-row INSERTs, one transaction).
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.Database import Database  # noqa: E402
+
+
+CATEGORIES = ['Neckwear', 'Rings', 'Earrings', 'Bracelets', 'Watches']
+MATERIALS = ['Silver', 'Gold', 'Rose Gold', 'Platinum', 'Pearl', 'Diamond']
+
+
+def generate_products(count, seed):
+    rng = random.Random(seed)
+    for i in range(count):
+        category = rng.choice(CATEGORIES)
+        material = rng.choice(MATERIALS)
+        yield (
+            f"{material} {category[:-1] if category.endswith('s') else category} #{i + 1}",
+            category,
+            round(rng.uniform(10, 2000), 2),
+            rng.randint(0, 500),
+            f"Generated {material.lower()} piece for catalog scale tests",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk insert generated products")
+    parser.add_argument("--count", type=int, default=100000, help="Number of products to insert")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible data")
+    args = parser.parse_args()
+
+    with Database() as db:
+        stats = db.bulk_insert(
+            "products",
+            generate_products(args.count, args.seed),
+            columns=["name", "category", "price", "stock", "description"],
+        )
+    print(f"Inserted {stats['rows']} products in {stats['statements']} statements, "
+          f"{stats['seconds']:.2f}s ({stats['rows_per_second']} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
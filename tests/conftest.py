@@ -18,7 +18,8 @@ def pytest_collection_modifyitems(config, items):
     kept_items = []
     deselected = []
     for item in list(items):
-        if item.nodeid in keep:
+        # Unit tests need no browser and are not part of the curated UI selection
+        if item.nodeid in keep or item.get_closest_marker("unit") is not None:
             kept_items.append(item)
         else:
             deselected.append(item)
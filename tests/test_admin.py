@@ -7,6 +7,7 @@ from pages.LoginPage import LoginPage
 from pages.AdminPage import AdminPage
 
 
+@pytest.mark.usefixtures("isolated_db")
 class TestAdminDashboard:
     @pytest.mark.smoke
     @pytest.mark.admin
@@ -6,6 +6,7 @@ Demonstrates: Data-driven testing using CSV/Excel files
 import pytest
 from pages.LoginPage import LoginPage
 from utils.ExcelUtility import ExcelUtility
+from utils.TestDataset import TestDataset
 import os
 
 
@@ -14,7 +15,9 @@ class TestAuthentication:
     
     @pytest.mark.data_driven
     @pytest.mark.parametrize("credentials", 
-                            ExcelUtility.read_csv("test_data/login_credentials.csv"))
+                            TestDataset.from_csv("test_data/login_credentials.csv",
+                                                 types={"expected_result": bool},
+                                                 id_column="username").params())
     def test_login_with_csv_data(self, driver, base_url, credentials):
         """
         Data-Driven Test: Login with multiple credentials from CSV file
@@ -39,7 +42,7 @@ class TestAuthentication:
         time.sleep(2)
         
         # Verify result based on expected outcome
-        if expected_result == 'success':
+        if expected_result:
             # For valid credentials, check if redirected or success message
             current_url = login_page.get_current_url()
             print(f"\n✓ Login attempt with username='{username}' - Current URL: {current_url}")
@@ -51,7 +54,7 @@ class TestAuthentication:
     
     @pytest.mark.data_driven
     @pytest.mark.parametrize("credentials", 
-                            ExcelUtility.read_excel("test_data/login_credentials.xlsx"))
+                            ExcelUtility.read_excel("test_data/login_credentials.xlsx", cache=True))
     def test_login_with_excel_data(self, driver, base_url, credentials):
         """
         Data-Driven Test: Login with multiple credentials from Excel file
@@ -90,7 +90,6 @@ class TestCrossBrowser:
             
             # Test search
             catalog_page.search_product("ring")
-            time.sleep(1.5)
             
             products = catalog_page.get_product_titles()
             print(f"✓ Search returned {len(products)} products on {browser}")
@@ -6,7 +6,6 @@ Demonstrates: Dynamic wait handling, filtering, product interaction
 import pytest
 from pages.CatalogPage import CatalogPage
 from pages.CartPage import CartPage
-import time
 
 
 class TestShopping:
@@ -35,9 +34,6 @@ class TestShopping:
         # Search for products
         catalog_page.search_product("ring")
         
-        # Wait for filtered results (dynamic content)
-        time.sleep(1.5)  # Allow search filter to apply
-        
         # Get filtered product count
         filtered_count = catalog_page.get_product_count()
         print(f"✓ Filtered products displayed: {filtered_count}")
@@ -97,8 +93,7 @@ class TestShopping:
         # Add product to cart
         catalog_page.add_first_product_to_cart()
         
-        # Wait and verify cart count increased
-        time.sleep(1)
+        # Verify cart count increased
         new_cart_count = catalog_page.get_cart_count()
         print(f"✓ New cart count: {new_cart_count}")
         
@@ -124,9 +119,6 @@ class TestShopping:
         # Apply price filter
         catalog_page.select_price_range("0-500")
         
-        # Wait for filtered results
-        time.sleep(1.5)
-        
         # Get filtered products
         filtered_count = catalog_page.get_product_count()
         print(f"\n✓ Products in price range $0-$500: {filtered_count}")
@@ -156,9 +148,6 @@ class TestShopping:
         # Sort by price low to high
         catalog_page.select_sort_option("price-low")
         
-        # Wait for re-sort
-        time.sleep(1)
-        
         # Get sorted products
         sorted_titles = catalog_page.get_product_titles()
         print(f"✓ After sorting: {sorted_titles[:3]}")
@@ -179,7 +168,6 @@ class TestShopping:
         
         catalog_page.wait_utility.wait_for_element_visible(catalog_page.PRODUCT_CARDS)
         catalog_page.add_first_product_to_cart()
-        time.sleep(1)
         
         # Navigate to cart
         cart_page = CartPage(driver, base_url)
@@ -0,0 +1 @@
+"""Unit tests for browser-free framework utilities"""
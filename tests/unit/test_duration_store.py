@@ -0,0 +1,97 @@
+"""
+Unit Tests - DurationStore
+Covers the rolling window, percentile estimates and merging/locking of saves
+"""
+
+import json
+import threading
+
+import pytest
+from utils.DurationStore import DurationStore
+
+
+@pytest.fixture
+def history_path(tmp_path):
+    return str(tmp_path / "duration_history.json")
+
+
+@pytest.mark.unit
+class TestDurationStore:
+    """Duration history"""
+
+    def test_missing_or_corrupt_file_starts_empty(self, history_path):
+        assert DurationStore(history_path).tests == {}
+        with open(history_path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        assert DurationStore(history_path).tests == {}
+
+    def test_window_keeps_most_recent_samples(self, history_path):
+        store = DurationStore(history_path, window=3)
+        for duration in [1, 2, 3, 4, 5]:
+            store.record("t::a", duration)
+        assert store.tests["t::a"]["chrome"] == [3, 4, 5]
+
+    def test_percentile(self, history_path):
+        store = DurationStore(history_path)
+        for duration in [1.0, 2.0, 3.0, 4.0]:
+            store.record("t::a", duration)
+        assert store.percentile("t::a", 50) == pytest.approx(2.5)
+        assert store.percentile("t::a", 100) == 4.0
+        assert store.percentile("t::missing") is None
+
+    def test_estimates_fall_back_to_other_browsers_then_median(self, history_path):
+        store = DurationStore(history_path)
+        store.record("t::a", 2.0, "chrome")
+        store.record("t::b", 4.0, "chrome")
+        store.record("t::c", 9.0, "firefox")
+        estimates = store.estimates(["t::a", "t::b", "t::c", "t::new"], browser="chrome")
+        assert estimates["t::c"] == 9.0
+        assert estimates["t::new"] == 4.0
+
+    def test_estimates_without_history_default_to_one_second(self, history_path):
+        assert DurationStore(history_path).estimates(["t::a", "t::b"]) == {"t::a": 1.0, "t::b": 1.0}
+
+    def test_save_round_trip(self, history_path):
+        store = DurationStore(history_path)
+        store.record("t::a", 1.23456, "firefox")
+        store.save()
+        assert DurationStore(history_path).tests == {"t::a": {"firefox": [1.235]}}
+
+    def test_save_merges_with_samples_written_since_loading(self, history_path):
+        first = DurationStore(history_path)
+        second = DurationStore(history_path)
+        first.record("t::a", 1.0)
+        second.record("t::a", 2.0)
+        second.record("t::b", 3.0)
+        first.save()
+        second.save()
+        assert DurationStore(history_path).tests == {"t::a": {"chrome": [1.0, 2.0]}, "t::b": {"chrome": [3.0]}}
+
+    def test_saving_twice_does_not_duplicate_samples(self, history_path):
+        store = DurationStore(history_path)
+        store.record("t::a", 1.0)
+        store.save()
+        store.save()
+        assert DurationStore(history_path).tests["t::a"]["chrome"] == [1.0]
+
+    def test_concurrent_saves_lose_no_samples(self, history_path):
+        workers = 8
+        barrier = threading.Barrier(workers)
+
+        def worker(index):
+            store = DurationStore(history_path, window=100)
+            store.record(f"t::w{index}", float(index))
+            store.record("t::shared", float(index))
+            barrier.wait()
+            store.save()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(history_path, "r", encoding="utf-8") as file:
+            tests = json.load(file)["tests"]
+        assert sorted(tests["t::shared"]["chrome"]) == [float(i) for i in range(workers)]
+        assert all(tests[f"t::w{i}"]["chrome"] == [float(i)] for i in range(workers))
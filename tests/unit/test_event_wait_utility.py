@@ -0,0 +1,71 @@
+"""
+Unit Tests - EventWaitUtility
+Covers script timeout handling and when waits fall back to polling
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from utils.EventWaitUtility import EventWaitUtility
+
+LOCATOR = (By.ID, "item")
+
+
+class FakeDriver:
+    """Records script timeouts and answers execute_async_script with a result or an error"""
+
+    w3c = True
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def wait_for(driver, timeout=15):
+    waits = EventWaitUtility(driver, timeout)
+    return waits._wait(LOCATOR, "presence", None, lambda: "polled", "Element not present")
+
+
+@pytest.mark.unit
+class TestEventWaitUtility:
+    """MutationObserver waits"""
+
+    def test_short_wait_keeps_the_session_script_timeout(self):
+        driver = FakeDriver("element")
+        assert wait_for(driver) == "element"
+        assert driver.script_timeouts == []
+
+    def test_long_wait_restores_the_previous_script_timeout(self):
+        driver = FakeDriver("element")
+        assert wait_for(driver, timeout=60) == "element"
+        assert driver.script_timeouts == [65, 30]
+
+    def test_script_timeout_is_restored_when_the_script_fails(self):
+        driver = FakeDriver(JavascriptException("javascript error: boom"))
+        with pytest.raises(JavascriptException):
+            wait_for(driver, timeout=60)
+        assert driver.script_timeouts == [65, 30]
+
+    def test_condition_timeout_raises_without_polling(self):
+        with pytest.raises(TimeoutException, match="Element not present"):
+            wait_for(FakeDriver(None))
+
+    @pytest.mark.parametrize("error", [
+        TimeoutException("script timeout"),
+        JavascriptException("javascript error: document unloaded while waiting for result"),
+        WebDriverException("unknown command: execute/async"),
+    ])
+    def test_lost_or_unsupported_watcher_falls_back_to_polling(self, error):
+        assert wait_for(FakeDriver(error)) == "polled"
+
+    def test_other_driver_errors_propagate(self):
+        with pytest.raises(WebDriverException, match="invalid session id"):
+            wait_for(FakeDriver(WebDriverException("invalid session id")))
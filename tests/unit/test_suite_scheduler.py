@@ -0,0 +1,63 @@
+"""
+Unit Tests - SuiteScheduler and the parallel runner's worker arguments
+Covers slowest-first ordering, LPT shard balancing and shard argument filtering
+"""
+
+import pytest
+from utils.SuiteScheduler import SuiteScheduler
+from run_parallel_tests import worker_args
+
+
+@pytest.mark.unit
+class TestSuiteScheduler:
+    """Scheduling by expected duration"""
+
+    def test_order_slowest_first_keeps_collection_order_for_ties(self):
+        estimates = {"a": 1.0, "b": 5.0, "c": 1.0, "d": 3.0}
+        assert SuiteScheduler.order_slowest_first(["a", "b", "c", "d"], estimates) == ["b", "d", "a", "c"]
+
+    def test_lpt_balances_known_durations(self):
+        estimates = {"a": 7.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0}
+        shards = SuiteScheduler.lpt_schedule(list(estimates), 2, estimates)
+        assert sorted(s["expected"] for s in shards) == [10.0, 10.0]
+        assert sorted(n for s in shards for n in s["node_ids"]) == sorted(estimates)
+
+    def test_lpt_without_history_splits_evenly(self):
+        node_ids = [f"t::{i}" for i in range(10)]
+        shards = SuiteScheduler.lpt_schedule(node_ids, 3, {})
+        assert sorted(len(s["node_ids"]) for s in shards) == [3, 3, 4]
+        assert sorted(n for s in shards for n in s["node_ids"]) == sorted(node_ids)
+
+    def test_lpt_drops_empty_workers(self):
+        shards = SuiteScheduler.lpt_schedule(["a", "b"], 4, {"a": 1.0, "b": 2.0})
+        assert [s["node_ids"] for s in shards] == [["b"], ["a"]]
+
+    def test_lpt_with_no_tests_or_workers(self):
+        assert SuiteScheduler.lpt_schedule([], 4, {}) == []
+        assert SuiteScheduler.lpt_schedule(["a"], 0, {})[0]["node_ids"] == ["a"]
+
+
+@pytest.mark.unit
+class TestWorkerArgs:
+    """Arguments forwarded to shard workers"""
+
+    def test_paths_and_selectors_are_dropped(self):
+        args = ["tests/test_shopping.py", "tests/test_admin.py::TestAdminDashboard", "-m", "smoke",
+                "-ksearch", "--deselect=tests/test_admin.py", "--lf"]
+        assert worker_args(args) == []
+
+    def test_options_are_kept(self):
+        args = ["--tb=long", "-x", "-p", "no:cacheprovider", "--maxfail=2"]
+        assert worker_args(args) == args
+
+    def test_option_values_that_are_paths_are_kept(self):
+        args = ["-c", "pytest.ini", "--rootdir", ".", "--basetemp", "tests", "--junitxml", "conftest.py"]
+        assert worker_args(args) == args
+
+    def test_option_values_stay_paired_around_dropped_paths(self):
+        args = ["tests/test_shopping.py", "-p", "no:cacheprovider", "tests", "-o", "log_cli=false",
+                "--metadata", "build", "42", "-m", "smoke"]
+        assert worker_args(args) == ["-p", "no:cacheprovider", "-o", "log_cli=false", "--metadata", "build", "42"]
+
+    def test_equals_form_is_kept(self):
+        assert worker_args(["--rootdir=.", "-cpytest.ini", "tests"]) == ["--rootdir=.", "-cpytest.ini"]
@@ -0,0 +1,148 @@
+"""
+Unit Tests - TestDataset
+Covers typed parsing, stable IDs, where() filtering and params()
+"""
+
+import pytest
+from utils.TestDataset import TestDataset, parse_bool
+
+
+def make_dataset(**kwargs):
+    headers = ["username", "password", "expected_result"]
+    rows = [
+        ("user1", "Pass@123", "success"),
+        ("testuser", "Test@456", "success"),
+        ("invalid_user", "wrong", "fail"),
+        ("", "Pass@123", "fail"),
+        ("testuser", "other", "fail"),
+    ]
+    return TestDataset.from_table(headers, rows, types={"expected_result": bool}, **kwargs)
+
+
+@pytest.mark.unit
+class TestParseBool:
+    """Cell values to booleans"""
+
+    @pytest.mark.parametrize("value", ["success", "TRUE", "1", " yes ", True])
+    def test_true_values(self, value):
+        assert parse_bool(value) is True
+
+    @pytest.mark.parametrize("value", ["fail", "False", "0", "invalid", False])
+    def test_false_values(self, value):
+        assert parse_bool(value) is False
+
+    @pytest.mark.parametrize("value", [None, ""])
+    def test_empty_cells_are_none(self, value):
+        assert parse_bool(value) is None
+
+    def test_unknown_value_raises(self):
+        with pytest.raises(ValueError):
+            parse_bool("maybe")
+
+
+@pytest.mark.unit
+class TestDatasetIds:
+    """Stable test IDs"""
+
+    def test_ids_from_column_with_empty_and_duplicate_values(self):
+        dataset = make_dataset(id_column="username")
+        assert dataset.ids() == ["user1", "testuser", "invalid_user", "empty", "testuser-2"]
+
+    def test_ids_stay_unique_when_a_value_looks_like_a_suffix(self):
+        dataset = TestDataset({"name": ["a", "a-2", "a"]}, id_column="name")
+        ids = dataset.ids()
+        assert len(set(ids)) == 3
+        assert ids[:2] == ["a", "a-2"]
+
+    def test_special_characters_are_kept_or_replaced(self):
+        dataset = TestDataset({"name": ["special@user", "with space", "!!!"]}, id_column="name")
+        assert dataset.ids() == ["special@user", "with_space", "empty"]
+
+    def test_hash_ids_do_not_depend_on_row_order(self):
+        forward = make_dataset()
+        backward = TestDataset.from_table(
+            forward.columns, [tuple(row.values()) for row in reversed(list(forward))]
+        )
+        assert sorted(forward.ids()) == sorted(backward.ids())
+
+    def test_identical_rows_get_distinct_hash_ids(self):
+        dataset = TestDataset({"a": [1, 1]})
+        first, second = dataset.ids()
+        assert second == f"{first}-2"
+
+    def test_subsets_keep_the_ids_of_the_full_dataset(self):
+        dataset = make_dataset(id_column="username")
+        failing = dataset.where(expected_result=False)
+        assert failing.ids() == ["invalid_user", "empty", "testuser-2"]
+        assert failing.select("password").ids() == failing.ids()
+        assert dataset.take([4, 0]).ids() == ["testuser-2", "user1"]
+
+
+@pytest.mark.unit
+class TestDatasetSelection:
+    """where() / select() / take()"""
+
+    def test_where_by_value(self):
+        dataset = make_dataset()
+        assert dataset.where(expected_result=True).column("username") == ["user1", "testuser"]
+
+    def test_where_by_predicate_and_value_combined(self):
+        dataset = make_dataset()
+        result = dataset.where(expected_result=False, password=lambda p: p.startswith("Pass"))
+        assert result.column("username") == [""]
+
+    def test_where_without_matches_is_empty(self):
+        dataset = make_dataset(id_column="username")
+        empty = dataset.where(username="nobody")
+        assert len(empty) == 0
+        assert empty.ids() == []
+        assert empty.params() == []
+
+    def test_where_without_conditions_returns_everything(self):
+        dataset = make_dataset()
+        assert len(dataset.where()) == len(dataset)
+
+    def test_where_unknown_column_raises(self):
+        with pytest.raises(KeyError):
+            make_dataset().where(email="x")
+
+    def test_select_keeps_column_order(self):
+        dataset = make_dataset().select("password", "username")
+        assert dataset.columns == ["password", "username"]
+        assert dataset[0] == {"password": "Pass@123", "username": "user1"}
+
+    def test_typed_columns_round_trip(self):
+        dataset = TestDataset({"age": ["30", "", "25"], "score": ["1.5", "2", "3"]},
+                              types={"age": int, "score": float})
+        assert dataset.column("age") == [30, None, 25]
+        assert dataset.column("score") == [1.5, 2.0, 3.0]
+        assert dataset.where(age=lambda a: a is not None and a > 26).column("score") == [1.5]
+
+    def test_empty_table(self):
+        dataset = TestDataset.from_table(["username", "password"], [])
+        assert len(dataset) == 0
+        assert dataset.columns == ["username", "password"]
+        assert dataset.params() == []
+
+    def test_invalid_construction(self):
+        with pytest.raises(ValueError):
+            TestDataset({"a": [1, 2], "b": [1]})
+        with pytest.raises(ValueError):
+            TestDataset({"a": [1]}, types={"b": int})
+        with pytest.raises(ValueError):
+            TestDataset({"a": [1]}, id_column="b")
+
+
+@pytest.mark.unit
+class TestDatasetParams:
+    """pytest.param conversion"""
+
+    def test_params_with_whole_rows(self):
+        params = make_dataset(id_column="username").where(expected_result=True).params()
+        assert [p.id for p in params] == ["user1", "testuser"]
+        assert params[0].values == ({"username": "user1", "password": "Pass@123", "expected_result": True},)
+
+    def test_params_with_named_columns(self):
+        params = make_dataset(id_column="username").params("username", "expected_result")
+        assert params[2].values == ("invalid_user", False)
+        assert params[2].id == "invalid_user"
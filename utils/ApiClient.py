@@ -0,0 +1,274 @@
+"""
+ApiClient - HTTP client for the Express backend (backend/server.js)
+Lets tests log in and set up cart/order state over HTTP in milliseconds,
+keeping the browser for the UI assertion under test
+"""
+
+import os
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ApiError(Exception):
+    """Raised when the backend answers with a non-2xx status"""
+
+    def __init__(self, method, path, status, payload):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.payload = payload
+        message = payload.get("error") if isinstance(payload, dict) else payload
+        super().__init__(f"{method} {path} failed with {status}: {message}")
+
+
+def _to_float(value):
+    return float(value) if value is not None else None
+
+
+@dataclass(frozen=True)
+class Product:
+    """Row of /api/products"""
+    product_id: int
+    name: str
+    category: str
+    price: float
+    stock: int
+    description: str = ""
+
+    @classmethod
+    def from_json(cls, data):
+        # mysql2 serializes DECIMAL columns as strings
+        return cls(data["product_id"], data["name"], data.get("category"),
+                   _to_float(data["price"]), int(data["stock"]), data.get("description") or "")
+
+
+@dataclass(frozen=True)
+class CartItem:
+    """Row of /api/cart (cart joined with product name and price)"""
+    cart_id: int
+    product_id: int
+    quantity: int
+    name: str
+    price: float
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["cart_id"], data["product_id"], int(data["quantity"]),
+                   data.get("name"), _to_float(data.get("price")))
+
+
+@dataclass(frozen=True)
+class Order:
+    """Row of /api/orders"""
+    order_id: int
+    total: float
+    status: str
+    created_at: str
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["order_id"], _to_float(data.get("total")), data.get("status"), data.get("created_at"))
+
+
+class ApiClient:
+    """Keep-alive HTTP client with JWT handling for the /api/* endpoints"""
+
+    DEFAULT_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:3000")
+
+    def __init__(self, base_url=None, timeout=10, session=None, pool_size=10):
+        """
+        Initialize ApiClient
+
+        Args:
+            base_url (str): Backend URL (default: API_BASE_URL or http://localhost:3000)
+            timeout (float): Request timeout in seconds
+            session (requests.Session): Shared session to reuse its connection pool
+                (default: a new one from create_session)
+            pool_size (int): Keep-alive connections kept by a new session
+        """
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.session = session or self.create_session(pool_size)
+        self._owns_session = session is None
+        self.token = None
+        self.user = None
+
+    @staticmethod
+    def create_session(pool_size=10):
+        """
+        Create a requests.Session with a keep-alive connection pool
+
+        Args:
+            pool_size (int): Connections kept open per host
+
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the session if this client created it"""
+        if self._owns_session:
+            self.session.close()
+
+    def request(self, method, path, json=None, auth=True):
+        """
+        Send a request and decode the JSON answer
+
+        Args:
+            method (str): HTTP method
+            path (str): Path below the base URL, e.g. '/api/cart'
+            json (dict): JSON body
+            auth (bool): Send the JWT of the logged-in user
+
+        Returns:
+            Any: Decoded JSON body
+
+        Raises:
+            ApiError: If the status is not 2xx
+        """
+        headers = {}
+        if auth and self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        response = self.session.request(method, f"{self.base_url}{path}", json=json,
+                                        headers=headers, timeout=self.timeout)
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = response.text
+        if not response.ok:
+            raise ApiError(method, path, response.status_code, payload)
+        return payload
+
+    # -- authentication -----------------------------------------------
+
+    def register(self, username, password, first_name="Test", last_name="User", email=None, age=30):
+        """
+        Register a user
+
+        Returns:
+            int: New user ID
+        """
+        payload = self.request("POST", "/api/register", {
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": email or f"{username}@example.com",
+            "age": age,
+            "username": username,
+            "password": password,
+        }, auth=False)
+        return payload["userId"]
+
+    def login(self, username, password):
+        """
+        Log in and keep the JWT for subsequent requests
+
+        Returns:
+            dict: The user (userId, username, role)
+        """
+        payload = self.request("POST", "/api/login", {"username": username, "password": password}, auth=False)
+        self.token = payload["token"]
+        self.user = payload["user"]
+        return self.user
+
+    def logout(self):
+        """Forget the JWT"""
+        self.token = None
+        self.user = None
+
+    def apply_to_browser(self, driver):
+        """
+        Log the browser in with this client's JWT
+
+        website/cart.js reads the token from localStorage, so the driver must
+        already be on a page of the site.
+
+        Args:
+            driver: WebDriver instance
+        """
+        if not self.token:
+            raise RuntimeError("Not logged in")
+        driver.execute_script("localStorage.setItem('token', arguments[0]);", self.token)
+
+    # -- products -----------------------------------------------------
+
+    def get_products(self):
+        """
+        Get the product catalog
+
+        Returns:
+            list: Product objects
+        """
+        return [Product.from_json(row) for row in self.request("GET", "/api/products", auth=False)]
+
+    def add_product(self, name, price, stock, category=None, description=""):
+        """
+        Add a product (admin only)
+
+        Returns:
+            int: New product ID
+        """
+        payload = self.request("POST", "/api/products", {
+            "name": name, "category": category, "price": price, "stock": stock, "description": description,
+        })
+        return payload["productId"]
+
+    # -- cart ---------------------------------------------------------
+
+    def get_cart(self):
+        """
+        Get the logged-in user's cart
+
+        Returns:
+            list: CartItem objects of the logged-in user
+        """
+        return [CartItem.from_json(row) for row in self.request("GET", "/api/cart")]
+
+    def add_to_cart(self, product_id, quantity=1):
+        """Add a product to the logged-in user's cart"""
+        self.request("POST", "/api/cart", {"productId": product_id, "quantity": quantity})
+
+    def update_cart_item(self, cart_id, quantity):
+        """Change the quantity of a cart row"""
+        self.request("PUT", f"/api/cart/{cart_id}", {"quantity": quantity})
+
+    def remove_cart_item(self, cart_id):
+        """Delete a cart row"""
+        self.request("DELETE", f"/api/cart/{cart_id}")
+
+    def clear_cart(self):
+        """Delete every row of the logged-in user's cart"""
+        for item in self.get_cart():
+            self.remove_cart_item(item.cart_id)
+
+    # -- orders -------------------------------------------------------
+
+    def checkout(self):
+        """
+        Turn the cart into an order
+
+        Returns:
+            int: New order ID
+        """
+        return self.request("POST", "/api/checkout")["orderId"]
+
+    def get_orders(self):
+        """
+        Get the logged-in user's orders
+
+        Returns:
+            list: Order objects of the logged-in user
+        """
+        return [Order.from_json(row) for row in self.request("GET", "/api/orders")]
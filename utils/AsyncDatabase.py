@@ -0,0 +1,198 @@
+"""
+AsyncDatabase - asyncio counterpart of :mod:`utils.Database`
+
+Same surface as :class:`utils.Database.Database` (``execute``,
+``fetchall``, ``fetchone``, ``commit``, ``rollback``, ``close``) with
+awaitable methods, built on ``aiomysql``. Pooled instances lease from a
+pool shared per event loop, so hundreds of verification queries can run
+concurrently from one loop over a handful of connections.
+
+``aiomysql`` is an optional dependency: ``pip install aiomysql``.
+"""
+
+import asyncio
+import os
+import weakref
+
+from utils.Database import _connection_settings
+
+try:
+    import aiomysql
+except ImportError:  # optional dependency
+    aiomysql = None
+
+
+def _require_aiomysql():
+    if aiomysql is None:
+        raise RuntimeError("AsyncDatabase requires aiomysql: pip install aiomysql")
+
+
+def _aiomysql_settings(settings: dict) -> dict:
+    # aiomysql names the schema argument ``db``
+    return {
+        "host": settings["host"],
+        "port": settings["port"],
+        "user": settings["user"],
+        "password": settings["password"],
+        "db": settings["database"],
+        "autocommit": False,
+    }
+
+
+# Event loop -> {connection settings: pool}. Keyed by the loop object rather
+# than id(loop), so a later loop that reuses the id of a finished one is never
+# handed a pool bound to it. aiomysql pools reference their loop, which keeps
+# the weak key alive, so entries of closed loops are also dropped on lookup.
+_pools: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+async def get_async_pool(size: int | None = None, max_lifetime: float | None = None, **kwargs):
+    """Return the pool for the running event loop and connection arguments.
+
+    ``size`` and ``max_lifetime`` default to ``DB_POOL_SIZE`` (10) and
+    ``DB_POOL_MAX_LIFETIME`` (1800 seconds) and only apply when the pool
+    is first created. Idle connections older than ``max_lifetime`` are
+    reconnected on checkout.
+    """
+    _require_aiomysql()
+    settings = _connection_settings(**kwargs)
+    loop = asyncio.get_running_loop()
+    for closed in [other for other in _pools if other.is_closed()]:
+        del _pools[closed]
+    key = tuple(sorted(settings.items()))
+    loop_pools = _pools.setdefault(loop, {})
+    pool = loop_pools.get(key)
+    if pool is None or pool._closed:
+        pool = await aiomysql.create_pool(
+            minsize=0,
+            maxsize=size or int(os.getenv("DB_POOL_SIZE", "0") or 0) or 10,
+            pool_recycle=int(max_lifetime or float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))),
+            **_aiomysql_settings(settings),
+        )
+        loop_pools[key] = pool
+    return pool
+
+
+async def close_async_pools():
+    """Close the pools created on the running event loop."""
+    for pool in _pools.pop(asyncio.get_running_loop(), {}).values():
+        pool.close()
+        await pool.wait_closed()
+
+
+class AsyncDatabase:
+    """Async helper that manages one MySQL connection.
+
+    Create it with ``await AsyncDatabase.connect(...)`` or
+    ``async with AsyncDatabase(...) as db:``. Rows are dicts, as with
+    :class:`utils.Database.Database`.
+
+    With ``pooled=True`` (the default) the connection is leased from the
+    event loop's shared pool and ``close()`` hands it back.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        user: str | None = None,
+        password: str | None = None,
+        database: str | None = None,
+        pooled: bool = True,
+    ):
+        self.settings = _connection_settings(host, port, user, password, database)
+        self.pooled = pooled
+        self.pool = None
+        self.conn = None
+        self.cursor = None
+
+    @classmethod
+    async def connect(cls, **kwargs) -> "AsyncDatabase":
+        """Create an instance and open (or lease) its connection."""
+        db = cls(**kwargs)
+        await db.open()
+        return db
+
+    async def open(self):
+        """Open the connection, or lease one from the pool."""
+        _require_aiomysql()
+        if self.conn is not None:
+            return
+        try:
+            if self.pooled:
+                self.pool = await get_async_pool(**self.settings)
+                self.conn = await self.pool.acquire()
+            else:
+                self.conn = await aiomysql.connect(**_aiomysql_settings(self.settings))
+        except aiomysql.Error as e:
+            raise RuntimeError(f"Failed to connect to database: {e}")
+        self.cursor = await self.conn.cursor(aiomysql.DictCursor)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def execute(self, query: str, params: tuple | list | None = None):
+        """Execute a statement and return the cursor."""
+        await self.cursor.execute(query, params or ())
+        return self.cursor
+
+    async def execute_many(self, query: str, seq_params, commit: bool = True):
+        """Execute a statement for many parameter sets in one transaction."""
+        try:
+            await self.cursor.executemany(query, list(seq_params))
+            if commit:
+                await self.conn.commit()
+        except Exception:
+            await self.conn.rollback()
+            raise
+        return self.cursor
+
+    async def fetchall(self):
+        """Convenience wrapper around ``cursor.fetchall()``."""
+        return await self.cursor.fetchall()
+
+    async def fetchone(self):
+        """Convenience wrapper for ``cursor.fetchone()``."""
+        return await self.cursor.fetchone()
+
+    async def fetch(self, query: str, params: tuple | list | None = None):
+        """Execute a query and return all rows."""
+        await self.execute(query, params)
+        return await self.cursor.fetchall()
+
+    async def commit(self):
+        """Commit the current transaction."""
+        await self.conn.commit()
+
+    async def rollback(self):
+        """Rollback the current transaction."""
+        await self.conn.rollback()
+
+    async def close(self):
+        """Close cursor and connection (pooled connections are returned)."""
+        if self.conn is None:
+            return
+        try:
+            await self.cursor.close()
+        except Exception:
+            pass
+        if self.pool is not None:
+            try:
+                # Start the next lease without a half-finished transaction
+                await self.conn.rollback()
+            except Exception:
+                self.conn.close()
+            self.pool.release(self.conn)
+        else:
+            self.conn.close()
+        self.conn = None
+        self.cursor = None
+
+
+async def get_async_db(**kwargs) -> AsyncDatabase:
+    """Return a connected :class:`AsyncDatabase` using defaults or overrides."""
+    return await AsyncDatabase.connect(**kwargs)
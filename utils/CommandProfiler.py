@@ -0,0 +1,229 @@
+"""
+CommandProfiler - WebDriver command-level timing instrumentation
+Records every wire command (endpoint, latency, calling page-object method),
+the time spent in explicit waits and in time.sleep, aggregated per test
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.WaitUtility import WaitUtility
+from utils.EventWaitUtility import EventWaitUtility
+
+
+class CommandProfiler:
+    """Collects WebDriver command, wait and sleep timings per test"""
+
+    # Profiler that WebDriverFactory attaches new drivers to (None: profiling off)
+    active = None
+
+    def __init__(self):
+        """Initialize CommandProfiler"""
+        self.tests = {}
+        self.current = None
+        self._test_thread = None
+        self._local = threading.local()
+        self._original_sleep = None
+        self._original_waits = {}
+
+    # -- installation -------------------------------------------------
+
+    def install(self):
+        """Start profiling: patch time.sleep and the WaitUtility wait methods"""
+        CommandProfiler.active = self
+        self._original_sleep = time.sleep
+        profiler = self
+
+        def profiled_sleep(seconds):
+            start = time.perf_counter()
+            try:
+                profiler._original_sleep(seconds)
+            finally:
+                profiler._record_sleep(time.perf_counter() - start)
+
+        time.sleep = profiled_sleep
+
+        for cls in (WaitUtility, EventWaitUtility):
+            for name, method in list(vars(cls).items()):
+                if name.startswith("wait_for_") and callable(method):
+                    self._original_waits[(cls, name)] = method
+                    setattr(cls, name, self._wrap_wait(f"{cls.__name__}.{name}", method))
+        # Direct WebDriverWait use (e.g. BasePage.is_element_visible)
+        self._original_waits[(WebDriverWait, "until")] = WebDriverWait.until
+        WebDriverWait.until = self._wrap_wait("WebDriverWait.until", WebDriverWait.until)
+
+    def uninstall(self):
+        """Stop profiling and restore the patched functions"""
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+        for (cls, name), method in self._original_waits.items():
+            setattr(cls, name, method)
+        self._original_waits.clear()
+        if CommandProfiler.active is self:
+            CommandProfiler.active = None
+
+    def instrument(self, driver):
+        """
+        Time every WebDriver command sent by a driver
+
+        Args:
+            driver: WebDriver instance
+        """
+        if getattr(driver, "_command_profiler", None) is self:
+            return driver
+        execute = driver.execute
+        commands = getattr(driver.command_executor, "_commands", {})
+        profiler = self
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                endpoint = " ".join(commands.get(driver_command, ("", driver_command)))
+                profiler._record_command(driver_command, endpoint.strip(), time.perf_counter() - start)
+
+        driver.execute = profiled_execute
+        driver._command_profiler = self
+        return driver
+
+    def _wrap_wait(self, name, method):
+        profiler = self
+
+        def profiled_wait(*args, **kwargs):
+            depth = getattr(profiler._local, "wait_depth", 0)
+            profiler._local.wait_depth = depth + 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler._local.wait_depth = depth
+                if depth == 0:
+                    profiler._record("waits", name, time.perf_counter() - start)
+
+        profiled_wait.__name__ = method.__name__
+        profiled_wait.__doc__ = method.__doc__
+        return profiled_wait
+
+    # -- recording ----------------------------------------------------
+
+    def start_test(self, node_id):
+        """Attribute subsequent timings to a test"""
+        self.current = self.tests.setdefault(node_id, {
+            "commands": defaultdict(lambda: {"count": 0, "seconds": 0.0}),
+            "callers": defaultdict(lambda: {"count": 0, "seconds": 0.0}),
+            "waits": defaultdict(lambda: {"count": 0, "seconds": 0.0}),
+            "sleeps": defaultdict(lambda: {"count": 0, "seconds": 0.0}),
+        })
+        self._test_thread = threading.get_ident()
+
+    def end_test(self):
+        """Stop attributing timings to the current test"""
+        self.current = None
+        self._test_thread = None
+
+    def _record(self, kind, key, seconds):
+        if self.current is None or threading.get_ident() != self._test_thread:
+            return
+        entry = self.current[kind][key]
+        entry["count"] += 1
+        entry["seconds"] += seconds
+
+    def _record_command(self, command, endpoint, seconds):
+        self._record("commands", f"{command} ({endpoint})" if endpoint else command, seconds)
+        self._record("callers", self._page_object_caller(), seconds)
+
+    def _record_sleep(self, seconds):
+        # Polling sleeps inside explicit waits are already counted as wait time
+        if getattr(self._local, "wait_depth", 0) == 0:
+            self._record("sleeps", self._caller(), seconds)
+
+    @staticmethod
+    def _page_object_caller():
+        frame = sys._getframe(2)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith("pages."):
+                owner = frame.f_locals.get("self")
+                owner_name = type(owner).__name__ if owner is not None else module
+                return f"{owner_name}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return "(direct driver call)"
+
+    @staticmethod
+    def _caller():
+        frame = sys._getframe(3)
+        return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+    # -- reporting ----------------------------------------------------
+
+    @staticmethod
+    def _total(entries):
+        return sum(e["seconds"] for e in entries.values())
+
+    def summarize(self, top=10):
+        """
+        Aggregate the recorded timings
+
+        Args:
+            top (int): Number of entries kept in each top list
+
+        Returns:
+            dict: Run totals, top commands/callers and per-test totals
+        """
+        run = {kind: defaultdict(lambda: {"count": 0, "seconds": 0.0})
+               for kind in ("commands", "callers", "waits", "sleeps")}
+        per_test = {}
+        for node_id, data in self.tests.items():
+            per_test[node_id] = {
+                "commands": sum(e["count"] for e in data["commands"].values()),
+                "command_seconds": round(self._total(data["commands"]), 3),
+                "wait_seconds": round(self._total(data["waits"]), 3),
+                "sleep_seconds": round(self._total(data["sleeps"]), 3),
+            }
+            for kind in run:
+                for key, entry in data[kind].items():
+                    run[kind][key]["count"] += entry["count"]
+                    run[kind][key]["seconds"] += entry["seconds"]
+
+        def ranked(entries):
+            return [
+                {"name": name, "count": e["count"], "seconds": round(e["seconds"], 3)}
+                for name, e in sorted(entries.items(), key=lambda kv: -kv[1]["seconds"])[:top]
+            ]
+
+        return {
+            "totals": {
+                "commands": sum(e["count"] for e in run["commands"].values()),
+                "command_seconds": round(self._total(run["commands"]), 3),
+                "wait_seconds": round(self._total(run["waits"]), 3),
+                "sleep_seconds": round(self._total(run["sleeps"]), 3),
+            },
+            "top_commands": ranked(run["commands"]),
+            "top_callers": ranked(run["callers"]),
+            "top_waits": ranked(run["waits"]),
+            "top_sleeps": ranked(run["sleeps"]),
+            "tests": per_test,
+        }
+
+    def write_report(self, path=os.path.join("test_results", "command_profile.json")):
+        """
+        Write the run profile as JSON
+
+        Args:
+            path (str): Output file path
+
+        Returns:
+            dict: The written summary
+        """
+        summary = self.summarize()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+        return summary
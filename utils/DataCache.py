@@ -0,0 +1,125 @@
+"""
+DataCache - Persistent cache of parsed test-data files
+Stores the parsed table of a CSV/Excel file as a pickle keyed by path, and
+revalidates it against the file's size, mtime and content hash, so pytest
+collection (and every parallel worker) skips re-parsing unchanged data files
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+
+
+class DataCache:
+    """Disk + process cache of parsed tables (headers, rows) per data file"""
+
+    CACHE_DIR = os.getenv("TEST_DATA_CACHE_DIR", os.path.join(".pytest_cache", "test_data"))
+    FORMAT_VERSION = 1
+
+    _memory = {}
+    _stats = {"hits": 0, "misses": 0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_table(cls, file_path, parse, variant=""):
+        """
+        Return the parsed table of a file, calling parse() only when the file changed
+
+        Args:
+            file_path (str): Path to the data file
+            parse (callable): Returns (headers, rows) for the file; rows are tuples
+            variant (str): Extra key part, e.g. the sheet name
+
+        Returns:
+            tuple: (headers, rows)
+        """
+        stat = os.stat(file_path)
+        cache_path = cls._cache_path(file_path, variant)
+
+        with cls._lock:
+            entry = cls._memory.get(cache_path) or cls._load(cache_path)
+            if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                cls._memory[cache_path] = entry
+                cls._stats["hits"] += 1
+                return entry["headers"], entry["rows"]
+
+            digest = cls._hash_file(file_path)
+            if entry is not None and entry["sha256"] == digest:
+                # Touched but unchanged (e.g. fresh checkout); refresh the stat key
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                cls._store(cache_path, entry)
+                cls._stats["hits"] += 1
+                return entry["headers"], entry["rows"]
+
+            headers, rows = parse()
+            entry = {
+                "version": cls.FORMAT_VERSION,
+                "path": os.path.abspath(file_path),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+                "headers": tuple(headers),
+                "rows": [tuple(row) for row in rows],
+            }
+            cls._store(cache_path, entry)
+            cls._stats["misses"] += 1
+            return entry["headers"], entry["rows"]
+
+    @classmethod
+    def stats(cls):
+        """
+        Get cache counters for this process
+
+        Returns:
+            dict: hits and misses
+        """
+        with cls._lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def clear(cls):
+        """Drop the in-process cache and delete the on-disk cache files"""
+        with cls._lock:
+            cls._memory.clear()
+            if os.path.isdir(cls.CACHE_DIR):
+                for name in os.listdir(cls.CACHE_DIR):
+                    if name.endswith(".pickle"):
+                        os.remove(os.path.join(cls.CACHE_DIR, name))
+
+    @classmethod
+    def _cache_path(cls, file_path, variant):
+        key = f"{os.path.abspath(file_path)}|{variant}".encode("utf-8")
+        return os.path.join(cls.CACHE_DIR, f"{hashlib.sha1(key).hexdigest()}.pickle")
+
+    @staticmethod
+    def _hash_file(file_path):
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def _load(cls, cache_path):
+        try:
+            with open(cache_path, "rb") as file:
+                entry = pickle.load(file)
+        except Exception:
+            # Missing, truncated or written by an incompatible version
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != cls.FORMAT_VERSION:
+            return None
+        return entry
+
+    @classmethod
+    def _store(cls, cache_path, entry):
+        cls._memory[cache_path] = entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
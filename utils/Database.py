@@ -5,19 +5,212 @@ Provides a thin wrapper around ``mysql.connector`` that makes it easy
 for automation scripts or the backend to grab a connection and execute
 queries. Credentials default to common local settings but may be
 overridden via environment variables.
+
+Connections can be leased from a process-wide pool (``DB_POOL_SIZE``
+> 0 or ``Database(pooled=True)``) so repeated checks skip the TCP
+connect and authentication handshake.
 """
 
 import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import chain
+
 import mysql.connector
 from mysql.connector import Error
 
 
+def _connection_settings(
+    host: str | None = None,
+    port: int | None = None,
+    user: str | None = None,
+    password: str | None = None,
+    database: str | None = None,
+) -> dict:
+    """Resolve connection arguments, reading environment variables as fallback."""
+    return {
+        "host": host or os.getenv("DB_HOST", "localhost"),
+        "port": port or int(os.getenv("DB_PORT", "3306")),
+        "user": user or os.getenv("DB_USER", "root"),
+        "password": password or os.getenv("DB_PASSWORD", ""),
+        "database": database or os.getenv("DB_NAME", "jewelry_store_db"),
+    }
+
+
+class ConnectionPool:
+    """Fixed-size pool of MySQL connections with lease/return semantics.
+
+    Connections are opened lazily up to ``size``. On checkout an idle
+    connection is pinged and replaced if it is broken or older than
+    ``max_lifetime`` seconds; on return any open transaction is rolled
+    back so the next lease starts clean.
+    """
+
+    def __init__(
+        self,
+        settings: dict,
+        size: int = 5,
+        max_lifetime: float = 1800,
+        acquire_timeout: float = 30,
+    ):
+        self.settings = settings
+        self.size = size
+        self.max_lifetime = max_lifetime
+        self.acquire_timeout = acquire_timeout
+        self._idle = []
+        self._created_at = {}
+        self._open = 0
+        self._lock = threading.Condition()
+        self._closed = False
+        self.stats = {"connects": 0, "leases": 0, "discarded": 0}
+
+    def _connect(self):
+        try:
+            conn = mysql.connector.connect(**self.settings, autocommit=False)
+        except Error as e:
+            with self._lock:
+                self._open -= 1
+                self._lock.notify_all()
+            raise RuntimeError(f"Failed to connect to database: {e}")
+        with self._lock:
+            self._created_at[id(conn)] = time.monotonic()
+            self.stats["connects"] += 1
+        return conn
+
+    def _is_usable(self, conn) -> bool:
+        if time.monotonic() - self._created_at.get(id(conn), 0) > self.max_lifetime:
+            return False
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def _discard(self, conn):
+        with self._lock:
+            if self._created_at.pop(id(conn), None) is not None:
+                self._open -= 1
+            self.stats["discarded"] += 1
+            self._lock.notify_all()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Lease a healthy connection, opening one if the pool is not full."""
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            conn = None
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                if not self._idle and self._open >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._lock.wait_for(
+                        lambda: self._idle or self._open < self.size or self._closed,
+                        timeout=remaining,
+                    ):
+                        raise RuntimeError(
+                            f"No database connection available after {self.acquire_timeout}s"
+                        )
+                    continue
+                if self._idle:
+                    conn = self._idle.pop()
+                else:
+                    # Reserve the slot; the connect happens outside the lock
+                    self._open += 1
+
+            if conn is None:
+                conn = self._connect()
+            elif not self._is_usable(conn):
+                self._discard(conn)
+                continue
+
+            with self._lock:
+                self.stats["leases"] += 1
+            return conn
+
+    def release(self, conn):
+        """Return a leased connection; it is reset for the next lease or closed."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except Error:
+            self._discard(conn)
+            return
+        with self._lock:
+            if not self._closed and id(conn) in self._created_at:
+                self._idle.append(conn)
+                self._lock.notify_all()
+                return
+        self._discard(conn)
+
+    @contextmanager
+    def connection(self):
+        """Context manager that leases a connection and returns it on exit."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close every idle connection; leased ones are closed when released."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+
+
+_pools: dict = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(size: int | None = None, max_lifetime: float | None = None, **kwargs) -> ConnectionPool:
+    """Return the process-wide pool for a set of connection arguments.
+
+    ``size`` and ``max_lifetime`` default to ``DB_POOL_SIZE`` (5) and
+    ``DB_POOL_MAX_LIFETIME`` (1800 seconds) and only apply when the pool
+    is first created.
+    """
+    settings = _connection_settings(**kwargs)
+    key = tuple(sorted(settings.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(
+                settings,
+                size=size or int(os.getenv("DB_POOL_SIZE", "0") or 0) or 5,
+                max_lifetime=max_lifetime or float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_pools():
+    """Close every process-wide pool (e.g. at the end of a test session)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
 class Database:
     """Helper class that manages a MySQL connection.
 
     The constructor will open a connection immediately; call ``close()``
-    when finished. A cursor configured with ``dictionary=True`` is
-    available as ``self.cursor`` so rows behave like Python dicts.
+    when finished, or use the instance as a context manager. A cursor
+    configured with ``dictionary=True`` is available as ``self.cursor``
+    so rows behave like Python dicts.
+
+    With ``pooled=True`` (the default when ``DB_POOL_SIZE`` is set) the
+    connection is leased from the shared pool and ``close()`` hands it
+    back instead of disconnecting.
     """
 
     def __init__(
@@ -27,26 +220,27 @@ class Database:
         user: str | None = None,
         password: str | None = None,
         database: str | None = None,
+        pooled: bool | None = None,
     ):
-        # read environment variables as fallback
-        host = host or os.getenv("DB_HOST", "localhost")
-        port = port or int(os.getenv("DB_PORT", "3306"))
-        user = user or os.getenv("DB_USER", "root")
-        password = password or os.getenv("DB_PASSWORD", "")
-        database = database or os.getenv("DB_NAME", "jewelry_store_db")
+        settings = _connection_settings(host, port, user, password, database)
+        if pooled is None:
+            pooled = int(os.getenv("DB_POOL_SIZE", "0") or 0) > 0
 
-        try:
-            self.conn = mysql.connector.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=database,
-                autocommit=False,
-            )
-            self.cursor = self.conn.cursor(dictionary=True)
-        except Error as e:
-            raise RuntimeError(f"Failed to connect to database: {e}")
+        self.pool = get_pool(**settings) if pooled else None
+        if self.pool is not None:
+            self.conn = self.pool.acquire()
+        else:
+            try:
+                self.conn = mysql.connector.connect(**settings, autocommit=False)
+            except Error as e:
+                raise RuntimeError(f"Failed to connect to database: {e}")
+        self.cursor = self.conn.cursor(dictionary=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def execute(self, query: str, params: tuple | list | None = None):
         """Execute a statement and return the cursor.
@@ -57,6 +251,206 @@ class Database:
         self.cursor.execute(query, params or ())
         return self.cursor
 
+    def execute_many(
+        self,
+        query: str,
+        seq_params,
+        chunk_size: int = 1000,
+        commit: bool = True,
+    ) -> dict:
+        """Execute a statement for many parameter sets in one transaction.
+
+        Parameter sets are sent ``chunk_size`` at a time through
+        ``cursor.executemany()``, which turns ``INSERT ... VALUES``
+        statements into multi-row inserts. Everything is rolled back if
+        a chunk fails.
+
+        Returns a dict with ``rows``, ``statements``, ``seconds`` and
+        ``rows_per_second``.
+        """
+        start = time.perf_counter()
+        rows = statements = 0
+        cursor = self.conn.cursor()
+        try:
+            chunk = []
+            for params in seq_params:
+                chunk.append(params)
+                if len(chunk) == chunk_size:
+                    cursor.executemany(query, chunk)
+                    rows += len(chunk)
+                    statements += 1
+                    chunk = []
+            if chunk:
+                cursor.executemany(query, chunk)
+                rows += len(chunk)
+                statements += 1
+            if commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        return self._throughput(rows, statements, start)
+
+    def bulk_insert(
+        self,
+        table: str,
+        rows,
+        columns: list | tuple | None = None,
+        ignore: bool = False,
+        max_statement_bytes: int | None = None,
+        commit: bool = True,
+    ) -> dict:
+        """Insert many rows with multi-row ``INSERT`` statements in one transaction.
+
+        ``rows`` may be dicts (``columns`` defaults to the keys of the
+        first row) or sequences in ``columns`` order, and may be a
+        generator. Rows are packed into statements that stay below
+        ``max_statement_bytes``, by default three quarters of the server's
+        ``max_allowed_packet``. Everything is rolled back if a statement
+        fails.
+
+        Returns a dict with ``rows``, ``statements``, ``seconds`` and
+        ``rows_per_second``.
+        """
+        start = time.perf_counter()
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return self._throughput(0, 0, start)
+        if columns is None:
+            if not isinstance(first, dict):
+                raise ValueError("columns is required when rows are not dicts")
+            columns = list(first.keys())
+        if max_statement_bytes is None:
+            max_statement_bytes = self._max_allowed_packet() * 3 // 4
+
+        prefix = "INSERT {}INTO {} ({}) VALUES ".format(
+            "IGNORE " if ignore else "",
+            self.quote_identifier(table),
+            ", ".join(self.quote_identifier(c) for c in columns),
+        )
+        placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+
+        def values(row):
+            if isinstance(row, dict):
+                return [row[c] for c in columns]
+            if len(row) != len(columns):
+                raise ValueError(f"Row has {len(row)} values, expected {len(columns)}: {row!r}")
+            return list(row)
+
+        inserted = statements = 0
+        cursor = self.conn.cursor()
+        try:
+            params, count, size = [], 0, len(prefix)
+            for row in chain([first], rows):
+                row_values = values(row)
+                row_size = sum(self._estimate_size(v) for v in row_values) + 2 * len(columns) + 4
+                if count and size + row_size > max_statement_bytes:
+                    cursor.execute(prefix + ", ".join([placeholders] * count), params)
+                    inserted += count
+                    statements += 1
+                    params, count, size = [], 0, len(prefix)
+                params.extend(row_values)
+                count += 1
+                size += row_size
+            if count:
+                cursor.execute(prefix + ", ".join([placeholders] * count), params)
+                inserted += count
+                statements += 1
+            if commit:
+                self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.close()
+        return self._throughput(inserted, statements, start)
+
+    @staticmethod
+    def _throughput(rows: int, statements: int, start: float) -> dict:
+        seconds = time.perf_counter() - start
+        return {
+            "rows": rows,
+            "statements": statements,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(rows / seconds) if seconds > 0 else 0,
+        }
+
+    def _max_allowed_packet(self) -> int:
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT @@max_allowed_packet")
+            return int(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def quote_identifier(name: str) -> str:
+        """Backtick-quote a table or column name (``schema.table`` allowed)."""
+        if "`" in name:
+            raise ValueError(f"Invalid identifier: {name!r}")
+        return ".".join(f"`{part}`" for part in name.split("."))
+
+    @staticmethod
+    def _estimate_size(value) -> int:
+        """Upper bound of a value's size once escaped into the statement."""
+        if value is None:
+            return 4
+        if isinstance(value, (bytes, bytearray)):
+            return 2 * len(value) + 3
+        text = value if isinstance(value, str) else str(value)
+        encoded = len(text.encode("utf-8"))
+        # Quotes, backslashes and control characters are escaped with a backslash
+        escapes = sum(text.count(c) for c in "'\\\"\n\r\x00\x1a")
+        return encoded + escapes + 3
+
+    def iter_batches(
+        self,
+        query: str,
+        params: tuple | list | None = None,
+        batch_size: int = 1000,
+        row_type: str = "dict",
+    ):
+        """Stream a result set as lists of at most ``batch_size`` rows.
+
+        Uses an unbuffered cursor, so rows are read from the server as
+        the batches are consumed and memory stays flat whatever the
+        result size. ``row_type`` is ``"dict"``, ``"tuple"`` (cheapest)
+        or ``"namedtuple"``. The connection cannot run other statements
+        until the iteration finishes or the generator is closed.
+        """
+        if row_type not in ("dict", "tuple", "namedtuple"):
+            raise ValueError(f"Unknown row_type: {row_type!r}")
+        cursor = self.conn.cursor(buffered=False, dictionary=(row_type == "dict"))
+        try:
+            cursor.execute(query, params or ())
+            make_row = None
+            if row_type == "namedtuple":
+                make_row = namedtuple("Row", cursor.column_names, rename=True)._make
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield [make_row(row) for row in batch] if make_row else batch
+        finally:
+            # Drain what an abandoned iteration left unread so the connection stays usable
+            if self.conn.unread_result:
+                self.conn.consume_results()
+            cursor.close()
+
+    def stream(
+        self,
+        query: str,
+        params: tuple | list | None = None,
+        batch_size: int = 1000,
+        row_type: str = "dict",
+    ):
+        """Iterate over a result set row by row; see :meth:`iter_batches`."""
+        for batch in self.iter_batches(query, params, batch_size, row_type):
+            yield from batch
+
     def fetchall(self):
         """Convenience wrapper around ``cursor.fetchall()``."""
         return self.cursor.fetchall()
@@ -74,15 +468,21 @@ class Database:
         self.conn.rollback()
 
     def close(self):
-        """Close cursor and connection cleanly."""
+        """Close cursor and connection cleanly (pooled connections are returned)."""
+        if self.conn is None:
+            return
         try:
             self.cursor.close()
         except Exception:
             pass
-        try:
-            self.conn.close()
-        except Exception:
-            pass
+        if self.pool is not None:
+            self.pool.release(self.conn)
+        else:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = None
 
 
 # module convenience function
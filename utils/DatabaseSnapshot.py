@@ -0,0 +1,117 @@
+"""
+DatabaseSnapshot - Snapshot and restore of the application tables
+
+Takes an in-memory dump of every table in the schema once, then after
+each test restores only the tables whose ``CHECKSUM TABLE`` value
+changed, by deleting their rows and bulk-reloading the dumped ones. This
+isolates tests that write through the backend (which uses its own
+connections, so savepoints in the test process would not see them)
+without re-running ``db_setup.sql``.
+"""
+
+from mysql.connector import Error
+
+from utils.Database import Database
+
+
+class DatabaseSnapshot:
+    """In-memory dump of a schema's tables with checksum-based restore."""
+
+    def __init__(self, db: Database, tables: list | None = None):
+        self.db = db
+        self.tables = tables
+        self.dump = {}
+
+    def _query(self, query: str, params: tuple | list | None = None) -> list:
+        return list(self.db.stream(query, params, row_type="tuple"))
+
+    def _checksums(self) -> dict:
+        quoted = ", ".join(Database.quote_identifier(t) for t in self.tables)
+        return {row[0].split(".")[-1]: row[1] for row in self._query(f"CHECKSUM TABLE {quoted}")}
+
+    def _auto_increments(self) -> dict:
+        try:
+            # MySQL 8 caches table statistics; read live AUTO_INCREMENT values
+            self.db.execute("SET SESSION information_schema_stats_expiry = 0")
+        except Error:
+            pass
+        rows = self._query(
+            "SELECT TABLE_NAME, AUTO_INCREMENT FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE()"
+        )
+        return {name: value for name, value in rows}
+
+    def take(self) -> "DatabaseSnapshot":
+        """Dump every table (or the given ones) of the current schema."""
+        if self.tables is None:
+            self.tables = [
+                row[0] for row in self._query(
+                    "SELECT TABLE_NAME FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE' "
+                    "ORDER BY TABLE_NAME"
+                )
+            ]
+        checksums = self._checksums()
+        auto_increments = self._auto_increments()
+        self.dump = {}
+        for table in self.tables:
+            quoted = Database.quote_identifier(table)
+            batches = self.db.iter_batches(f"SELECT * FROM {quoted}", batch_size=5000, row_type="tuple")
+            rows = [row for batch in batches for row in batch]
+            columns = [
+                row[0] for row in self._query(
+                    "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+                    (table,),
+                )
+            ]
+            self.dump[table] = {
+                "columns": columns,
+                "rows": rows,
+                "checksum": checksums.get(table),
+                "auto_increment": auto_increments.get(table),
+            }
+        self.db.commit()
+        return self
+
+    def changed_tables(self) -> list:
+        """Tables whose content or AUTO_INCREMENT differs from the snapshot."""
+        checksums = self._checksums()
+        auto_increments = self._auto_increments()
+        self.db.commit()
+        return [
+            table for table, saved in self.dump.items()
+            if checksums.get(table) != saved["checksum"]
+            or auto_increments.get(table) != saved["auto_increment"]
+        ]
+
+    def restore(self) -> list:
+        """Reload the changed tables from the snapshot; returns their names.
+
+        Rows are replaced with ``DELETE`` and inserts in one transaction, so
+        a failed reload rolls back to the pre-restore content. ``TRUNCATE``
+        and ``ALTER TABLE`` commit implicitly, which is why ``AUTO_INCREMENT``
+        is only reset after that transaction has committed.
+        """
+        changed = self.changed_tables()
+        if not changed:
+            return []
+        self.db.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in changed:
+                saved = self.dump[table]
+                self.db.execute(f"DELETE FROM {Database.quote_identifier(table)}")
+                if saved["rows"]:
+                    self.db.bulk_insert(table, saved["rows"], columns=saved["columns"], commit=False)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self.db.execute("SET FOREIGN_KEY_CHECKS = 1")
+        for table in changed:
+            auto_increment = self.dump[table]["auto_increment"]
+            if auto_increment:
+                quoted = Database.quote_identifier(table)
+                self.db.execute(f"ALTER TABLE {quoted} AUTO_INCREMENT = {int(auto_increment)}")
+        return changed
@@ -0,0 +1,35 @@
+"""
+DomScripts - JavaScript snippets shared by in-page helpers
+Lets page objects and wait engines evaluate Selenium locators inside the
+browser so several reads can be answered by one WebDriver command
+"""
+
+# Defines findElements(using, value) for every Selenium By strategy
+FIND_ELEMENTS = """
+    function findElements(using, value) {
+        switch (using) {
+            case 'id': return Array.from(document.querySelectorAll('[id="' + value + '"]'));
+            case 'class name': return Array.from(document.getElementsByClassName(value));
+            case 'tag name': return Array.from(document.getElementsByTagName(value));
+            case 'name': return Array.from(document.querySelectorAll('[name="' + value + '"]'));
+            case 'link text':
+                return Array.from(document.querySelectorAll('a')).filter(function (a) { return a.textContent.trim() === value; });
+            case 'partial link text':
+                return Array.from(document.querySelectorAll('a')).filter(function (a) { return a.textContent.indexOf(value) !== -1; });
+            case 'xpath':
+                var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null), nodes = [];
+                for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            default: return Array.from(document.querySelectorAll(value));
+        }
+    }
+"""
+
+# Defines isVisible(el), an approximation of WebElement.is_displayed()
+IS_VISIBLE = """
+    function isVisible(el) {
+        if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+        var style = window.getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.opacity !== '0';
+    }
+"""
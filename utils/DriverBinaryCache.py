@@ -0,0 +1,148 @@
+"""
+DriverBinaryCache - Process and disk cache for resolved driver binaries
+Avoids running webdriver-manager version resolution on every driver creation
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+
+
+class DriverBinaryCache:
+    """Cache of driver binary paths keyed by browser and installed browser version"""
+
+    CACHE_FILE = os.getenv(
+        "DRIVER_CACHE_FILE",
+        os.path.join(os.path.expanduser("~"), ".wdm", "resolved_drivers.json")
+    )
+    TTL_SECONDS = int(os.getenv("DRIVER_CACHE_TTL", str(24 * 60 * 60)))
+    OFFLINE = os.getenv("DRIVER_CACHE_OFFLINE", "").lower() in ("1", "true", "yes")
+
+    _MANAGERS = {
+        "chrome": ChromeDriverManager,
+        "firefox": GeckoDriverManager,
+    }
+    _BROWSER_TYPES = {
+        "chrome": ChromeType.GOOGLE,
+        "firefox": "firefox",
+    }
+    _EXECUTABLES = {
+        "chrome": "chromedriver",
+        "firefox": "geckodriver",
+    }
+
+    _resolved = {}
+    _browser_versions = {}
+    _stats = {"hits": 0, "misses": 0, "saved_seconds": 0.0}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_driver_path(cls, browser):
+        """
+        Return the driver binary path for a browser, resolving it only on a cache miss
+
+        Args:
+            browser (str): Browser name - 'chrome' or 'firefox'
+
+        Returns:
+            str: Path to the driver executable
+        """
+        browser = browser.lower()
+        if browser not in cls._MANAGERS:
+            raise ValueError(f"Unsupported browser: {browser}. Use 'chrome' or 'firefox'")
+
+        with cls._lock:
+            if browser in cls._resolved:
+                path, resolve_seconds = cls._resolved[browser]
+                cls._record_hit(resolve_seconds)
+                return path
+
+            key = f"{browser}:{cls._get_browser_version(browser)}"
+            entry = cls._load().get(key)
+            if entry and os.path.exists(entry["path"]) and (
+                cls.OFFLINE or time.time() - entry["resolved_at"] < cls.TTL_SECONDS
+            ):
+                cls._resolved[browser] = (entry["path"], entry["resolve_seconds"])
+                cls._record_hit(entry["resolve_seconds"])
+                return entry["path"]
+
+            if cls.OFFLINE:
+                path = shutil.which(cls._EXECUTABLES[browser])
+                if not path:
+                    raise RuntimeError(
+                        f"Offline mode: no cached or PATH {cls._EXECUTABLES[browser]} for {key}"
+                    )
+                cls._resolved[browser] = (path, 0.0)
+                cls._stats["misses"] += 1
+                return path
+
+            start = time.perf_counter()
+            path = cls._MANAGERS[browser]().install()
+            resolve_seconds = time.perf_counter() - start
+
+            cls._resolved[browser] = (path, resolve_seconds)
+            cls._stats["misses"] += 1
+            cls._store(key, {"path": path, "resolved_at": time.time(), "resolve_seconds": resolve_seconds})
+            return path
+
+    @classmethod
+    def stats(cls):
+        """
+        Get cache counters for this process
+
+        Returns:
+            dict: hits, misses and saved_seconds (resolution time avoided by hits)
+        """
+        with cls._lock:
+            return dict(cls._stats)
+
+    @classmethod
+    def clear(cls):
+        """Drop the in-process cache and delete the on-disk cache file"""
+        with cls._lock:
+            cls._resolved.clear()
+            cls._browser_versions.clear()
+            if os.path.exists(cls.CACHE_FILE):
+                os.remove(cls.CACHE_FILE)
+
+    @classmethod
+    def _record_hit(cls, resolve_seconds):
+        cls._stats["hits"] += 1
+        cls._stats["saved_seconds"] += resolve_seconds
+
+    @classmethod
+    def _get_browser_version(cls, browser):
+        if browser not in cls._browser_versions:
+            try:
+                version = OperationSystemManager().get_browser_version_from_os(cls._BROWSER_TYPES[browser])
+            except Exception:
+                version = None
+            cls._browser_versions[browser] = version or "unknown"
+        return cls._browser_versions[browser]
+
+    @classmethod
+    def _load(cls):
+        try:
+            with open(cls.CACHE_FILE, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _store(cls, key, entry):
+        data = cls._load()
+        data[key] = entry
+        tmp_path = f"{cls.CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cls.CACHE_FILE) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+            os.replace(tmp_path, cls.CACHE_FILE)
+        except OSError:
+            pass
@@ -0,0 +1,273 @@
+"""
+DriverPool - Pool of warm WebDriver sessions with lease/return semantics
+Keeps pre-launched browsers per (browser, headless) key so tests do not pay
+a full browser startup each time
+"""
+
+import threading
+from contextlib import contextmanager
+
+from utils.WebDriverFactory import WebDriverFactory
+
+
+class PooledDriver:
+    """Bookkeeping wrapper around a pooled WebDriver session"""
+
+    def __init__(self, driver, key):
+        """
+        Initialize PooledDriver
+
+        Args:
+            driver: WebDriver instance
+            key (tuple): Pool key (browser, headless)
+        """
+        self.driver = driver
+        self.key = key
+        self.uses = 0
+
+
+class DriverPool:
+    """Keeps N warm WebDriver sessions per (browser, headless) key"""
+
+    def __init__(self, size=2, max_uses=20, lease_timeout=120):
+        """
+        Initialize DriverPool
+
+        Args:
+            size (int): Maximum number of sessions per (browser, headless) key
+            max_uses (int): Leases served by a session before it is recycled
+                (0: only recycled when a reset fails)
+            lease_timeout (int): Seconds to wait for a free session
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+        self._idle = {}
+        self._created = {}
+        self._leased = {}
+        self._lock = threading.Condition()
+        self._closed = False
+        self.stats = {"launches": 0, "resets": 0, "relaunches": 0}
+
+    @staticmethod
+    def _key(browser, headless):
+        return (browser.lower(), bool(headless))
+
+    def warm(self, browser="chrome", headless=False, count=None):
+        """
+        Pre-launch sessions so the first leases are served immediately
+
+        Args:
+            browser (str): Browser name - 'chrome' or 'firefox'
+            headless (bool): Run browser in headless mode
+            count (int): Number of sessions to launch (default: pool size)
+        """
+        key = self._key(browser, headless)
+        count = self.size if count is None else min(count, self.size)
+        threads = []
+        for _ in range(count):
+            with self._lock:
+                if self._created.get(key, 0) >= self.size:
+                    break
+                self._created[key] = self._created.get(key, 0) + 1
+            thread = threading.Thread(target=self._launch_idle, args=(key,), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+    def _launch(self, key):
+        pooled = PooledDriver(WebDriverFactory.create_driver(browser=key[0], headless=key[1]), key)
+        with self._lock:
+            self.stats["launches"] += 1
+        return pooled
+
+    def _launch_idle(self, key):
+        try:
+            pooled = self._launch(key)
+        except Exception:
+            with self._lock:
+                self._created[key] -= 1
+                self._lock.notify_all()
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append(pooled)
+            self._lock.notify_all()
+
+    def acquire(self, browser="chrome", headless=False):
+        """
+        Lease a healthy session, launching one if the pool is not full
+
+        Args:
+            browser (str): Browser name - 'chrome' or 'firefox'
+            headless (bool): Run browser in headless mode
+
+        Returns:
+            WebDriver: Leased WebDriver instance; hand it back with release()
+        """
+        key = self._key(browser, headless)
+        while True:
+            pooled = None
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                idle = self._idle.setdefault(key, [])
+                if not idle and self._created.get(key, 0) >= self.size:
+                    if not self._lock.wait_for(
+                        lambda: self._idle.get(key) or self._created.get(key, 0) < self.size,
+                        timeout=self.lease_timeout,
+                    ):
+                        raise TimeoutError(f"No {key[0]} session available after {self.lease_timeout}s")
+                    continue
+                if idle:
+                    pooled = idle.pop()
+                else:
+                    self._created[key] = self._created.get(key, 0) + 1
+
+            if pooled is None:
+                try:
+                    pooled = self._launch(key)
+                except Exception:
+                    self._discard_slot(key)
+                    raise
+            elif not self._is_healthy(pooled.driver):
+                self._quit(pooled)
+                continue
+
+            pooled.uses += 1
+            with self._lock:
+                self._leased[id(pooled.driver)] = pooled
+            return pooled.driver
+
+    def release(self, driver):
+        """
+        Return a leased session; it is reset for the next lease or recycled
+
+        Args:
+            driver: WebDriver instance obtained from acquire()
+        """
+        with self._lock:
+            pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            raise ValueError("Driver was not leased from this pool")
+
+        if self._closed or (self.max_uses and pooled.uses >= self.max_uses):
+            self._quit(pooled)
+            return
+        if not self.reset_driver(driver):
+            # Dirty or broken session; the next lease relaunches a browser
+            with self._lock:
+                self.stats["relaunches"] += 1
+            self._quit(pooled)
+            return
+
+        with self._lock:
+            self.stats["resets"] += 1
+            self._idle.setdefault(pooled.key, []).append(pooled)
+            self._lock.notify_all()
+
+    @contextmanager
+    def lease(self, browser="chrome", headless=False):
+        """
+        Context manager that leases a session and returns it on exit
+
+        Args:
+            browser (str): Browser name - 'chrome' or 'firefox'
+            headless (bool): Run browser in headless mode
+
+        Yields:
+            WebDriver: Leased WebDriver instance
+        """
+        driver = self.acquire(browser=browser, headless=headless)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    # Application state left behind by website/cart.js; checked explicitly after a reset
+    APP_STORAGE_KEYS = ("obelisco_cart_v1", "token", "last_order")
+
+    CLEAR_STORAGE_SCRIPT = """
+        try { window.localStorage.clear(); } catch (e) {}
+        try { window.sessionStorage.clear(); } catch (e) {}
+    """
+
+    # Returns null when the page exposes no storage (e.g. about:blank)
+    STORAGE_STATE_SCRIPT = """
+        var keys = arguments[0];
+        try {
+            return {
+                local: window.localStorage.length,
+                session: window.sessionStorage.length,
+                app_keys: keys.filter(function (k) { return window.localStorage.getItem(k) !== null; })
+            };
+        } catch (e) { return null; }
+    """
+
+    @classmethod
+    def reset_driver(cls, driver):
+        """
+        Bring a session back to a blank, verified state between tests
+
+        Closes extra windows, leaves any iframe, clears cookies plus
+        localStorage/sessionStorage of the current origin, checks that nothing
+        survived and loads about:blank.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the session was reset, False if it should be discarded
+        """
+        try:
+            handles = driver.window_handles
+            main_handle = handles[0]
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(main_handle)
+            driver.switch_to.default_content()
+            driver.delete_all_cookies()
+            driver.execute_script(cls.CLEAR_STORAGE_SCRIPT)
+            if not cls._is_clean(driver):
+                return False
+            driver.get("about:blank")
+            return driver.current_url == "about:blank"
+        except Exception:
+            return False
+
+    @classmethod
+    def _is_clean(cls, driver):
+        if len(driver.window_handles) != 1 or driver.get_cookies():
+            return False
+        state = driver.execute_script(cls.STORAGE_STATE_SCRIPT, list(cls.APP_STORAGE_KEYS))
+        return state is None or (not state["local"] and not state["session"] and not state["app_keys"])
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def _discard_slot(self, key):
+        with self._lock:
+            self._created[key] = max(self._created.get(key, 0) - 1, 0)
+            self._lock.notify_all()
+
+    def _quit(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        self._discard_slot(pooled.key)
+
+    def close(self):
+        """Quit every idle session; leased sessions are quit when released"""
+        with self._lock:
+            self._closed = True
+            idle = [p for sessions in self._idle.values() for p in sessions]
+            self._idle.clear()
+        for pooled in idle:
+            self._quit(pooled)
@@ -0,0 +1,146 @@
+"""
+DurationStore - On-disk history of test durations
+Keeps a rolling window of recent durations per node ID and browser and answers
+percentile queries used to schedule the suite
+"""
+
+import json
+import os
+import time
+
+
+class DurationStore:
+    """Rolling per-test, per-browser duration history stored as compact JSON"""
+
+    DEFAULT_PATH = os.path.join("test_results", "duration_history.json")
+
+    def __init__(self, path=DEFAULT_PATH, window=20):
+        """
+        Initialize DurationStore
+
+        Args:
+            path (str): Path of the JSON history file
+            window (int): Number of most recent samples kept per test and browser
+        """
+        self.path = path
+        self.window = window
+        self.tests = self._read()
+        self._pending = []
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file).get("tests", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def record(self, node_id, duration, browser="chrome"):
+        """
+        Add a duration sample for a test
+
+        Args:
+            node_id (str): Pytest node ID
+            duration (float): Duration in seconds
+            browser (str): Browser the test ran on
+        """
+        duration = round(duration, 3)
+        self._append(node_id, duration, browser)
+        self._pending.append((node_id, duration, browser))
+
+    def _append(self, node_id, duration, browser):
+        samples = self.tests.setdefault(node_id, {}).setdefault(browser, [])
+        samples.append(duration)
+        del samples[:-self.window]
+
+    def percentile(self, node_id, percentile=50, browser=None):
+        """
+        Get a duration percentile for a test
+
+        Args:
+            node_id (str): Pytest node ID
+            percentile (int): Percentile between 0 and 100
+            browser (str): Browser to query (default: all browsers)
+
+        Returns:
+            float: Duration in seconds, or None if the test has no history
+        """
+        history = self.tests.get(node_id, {})
+        if browser is not None:
+            samples = sorted(history.get(browser, []))
+        else:
+            samples = sorted(s for values in history.values() for s in values)
+        if not samples:
+            return None
+        rank = (len(samples) - 1) * percentile / 100
+        lower = int(rank)
+        upper = min(lower + 1, len(samples) - 1)
+        return samples[lower] + (samples[upper] - samples[lower]) * (rank - lower)
+
+    def estimates(self, node_ids, percentile=50, browser=None):
+        """
+        Get expected durations for a list of tests
+
+        Tests without history for the browser fall back to their history on
+        other browsers, then to the median of the known estimates.
+
+        Args:
+            node_ids (list): Pytest node IDs
+            percentile (int): Percentile used as the estimate
+            browser (str): Browser to query (default: all browsers)
+
+        Returns:
+            dict: Mapping of node ID to expected duration in seconds
+        """
+        known = {}
+        for node_id in node_ids:
+            value = self.percentile(node_id, percentile, browser)
+            if value is None and browser is not None:
+                value = self.percentile(node_id, percentile)
+            known[node_id] = value
+        values = sorted(v for v in known.values() if v is not None)
+        default = values[len(values) // 2] if values else 1.0
+        return {n: (v if v is not None else default) for n, v in known.items()}
+
+    def save(self):
+        """
+        Merge this store's samples into the file on disk
+
+        A lock file serializes concurrent writers such as parallel workers; the
+        samples recorded since loading are appended to whatever is on disk.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lock_path = f"{self.path}.lock"
+        lock = self._acquire_lock(lock_path)
+        try:
+            on_disk = DurationStore(self.path, self.window)
+            for node_id, duration, browser in self._pending:
+                on_disk._append(node_id, duration, browser)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump({"version": 1, "tests": on_disk.tests}, file, separators=(",", ":"), sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.tests = on_disk.tests
+            self._pending = []
+        finally:
+            os.close(lock)
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _acquire_lock(lock_path, timeout=10):
+        deadline = time.time() + timeout
+        while True:
+            try:
+                return os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if time.time() > deadline:
+                    # Stale lock from a crashed writer
+                    try:
+                        os.remove(lock_path)
+                    except FileNotFoundError:
+                        pass
+                    deadline = time.time() + timeout
+                    continue
+                time.sleep(0.05)
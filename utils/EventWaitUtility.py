@@ -0,0 +1,198 @@
+"""
+EventWaitUtility - Event-driven waits backed by MutationObserver
+Blocks on a single execute_async_script call that resolves as soon as the DOM
+condition holds, instead of polling with a WebDriver command every 500 ms
+"""
+
+from selenium.common.exceptions import (
+    JavascriptException, TimeoutException, UnknownMethodException, WebDriverException
+)
+from utils.WaitUtility import WaitUtility
+from utils.DomScripts import FIND_ELEMENTS, IS_VISIBLE
+
+
+class EventWaitUtility(WaitUtility):
+    """WaitUtility whose DOM waits are resolved in the page by a MutationObserver"""
+
+    # arguments: using, value, condition, expected, timeout_ms, callback
+    # Conditions are re-checked on every DOM mutation and, throttled to one
+    # check per animation frame, for changes that cause no mutation (CSS
+    # transitions, layout); the callback receives the result or null on timeout.
+    WATCH_SCRIPT = FIND_ELEMENTS + IS_VISIBLE + """
+        var using = arguments[0], value = arguments[1], condition = arguments[2],
+            expected = arguments[3], timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+
+        function check() {
+            var elements = findElements(using, value);
+            switch (condition) {
+                case 'presence': return elements.length ? elements[0] : null;
+                case 'visible': return elements.length && isVisible(elements[0]) ? elements[0] : null;
+                case 'invisible': return !elements.length || !isVisible(elements[0]) ? true : null;
+                case 'text': return elements.length && elements[0].textContent.indexOf(expected) !== -1 ? true : null;
+                case 'count': return elements.length === expected ? elements : null;
+            }
+            return null;
+        }
+
+        var observer, frame, timer, finished = false;
+        function finish(result) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            if (frame) cancelAnimationFrame(frame);
+            clearTimeout(timer);
+            done(result);
+        }
+        function evaluate() {
+            var result = check();
+            if (result !== null) finish(result);
+        }
+        function onFrame() {
+            frame = null;
+            evaluate();
+            if (!finished) frame = requestAnimationFrame(onFrame);
+        }
+
+        evaluate();
+        if (finished) return;
+        observer = new MutationObserver(evaluate);
+        observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+        frame = requestAnimationFrame(onFrame);
+        timer = setTimeout(function () { finish(null); }, timeoutMs);
+    """
+
+    # Errors saying the page went away under the watcher (Chrome, Firefox)
+    UNLOADED_MESSAGES = ("document unloaded", "document was unloaded")
+    # Drivers without async script support
+    UNSUPPORTED_MESSAGES = ("unknown command", "unsupported operation", "not implemented")
+
+    def __init__(self, driver, timeout=15):
+        """
+        Initialize EventWaitUtility
+
+        Args:
+            driver: WebDriver instance
+            timeout (int): Default timeout in seconds
+        """
+        super().__init__(driver, timeout)
+        # Selenium 3 cannot read timeouts back, so start from the session
+        # default (30 s in W3C sessions, 0 in legacy ones) and restore that
+        self._script_timeout = 30 if getattr(driver, "w3c", True) else 0
+
+    def _watch(self, locator, condition, expected=None):
+        """
+        Run the in-page watcher for a condition
+
+        Returns:
+            Any: The watcher result, or None if the condition timed out
+
+        Raises:
+            WebDriverException: If the page navigated away while waiting
+        """
+        # Leave headroom so the in-page timer always fires first
+        needed = self.timeout + 5
+        raise_timeout = needed > self._script_timeout
+        if raise_timeout:
+            self.driver.set_script_timeout(needed)
+        by, value = locator
+        try:
+            return self.driver.execute_async_script(
+                self.WATCH_SCRIPT, by, value, condition, expected, int(self.timeout * 1000)
+            )
+        finally:
+            if raise_timeout:
+                self.driver.set_script_timeout(self._script_timeout)
+
+    def _watcher_lost(self, error):
+        """Whether the watcher could not run to completion, as opposed to failing"""
+        if isinstance(error, (TimeoutException, UnknownMethodException)):
+            # A script timeout means the in-page timer never reported back
+            return True
+        text = (error.msg or "").lower()
+        if any(m in text for m in self.UNLOADED_MESSAGES):
+            return True
+        return not isinstance(error, JavascriptException) and any(m in text for m in self.UNSUPPORTED_MESSAGES)
+
+    def _wait(self, locator, condition, expected, fallback, message):
+        try:
+            result = self._watch(locator, condition, expected)
+        except WebDriverException as e:
+            if not self._watcher_lost(e):
+                raise
+            # Navigation or an unsupported driver; finish with the polling engine
+            return fallback()
+        if result is None:
+            raise TimeoutException(message)
+        return result
+
+    def wait_for_element_visible(self, locator):
+        """
+        Wait for element to be visible
+
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+
+        Returns:
+            WebElement: The visible element
+        """
+        return self._wait(locator, "visible", None,
+                          lambda: super(EventWaitUtility, self).wait_for_element_visible(locator),
+                          f"Element not visible: {locator}")
+
+    def wait_for_element_presence(self, locator):
+        """
+        Wait for element to be present in DOM
+
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+
+        Returns:
+            WebElement: The present element
+        """
+        return self._wait(locator, "presence", None,
+                          lambda: super(EventWaitUtility, self).wait_for_element_presence(locator),
+                          f"Element not present: {locator}")
+
+    def wait_for_text_in_element(self, locator, text):
+        """
+        Wait for specific text to appear in element
+
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            text (str): Expected text
+
+        Returns:
+            bool: True if text is found
+        """
+        return self._wait(locator, "text", text,
+                          lambda: super(EventWaitUtility, self).wait_for_text_in_element(locator, text),
+                          f"Text '{text}' not found in element: {locator}")
+
+    def wait_for_element_invisible(self, locator):
+        """
+        Wait for element to become invisible
+
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+
+        Returns:
+            bool: True if element is invisible
+        """
+        return self._wait(locator, "invisible", None,
+                          lambda: super(EventWaitUtility, self).wait_for_element_invisible(locator),
+                          f"Element still visible: {locator}")
+
+    def wait_for_number_of_elements(self, locator, count):
+        """
+        Wait for specific number of elements
+
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            count (int): Expected number of elements
+
+        Returns:
+            list: List of WebElements
+        """
+        return self._wait(locator, "count", count,
+                          lambda: super(EventWaitUtility, self).wait_for_number_of_elements(locator, count),
+                          f"Expected {count} elements, found different count: {locator}")
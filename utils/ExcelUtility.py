@@ -6,78 +6,293 @@ Supports reading login credentials and other test data
 import openpyxl
 import csv
 import os
+from itertools import islice
+
+from utils.DataCache import DataCache
 
 
 class ExcelUtility:
     """Utility class to read test data from Excel and CSV files"""
     
     @staticmethod
-    def read_excel(file_path, sheet_name=None):
+    def read_excel(file_path, sheet_name=None, columns=None, where=None, start=None, stop=None, cache=False):
         """
         Read data from an Excel file
         
         Args:
             file_path (str): Path to the Excel file
             sheet_name (str): Name of the sheet to read (default: first sheet)
+            columns, where, start, stop: See iter_excel
+            cache (bool): Reuse the parsed sheet from DataCache while the file is unchanged
             
         Returns:
             list: List of dictionaries containing row data
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Excel file not found: {file_path}")
-        
-        workbook = openpyxl.load_workbook(file_path)
-        
-        if sheet_name:
-            sheet = workbook[sheet_name]
-        else:
-            sheet = workbook.active
+        if not cache:
+            return list(ExcelUtility.iter_excel(file_path, sheet_name, columns, where, start, stop))
+        headers, rows = ExcelUtility.read_excel_table(file_path, sheet_name)
+        return list(ExcelUtility._select_rows(headers, rows, columns, where, start, stop, file_path))
+    
+    @staticmethod
+    def iter_excel(file_path, sheet_name=None, columns=None, where=None, start=None, stop=None):
+        """
+        Lazily read rows from an Excel file
         
-        # Get headers from first row
-        headers = [cell.value for cell in sheet[1]]
+        The workbook is opened in read-only mode, so rows are streamed from the
+        file instead of loading the whole sheet into memory.
         
-        # Read data rows
-        data = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            # Convert None cell values to empty strings for consistency with CSV reading
-            row_dict = {headers[i]: (row[i] if row[i] is not None else "") for i in range(len(headers))}
-            data.append(row_dict)
+        Args:
+            file_path (str): Path to the Excel file
+            sheet_name (str): Name of the sheet to read (default: first sheet)
+            columns (list): Headers to keep, in this order (default: all columns)
+            where (callable): Predicate on the row dictionary; rows for which it
+                returns False are skipped
+            start (int): Index of the first data row to read, 0 being the row
+                below the headers (default: 0)
+            stop (int): Index of the data row to stop before (default: end of sheet)
+            
+        Yields:
+            dict: Row data
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
         
-        workbook.close()
-        return data
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            if sheet_name:
+                sheet = workbook[sheet_name]
+            else:
+                sheet = workbook.active
+            
+            # Get headers from first row
+            headers = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            indexes = ExcelUtility._column_indexes(headers, columns, file_path)
+            
+            min_row = 2 + (start or 0)
+            max_row = 1 + stop if stop is not None else None
+            if max_row is not None and max_row < min_row:
+                return
+            
+            for row in sheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True):
+                # Convert None cell values to empty strings for consistency with CSV reading
+                row_dict = {
+                    headers[i]: (row[i] if i < len(row) and row[i] is not None else "")
+                    for i in indexes
+                }
+                if where is None or where(row_dict):
+                    yield row_dict
+        finally:
+            workbook.close()
     
     @staticmethod
-    def read_csv(file_path):
+    def read_csv(file_path, columns=None, where=None, start=None, stop=None, cache=False):
         """
         Read data from a CSV file
         
         Args:
             file_path (str): Path to the CSV file
+            columns, where, start, stop: See iter_csv
+            cache (bool): Reuse the parsed file from DataCache while it is unchanged
             
         Returns:
             list: List of dictionaries containing row data
         """
+        if not cache:
+            return list(ExcelUtility.iter_csv(file_path, columns, where, start, stop))
+        headers, rows = ExcelUtility.read_csv_table(file_path)
+        return list(ExcelUtility._select_rows(headers, rows, columns, where, start, stop, file_path))
+    
+    @staticmethod
+    def iter_csv(file_path, columns=None, where=None, start=None, stop=None):
+        """
+        Lazily read rows from a CSV file
+        
+        Args:
+            file_path (str): Path to the CSV file
+            columns (list): Headers to keep, in this order (default: all columns)
+            where (callable): Predicate on the row dictionary; rows for which it
+                returns False are skipped
+            start (int): Index of the first data row to read (default: 0)
+            stop (int): Index of the data row to stop before (default: end of file)
+            
+        Yields:
+            dict: Row data
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        data = []
         with open(file_path, 'r', encoding='utf-8') as file:
             csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                data.append(row)
+            if columns is not None:
+                ExcelUtility._column_indexes(csv_reader.fieldnames or [], columns, file_path)
+            for row in islice(csv_reader, start, stop):
+                if columns is not None:
+                    row = {column: row[column] for column in columns}
+                if where is None or where(row):
+                    yield row
+    
+    @staticmethod
+    def read_excel_table(file_path, sheet_name=None):
+        """
+        Read a sheet as a header list and row tuples, cached by DataCache
+        
+        Args:
+            file_path (str): Path to the Excel file
+            sheet_name (str): Name of the sheet to read (default: first sheet)
+            
+        Returns:
+            tuple: (headers, rows)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        
+        def parse():
+            rows = ExcelUtility.iter_excel(file_path, sheet_name)
+            first = next(rows, None)
+            if first is None:
+                return ExcelUtility._read_excel_headers(file_path, sheet_name), []
+            return list(first.keys()), [tuple(first.values())] + [tuple(row.values()) for row in rows]
+        
+        return DataCache.get_table(file_path, parse, variant=f"excel:{sheet_name or ''}")
+    
+    @staticmethod
+    def read_csv_table(file_path):
+        """
+        Read a CSV file as a header list and row tuples, cached by DataCache
+        
+        Args:
+            file_path (str): Path to the CSV file
+            
+        Returns:
+            tuple: (headers, rows)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        return data
+        def parse():
+            with open(file_path, 'r', encoding='utf-8') as file:
+                csv_reader = csv.DictReader(file)
+                headers = csv_reader.fieldnames or []
+                return headers, [tuple(row.get(header) for header in headers) for row in csv_reader]
+        
+        return DataCache.get_table(file_path, parse, variant="csv")
+    
+    @staticmethod
+    def _read_excel_headers(file_path, sheet_name):
+        """Read only the header row of a sheet"""
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            sheet = workbook[sheet_name] if sheet_name else workbook.active
+            return list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _select_rows(headers, rows, columns, where, start, stop, file_path):
+        """Apply range, projection and filter to an already parsed table"""
+        indexes = ExcelUtility._column_indexes(headers, columns, file_path)
+        for row in islice(rows, start, stop):
+            row_dict = {headers[i]: row[i] for i in indexes}
+            if where is None or where(row_dict):
+                yield row_dict
     
     @staticmethod
-    def write_excel(file_path, data, sheet_name="Sheet1"):
+    def _column_indexes(headers, columns, file_path):
+        """Map requested column names to header positions"""
+        headers = list(headers)
+        if columns is None:
+            return range(len(headers))
+        missing = [column for column in columns if column not in headers]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {file_path}; available: {headers}")
+        return [headers.index(column) for column in columns]
+    
+    # Rows per worksheet supported by Excel, header row included
+    MAX_SHEET_ROWS = 1048576
+    
+    @staticmethod
+    def write_excel(file_path, data, sheet_name="Sheet1", streaming=True, max_rows_per_sheet=None):
         """
         Write data to an Excel file
         
         Args:
             file_path (str): Path to save the Excel file
-            data (list): List of dictionaries to write
+            data (iterable): Dictionaries to write; may be a generator when streaming
             sheet_name (str): Name of the sheet
+            streaming (bool): Use a write-only workbook, which writes rows out as they
+                are appended and keeps memory constant (default: True)
+            max_rows_per_sheet (int): Data rows per sheet before continuing on
+                '<sheet_name>_2', '<sheet_name>_3', ... (default: Excel's row limit)
+            
+        Returns:
+            int: Number of data rows written
         """
+        if not streaming:
+            return ExcelUtility._write_excel_in_memory(file_path, list(data), sheet_name)
+        
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            return ExcelUtility.write_rows(file_path, [], [], sheet_name, max_rows_per_sheet)
+        headers = list(first.keys())
+        
+        def values():
+            yield [first[header] for header in headers]
+            for row_dict in rows:
+                yield [row_dict[header] for header in headers]
+        
+        return ExcelUtility.write_rows(file_path, headers, values(), sheet_name, max_rows_per_sheet)
+    
+    @staticmethod
+    def write_rows(file_path, headers, rows, sheet_name="Sheet1", max_rows_per_sheet=None):
+        """
+        Stream rows of values into a write-only Excel workbook
+        
+        Args:
+            file_path (str): Path to save the Excel file
+            headers (list): Header row, repeated at the top of every sheet (may be empty)
+            rows (iterable): Sequences of cell values in header order
+            sheet_name (str): Name of the first sheet
+            max_rows_per_sheet (int): Data rows per sheet before continuing on a new
+                sheet (default: Excel's row limit)
+            
+        Returns:
+            int: Number of data rows written
+        """
+        limit = ExcelUtility.MAX_SHEET_ROWS - (1 if headers else 0)
+        if max_rows_per_sheet is not None:
+            limit = min(limit, max_rows_per_sheet)
+        if limit < 1:
+            raise ValueError("max_rows_per_sheet must be at least 1")
+        
+        workbook = openpyxl.Workbook(write_only=True)
+        
+        def new_sheet(number):
+            sheet = workbook.create_sheet(sheet_name if number == 1 else f"{sheet_name}_{number}")
+            if headers:
+                sheet.append(list(headers))
+            return sheet
+        
+        sheet_number = 1
+        sheet = new_sheet(sheet_number)
+        in_sheet = 0
+        written = 0
+        for row in rows:
+            if in_sheet == limit:
+                sheet_number += 1
+                sheet = new_sheet(sheet_number)
+                in_sheet = 0
+            sheet.append(row)
+            in_sheet += 1
+            written += 1
+        
+        workbook.save(file_path)
+        workbook.close()
+        return written
+    
+    @staticmethod
+    def _write_excel_in_memory(file_path, data, sheet_name):
+        """Write data with a regular (in-memory) workbook"""
         workbook = openpyxl.Workbook()
         sheet = workbook.active
         sheet.title = sheet_name
@@ -94,3 +309,4 @@ class ExcelUtility:
         
         workbook.save(file_path)
         workbook.close()
+        return len(data)
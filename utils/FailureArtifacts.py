@@ -0,0 +1,181 @@
+"""
+FailureArtifacts - Off-thread capture of failure evidence
+Grabs the screenshot bytes, page source and browser console log while the
+driver is still alive, then compresses and writes them on a background
+thread pool under test_results/screenshots/<run_id>/ so test teardown only
+pays for the WebDriver round trips
+
+Pillow (WebP screenshots) and zstandard (.zst text) are optional:
+without them screenshots stay PNG and text is gzipped
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+try:
+    from PIL import Image
+except ImportError:  # optional dependency
+    Image = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+class FailureArtifacts:
+    """Collects failure artifacts per test and writes them in the background"""
+
+    ARTIFACT_DIR = os.path.join("test_results", "screenshots")
+
+    def __init__(self, directory=ARTIFACT_DIR, run_id=None, workers=2, webp_quality=80):
+        """
+        Initialize FailureArtifacts
+
+        Args:
+            directory (str): Parent folder of the per-run artifact folders
+            run_id (str): Identifier of this run (default: TEST_RUN_ID, set by
+                run_parallel_tests.py for all its workers, then the xdist run UID,
+                then timestamp + random suffix)
+            workers (int): Background threads compressing and writing artifacts
+            webp_quality (int): WebP quality of screenshots when Pillow is installed
+        """
+        self.run_id = run_id or os.getenv("TEST_RUN_ID") or os.getenv("PYTEST_XDIST_TESTRUNUID") or \
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        # Workers sharing a run ID write to their own subfolder so same-named tests don't collide
+        worker = os.getenv("TEST_WORKER_ID") or os.getenv("PYTEST_XDIST_WORKER")
+        self.directory = os.path.join(directory, self.run_id, *([worker] if worker else []))
+        self.workers = workers
+        self.webp_quality = webp_quality
+        self.written = []
+        self.errors = []
+        self.capture_seconds = 0.0
+        self._executor = None
+        self._futures = []
+        self._names = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _safe_name(name):
+        # test_login[special@user] -> test_login_special_user
+        return re.sub(r"[^\w.-]+", "_", name).strip("_")[:150] or "test"
+
+    def _unique_name(self, name):
+        # Reruns of the same test in one run get -2, -3, ... instead of overwriting
+        base = self._safe_name(name)
+        with self._lock:
+            candidate, counter = base, 1
+            while candidate in self._names:
+                counter += 1
+                candidate = f"{base}-{counter}"
+            self._names.add(candidate)
+        return candidate
+
+    @staticmethod
+    def _grab(getter):
+        try:
+            return getter()
+        except (WebDriverException, AttributeError, ValueError):
+            return None
+
+    def capture(self, driver, name, metadata=None):
+        """
+        Grab the artifacts of a failed test and queue them for writing
+
+        Args:
+            driver: WebDriver instance, still open
+            name (str): Test name, e.g. item.name
+            metadata (dict): Extra fields for the <name>.json summary (node ID, error, ...)
+
+        Returns:
+            str: Path prefix of the artifacts, e.g. test_results/screenshots/<run_id>/<name>
+        """
+        start = time.perf_counter()
+        screenshot = self._grab(driver.get_screenshot_as_png)
+        source = self._grab(lambda: driver.page_source)
+        console = self._grab(lambda: driver.get_log("browser"))
+        url = self._grab(lambda: driver.current_url)
+        self.capture_seconds += time.perf_counter() - start
+
+        artifact_name = self._unique_name(name)
+        info = dict(metadata or {}, name=name, url=url, run_id=self.run_id, captured_at=time.time())
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="artifacts")
+            self._futures.append(
+                self._executor.submit(self._write, artifact_name, screenshot, source, console, info)
+            )
+        return os.path.join(self.directory, artifact_name)
+
+    def _encode_screenshot(self, png):
+        if Image is None:
+            return png, ".png"
+        buffer = io.BytesIO()
+        with Image.open(io.BytesIO(png)) as image:
+            image.save(buffer, "WEBP", quality=self.webp_quality, method=4)
+        return buffer.getvalue(), ".webp"
+
+    @staticmethod
+    def _compress_text(data):
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=10).compress(data), ".zst"
+        return gzip.compress(data, compresslevel=6), ".gz"
+
+    def _write(self, name, screenshot, source, console, info):
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = os.path.join(self.directory, name)
+        files = []
+        if screenshot:
+            data, extension = self._encode_screenshot(screenshot)
+            files.append((f"{prefix}{extension}", data))
+        if source is not None:
+            data, extension = self._compress_text(source.encode("utf-8"))
+            files.append((f"{prefix}.html{extension}", data))
+        if console is not None:
+            data, extension = self._compress_text(json.dumps(console, indent=2).encode("utf-8"))
+            files.append((f"{prefix}.console.json{extension}", data))
+        info["files"] = [os.path.basename(path) for path, _ in files]
+        files.append((f"{prefix}.json", json.dumps(info, indent=2, default=str).encode("utf-8")))
+        for path, data in files:
+            with open(path, "wb") as file:
+                file.write(data)
+        return [path for path, _ in files]
+
+    def wait(self):
+        """
+        Wait for every queued artifact to be written and stop the thread pool
+
+        Returns:
+            list: Paths written during the run
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+            executor, self._executor = self._executor, None
+        for future in futures:
+            try:
+                self.written.extend(future.result())
+            except Exception as e:
+                # Encoder errors (Pillow, zstandard) must not abort the session summary
+                self.errors.append(f"{type(e).__name__}: {e}")
+        if executor is not None:
+            executor.shutdown(wait=True)
+        return self.written
+
+    def stats(self):
+        """Captured tests, written files, write errors and time spent grabbing artifacts"""
+        return {
+            "captured": len(self._names),
+            "files": len(self.written),
+            "errors": len(self.errors),
+            "capture_seconds": round(self.capture_seconds, 3),
+            "directory": self.directory,
+        }
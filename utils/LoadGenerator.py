@@ -0,0 +1,339 @@
+"""
+LoadGenerator - Concurrent virtual shoppers against the backend API
+Simulates N users with asyncio, each looping over a weighted journey
+(login, browse, add to cart, checkout), and records per-endpoint latency,
+throughput and errors
+
+aiohttp is an optional dependency: pip install aiohttp
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class EndpointStats:
+    """Latencies and outcomes of one endpoint"""
+
+    def __init__(self):
+        """Initialize EndpointStats"""
+        self.latencies = []
+        self.errors = {}
+
+    def record(self, seconds, error=None):
+        """
+        Add one request
+
+        Args:
+            seconds (float): Latency
+            error (str): Status code or exception name when the request failed
+        """
+        self.latencies.append(seconds)
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def summary(self, duration):
+        """
+        Aggregate the recorded requests
+
+        Args:
+            duration (float): Measured run time in seconds
+
+        Returns:
+            dict: Count, throughput, error rate and latency percentiles in ms
+        """
+        values = sorted(self.latencies)
+        failed = sum(self.errors.values())
+
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "requests": len(values),
+            "throughput_rps": round(len(values) / duration, 2) if duration else 0.0,
+            "error_rate": round(failed / len(values), 4) if values else 0.0,
+            "errors": dict(sorted(self.errors.items())),
+            "latency_ms": {
+                "min": ms(values[0] if values else None),
+                "p50": ms(percentile(values, 50)),
+                "p90": ms(percentile(values, 90)),
+                "p95": ms(percentile(values, 95)),
+                "p99": ms(percentile(values, 99)),
+                "max": ms(values[-1] if values else None),
+            },
+        }
+
+
+class VirtualUser:
+    """One simulated shopper with its own cookie-less session state"""
+
+    def __init__(self, generator, index, http):
+        self.generator = generator
+        self.index = index
+        self.http = http
+        self.token = None
+        self.products = []
+        self.username = None
+        self.password = None
+
+    async def call(self, method, path, json_body=None):
+        """Send one request and record it under 'METHOD path'"""
+        # /api/cart/42 and /api/cart/43 are reported together as /api/cart/:id
+        name = f"{method} " + "/".join(":id" if part.isdigit() else part for part in path.split("/"))
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        start = time.perf_counter()
+        error = None
+        payload = None
+        try:
+            async with self.http.request(method, f"{self.generator.base_url}{path}",
+                                         json=json_body, headers=headers) as response:
+                # Error pages may not be JSON; the status code is what gets recorded
+                if response.status >= 400:
+                    error = str(response.status)
+                    await response.read()
+                else:
+                    payload = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            error = type(e).__name__
+        self.generator.record(name, time.perf_counter() - start, error)
+        return payload if error is None else None
+
+    # -- journey steps ------------------------------------------------
+
+    async def login(self):
+        payload = await self.call("POST", "/api/login", {"username": self.username, "password": self.password})
+        self.token = payload["token"] if payload else None
+        return self.token is not None
+
+    async def browse(self):
+        payload = await self.call("GET", "/api/products")
+        if payload:
+            self.products = [p["product_id"] for p in payload]
+        return payload is not None
+
+    async def add_to_cart(self):
+        if not self.products and not await self.browse():
+            return False
+        for product_id in random.sample(self.products, k=min(len(self.products), random.randint(1, 3))):
+            if await self.call("POST", "/api/cart", {"productId": product_id, "quantity": 1}) is None:
+                return False
+        return await self.call("GET", "/api/cart") is not None
+
+    async def checkout(self):
+        if await self.call("POST", "/api/checkout") is None:
+            return False
+        return await self.call("GET", "/api/orders") is not None
+
+    async def run_journey(self, steps):
+        """Run the steps of a journey in order, stopping at the first failure"""
+        for step in steps:
+            if step == "login" and self.token:
+                continue
+            if not await getattr(self, step)():
+                return False
+            if self.generator.think_time:
+                await asyncio.sleep(random.uniform(0, self.generator.think_time))
+        return True
+
+
+class LoadGenerator:
+    """Runs virtual users with a ramp-up profile and collects endpoint statistics"""
+
+    JOURNEYS = {
+        "browse": ["browse"],
+        "shopper": ["login", "browse", "add_to_cart"],
+        "buyer": ["login", "browse", "add_to_cart", "checkout"],
+    }
+
+    def __init__(self, base_url, users=10, duration=60, ramp_up=0, ramp_steps=0,
+                 journeys=None, think_time=0.0, credentials=None, register_users=True, timeout=30):
+        """
+        Initialize LoadGenerator
+
+        Args:
+            base_url (str): Backend URL, e.g. http://localhost:3000
+            users (int): Number of concurrent virtual users
+            duration (float): Seconds every user keeps running journeys after ramp-up
+            ramp_up (float): Seconds over which users are started
+            ramp_steps (int): Start users in this many equal batches (0: one by one)
+            journeys (dict): Journey name to weight (default: {'buyer': 1})
+            think_time (float): Maximum random pause between steps, in seconds
+            credentials (tuple): (username, password) shared by every user
+            register_users (bool): Register one account per user before the run
+                (ignored when credentials are given)
+            timeout (float): Per-request timeout in seconds
+        """
+        if aiohttp is None:
+            raise RuntimeError("LoadGenerator requires aiohttp: pip install aiohttp")
+        self.base_url = base_url.rstrip('/')
+        self.users = users
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.ramp_steps = ramp_steps
+        self.journeys = journeys or {"buyer": 1}
+        unknown = set(self.journeys) - set(self.JOURNEYS)
+        if unknown:
+            raise ValueError(f"Unknown journeys: {sorted(unknown)}; available: {sorted(self.JOURNEYS)}")
+        self.think_time = think_time
+        self.credentials = credentials
+        self.register_users = register_users and credentials is None
+        self.timeout = timeout
+        self.run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.stats = {}
+        self.journey_stats = {}
+        self.elapsed = 0.0
+        self.registration_failures = 0
+        self._recording = False
+
+    def record(self, name, seconds, error=None):
+        """Record a request made during the measured phase"""
+        if self._recording:
+            self.stats.setdefault(name, EndpointStats()).record(seconds, error)
+
+    def start_delay(self, index):
+        """Seconds after the run start at which a user begins"""
+        if not self.ramp_up or self.users <= 1:
+            return 0.0
+        if self.ramp_steps:
+            step = index * self.ramp_steps // self.users
+            return self.ramp_up * step / self.ramp_steps
+        return self.ramp_up * index / self.users
+
+    async def _prepare_user(self, user):
+        """Set the user's credentials; returns False when registering the account failed"""
+        if self.credentials:
+            user.username, user.password = self.credentials
+            return True
+        if not self.register_users:
+            user.username, user.password = "user", "User@123"
+            return True
+        user.username = f"load_{self.run_id}_{user.index}".replace("-", "_")
+        user.password = "Load@123"
+        payload = await user.call("POST", "/api/register", {
+            "firstName": "Load", "lastName": f"User{user.index}", "email": f"{user.username}@example.com",
+            "age": 30, "username": user.username, "password": user.password,
+        })
+        return payload is not None
+
+    async def _user_loop(self, user, deadline):
+        names = list(self.journeys)
+        weights = [self.journeys[n] for n in names]
+        while time.perf_counter() < deadline:
+            journey = random.choices(names, weights)[0]
+            start = time.perf_counter()
+            ok = await user.run_journey(self.JOURNEYS[journey])
+            entry = self.journey_stats.setdefault(journey, EndpointStats())
+            entry.record(time.perf_counter() - start, None if ok else "failed")
+
+    async def run(self):
+        """
+        Execute the load test
+
+        Returns:
+            dict: Run report (see report())
+        """
+        connector = aiohttp.TCPConnector(limit=0)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+            users = [VirtualUser(self, i, http) for i in range(self.users)]
+            prepared = await asyncio.gather(*(self._prepare_user(user) for user in users))
+            # Users without an account would only add login errors caused by registration
+            self.registration_failures = prepared.count(False)
+            users = [user for user, ok in zip(users, prepared) if ok]
+
+            self._recording = True
+            started = time.perf_counter()
+
+            async def start_user(user):
+                await asyncio.sleep(self.start_delay(user.index))
+                await self._user_loop(user, started + self.ramp_up + self.duration)
+
+            await asyncio.gather(*(start_user(user) for user in users))
+            self._recording = False
+            self.elapsed = time.perf_counter() - started
+        return self.report()
+
+    def report(self):
+        """
+        Build the run report
+
+        Returns:
+            dict: Run configuration and per-endpoint / per-journey summaries
+        """
+        all_requests = EndpointStats()
+        for stats in self.stats.values():
+            all_requests.latencies.extend(stats.latencies)
+            for error, count in stats.errors.items():
+                all_requests.errors[error] = all_requests.errors.get(error, 0) + count
+        return {
+            "run_id": self.run_id,
+            "base_url": self.base_url,
+            "config": {
+                "users": self.users, "duration": self.duration, "ramp_up": self.ramp_up,
+                "ramp_steps": self.ramp_steps, "journeys": self.journeys, "think_time": self.think_time,
+            },
+            "elapsed_seconds": round(self.elapsed, 2),
+            "registration_failures": self.registration_failures,
+            "total": all_requests.summary(self.elapsed),
+            "endpoints": {name: s.summary(self.elapsed) for name, s in sorted(self.stats.items())},
+            "journeys": {name: s.summary(self.elapsed) for name, s in sorted(self.journey_stats.items())},
+        }
+
+    @staticmethod
+    def save_report(report, directory=os.path.join("test_results", "load")):
+        """
+        Write a report as JSON named after its run ID
+
+        Returns:
+            str: Path of the written file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"load_{report['run_id']}.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        return path
+
+    @staticmethod
+    def compare(report, baseline):
+        """
+        Compare a report with a baseline report
+
+        Returns:
+            dict: Endpoint name to p50/p95 latency, throughput and error rate deltas
+        """
+        deltas = {}
+        for name, current in report["endpoints"].items():
+            previous = baseline.get("endpoints", {}).get(name)
+            if previous is None:
+                continue
+
+            def change(new, old):
+                if new is None or old is None:
+                    return None
+                return round(new - old, 2)
+
+            deltas[name] = {
+                "p50_ms": change(current["latency_ms"]["p50"], previous["latency_ms"]["p50"]),
+                "p95_ms": change(current["latency_ms"]["p95"], previous["latency_ms"]["p95"]),
+                "throughput_rps": change(current["throughput_rps"], previous["throughput_rps"]),
+                "error_rate": change(current["error_rate"], previous["error_rate"]),
+            }
+        return deltas
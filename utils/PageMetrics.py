@@ -0,0 +1,141 @@
+"""
+PageMetrics - Front-end load metrics captured from the browser
+Reads Navigation Timing, Resource Timing and Paint Timing after a navigation
+and keeps a per-page history across runs in test_results/page_metrics.jsonl
+"""
+
+import json
+import os
+import time
+import uuid
+from statistics import median
+
+
+class PageMetricsCollector:
+    """Collects load metrics per navigation and persists them per page per run"""
+
+    HISTORY_FILE = os.path.join("test_results", "page_metrics.jsonl")
+
+    # One round trip; times are milliseconds relative to navigation start.
+    # transferSize/encodedBodySize are 0 for file:// URLs and for cross-origin
+    # resources without Timing-Allow-Origin, so byte counts need an HTTP base URL.
+    METRICS_SCRIPT = """
+        var nav = performance.getEntriesByType('navigation')[0];
+        var timing = performance.timing;
+        var result = {};
+        if (nav) {
+            result.ttfb = nav.responseStart - nav.requestStart;
+            result.dom_content_loaded = nav.domContentLoadedEventEnd;
+            result.load = nav.loadEventEnd;
+            result.document_bytes = nav.transferSize || nav.encodedBodySize || 0;
+        } else {
+            result.ttfb = timing.responseStart - timing.requestStart;
+            result.dom_content_loaded = timing.domContentLoadedEventEnd - timing.navigationStart;
+            result.load = timing.loadEventEnd - timing.navigationStart;
+            result.document_bytes = 0;
+        }
+        performance.getEntriesByType('paint').forEach(function (entry) {
+            result[entry.name.replace(/-/g, '_')] = entry.startTime;
+        });
+        var resources = performance.getEntriesByType('resource');
+        var largest = null, imageBytes = 0, imageCount = 0, totalBytes = 0;
+        resources.forEach(function (entry) {
+            var bytes = entry.transferSize || entry.encodedBodySize || 0;
+            totalBytes += bytes;
+            if (!largest || bytes > largest.bytes || (bytes === largest.bytes && entry.duration > largest.duration)) {
+                largest = {name: entry.name, bytes: bytes, duration: entry.duration};
+            }
+            if (entry.initiatorType === 'img' || entry.name.indexOf('/assets/') !== -1) {
+                imageBytes += bytes;
+                imageCount += 1;
+            }
+        });
+        result.resource_count = resources.length;
+        result.resource_bytes = totalBytes;
+        result.largest_resource = largest;
+        result.image_count = imageCount;
+        result.image_bytes = imageBytes;
+        return result;
+    """
+
+    def __init__(self, history_file=HISTORY_FILE, run_id=None):
+        """
+        Initialize PageMetricsCollector
+
+        Args:
+            history_file (str): JSON Lines file the samples are appended to
+            run_id (str): Identifier of this run (default: timestamp + random suffix)
+        """
+        self.history_file = history_file
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.samples = []
+        self._saved = 0
+
+    def collect(self, driver, page):
+        """
+        Capture the load metrics of the page the driver just navigated to
+
+        Args:
+            driver: WebDriver instance
+            page (str): Page name (e.g. the page object class)
+
+        Returns:
+            dict: The recorded sample, or None if the browser exposed no timing data
+        """
+        try:
+            metrics = driver.execute_script(self.METRICS_SCRIPT)
+        except Exception:
+            return None
+        url = driver.current_url
+        sample = {
+            "run_id": self.run_id,
+            "timestamp": time.time(),
+            "page": page,
+            "path": url.split("?")[0].rsplit("/", 1)[-1],
+            "url": url,
+            "metrics": metrics,
+        }
+        self.samples.append(sample)
+        return sample
+
+    def summarize(self):
+        """
+        Aggregate this run's samples per page
+
+        Returns:
+            dict: Mapping of page path to median metrics and navigation count
+        """
+        pages = {}
+        for sample in self.samples:
+            pages.setdefault(sample["path"], []).append(sample["metrics"])
+        summary = {}
+        for path, metrics in pages.items():
+            keys = [k for k, v in metrics[0].items() if isinstance(v, (int, float))]
+            summary[path] = {"navigations": len(metrics)}
+            for key in keys:
+                values = [m[key] for m in metrics if isinstance(m.get(key), (int, float))]
+                summary[path][key] = round(median(values), 1) if values else None
+        return summary
+
+    def save(self):
+        """Append the samples not yet saved to the history file"""
+        if self._saved == len(self.samples):
+            return
+        os.makedirs(os.path.dirname(self.history_file) or ".", exist_ok=True)
+        with open(self.history_file, "a", encoding="utf-8") as file:
+            for sample in self.samples[self._saved:]:
+                file.write(json.dumps(sample) + "\n")
+        self._saved = len(self.samples)
+
+    @staticmethod
+    def load_history(history_file=HISTORY_FILE):
+        """
+        Read every recorded sample, e.g. to chart a page's load time across runs
+
+        Returns:
+            list: Samples in recording order
+        """
+        if not os.path.exists(history_file):
+            return []
+        with open(history_file, "r", encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
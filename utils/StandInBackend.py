@@ -0,0 +1,385 @@
+"""
+StandInBackend - In-process stand-in for backend/server.js
+Implements the same /api/* contract on an in-memory store seeded like
+initDb(), and serves the website/ folder like the Express static middleware,
+so admin and checkout flows run on one machine without Node.js or MySQL
+
+Run standalone:
+    python -m utils.StandInBackend --port 3000
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from utils.StaticSiteServer import WEBSITE_DIR, StaticSiteRequestHandler, StaticSiteServer
+
+DEMO_USERS = [
+    {"username": "admin", "password": "Admin@123", "firstName": "Admin", "lastName": "User",
+     "email": "admin@example.com", "age": 30, "role": "admin"},
+    {"username": "user", "password": "User@123", "firstName": "Demo", "lastName": "User",
+     "email": "user@example.com", "age": 25, "role": "user"},
+]
+
+DEMO_PRODUCTS = [
+    {"name": "Silver Necklace", "category": "Neckwear", "price": 49.99, "stock": 120, "description": "Elegant sterling silver necklace"},
+    {"name": "Gold Ring", "category": "Rings", "price": 199.99, "stock": 40, "description": "Solid 14k gold wedding band"},
+    {"name": "Diamond Earrings", "category": "Earrings", "price": 499.99, "stock": 20, "description": "Sparkling diamond studs"},
+    {"name": "Pearl Bracelet", "category": "Bracelets", "price": 79.99, "stock": 75, "description": "Classic freshwater pearl bracelet"},
+    {"name": "Ruby Pendant", "category": "Neckwear", "price": 299.99, "stock": 35, "description": "Heart-shaped ruby pendant"},
+    {"name": "Sapphire Studs", "category": "Earrings", "price": 349.99, "stock": 50, "description": "Blue sapphire stud earrings"},
+    {"name": "Leather Watch", "category": "Watches", "price": 129.99, "stock": 60, "description": "Men's leather strap watch"},
+]
+
+
+def _now():
+    # mysql2 serializes TIMESTAMP columns as ISO strings
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _decimal(value):
+    # mysql2 serializes DECIMAL(10,2) columns as strings
+    return None if value is None else f"{float(value):.2f}"
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _unb64(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class InMemoryStore:
+    """Tables of jewelry_store_db kept in dictionaries, guarded by one lock"""
+
+    def __init__(self, secret=None):
+        """
+        Initialize InMemoryStore with the demo users and products
+
+        Args:
+            secret (str): JWT signing secret (default: JWT_SECRET, as the backend)
+        """
+        self.secret = (secret or os.getenv("JWT_SECRET", "your-secret-key")).encode("utf-8")
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop every row and seed the demo data again"""
+        with self.lock:
+            self.users, self.products, self.cart = {}, {}, {}
+            self.orders, self.order_details = {}, {}
+            self._ids = {"users": 0, "products": 0, "cart": 0, "orders": 0, "order_details": 0}
+        for user in DEMO_USERS:
+            self.add_user(**user)
+        for product in DEMO_PRODUCTS:
+            self.add_product(**product)
+
+    def _next_id(self, table):
+        self._ids[table] += 1
+        return self._ids[table]
+
+    # -- passwords and tokens -----------------------------------------
+
+    @staticmethod
+    def hash_password(password, salt=None):
+        salt = salt or secrets.token_hex(8)
+        return f"{salt}${hashlib.sha256((salt + password).encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    def check_password(cls, password, hashed):
+        salt = hashed.split("$", 1)[0]
+        return hmac.compare_digest(cls.hash_password(password, salt), hashed)
+
+    def sign_token(self, payload):
+        """Create an HS256 JWT like jsonwebtoken.sign"""
+        header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+        body = _b64(json.dumps({**payload, "iat": int(time.time())}, separators=(",", ":")).encode())
+        signature = _b64(hmac.new(self.secret, f"{header}.{body}".encode(), hashlib.sha256).digest())
+        return f"{header}.{body}.{signature}"
+
+    def verify_token(self, token):
+        """Return the JWT payload, or None if the token is malformed or forged"""
+        try:
+            header, body, signature = token.split(".")
+            expected = _b64(hmac.new(self.secret, f"{header}.{body}".encode(), hashlib.sha256).digest())
+            if not hmac.compare_digest(expected, signature):
+                return None
+            return json.loads(_unb64(body))
+        except (ValueError, TypeError):
+            return None
+
+    # -- rows ---------------------------------------------------------
+
+    def add_user(self, username, password, firstName, lastName, email, age=None, role="user"):
+        """Insert a user; raises ValueError on a missing field or duplicate username/email"""
+        if not all(isinstance(v, str) and v for v in (username, password, firstName, lastName, email)):
+            raise ValueError("Missing required user field")
+        with self.lock:
+            if any(u["username"] == username or u["email"] == email for u in self.users.values()):
+                raise ValueError("Duplicate entry")
+            user_id = self._next_id("users")
+            self.users[user_id] = {
+                "user_id": user_id, "firstName": firstName, "lastName": lastName, "email": email,
+                "age": age, "username": username, "password": self.hash_password(password),
+                "role": role, "created_at": _now(),
+            }
+        return user_id
+
+    def add_product(self, name, price, stock, category=None, description=None):
+        """Insert a product; raises ValueError on a missing name, price or stock"""
+        if not name or price is None or stock is None:
+            raise ValueError("Missing required product field")
+        with self.lock:
+            product_id = self._next_id("products")
+            self.products[product_id] = {
+                "product_id": product_id, "name": name, "category": category, "price": float(price),
+                "stock": int(stock), "description": description, "created_at": _now(),
+            }
+        return product_id
+
+
+class StandInRequestHandler(StaticSiteRequestHandler):
+    """Routes /api/* to the store and everything else to website/"""
+
+    server_version = "StandInBackend/1.0"
+    store = None
+    ROUTES = [
+        ("POST", re.compile(r"^/api/register$"), "register"),
+        ("POST", re.compile(r"^/api/login$"), "login"),
+        ("GET", re.compile(r"^/api/products$"), "get_products"),
+        ("POST", re.compile(r"^/api/products$"), "add_product"),
+        ("GET", re.compile(r"^/api/cart$"), "get_cart"),
+        ("POST", re.compile(r"^/api/cart$"), "add_to_cart"),
+        ("PUT", re.compile(r"^/api/cart/(?P<id>[^/]+)$"), "update_cart"),
+        ("DELETE", re.compile(r"^/api/cart/(?P<id>[^/]+)$"), "remove_from_cart"),
+        ("POST", re.compile(r"^/api/checkout$"), "checkout"),
+        ("GET", re.compile(r"^/api/orders$"), "get_orders"),
+    ]
+    AUTHENTICATED = {"add_product", "get_cart", "add_to_cart", "update_cart", "remove_from_cart", "checkout", "get_orders"}
+
+    def end_headers(self):
+        # cors() middleware of the backend
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    # -- dispatch -----------------------------------------------------
+
+    def do_GET(self):
+        if not self._dispatch("GET"):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._dispatch("HEAD"):
+            super().do_HEAD()
+
+    def do_POST(self):
+        if not self._dispatch("POST"):
+            self._send_json(404, {"error": "Not found"})
+
+    def do_PUT(self):
+        if not self._dispatch("PUT"):
+            self._send_json(404, {"error": "Not found"})
+
+    def do_DELETE(self):
+        if not self._dispatch("DELETE"):
+            self._send_json(404, {"error": "Not found"})
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Methods", "GET,HEAD,PUT,PATCH,POST,DELETE")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _dispatch(self, method):
+        # Drain the body first so an early error answer keeps the keep-alive connection in sync
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlsplit(self.path).path
+        if not path.startswith("/api/"):
+            return False
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            self._send_json(404, {"error": "Not found"})
+            return True
+
+        user = None
+        if name in self.AUTHENTICATED:
+            auth = self.headers.get("Authorization") or ""
+            token = auth.split(" ")[1] if " " in auth else None
+            if not token:
+                self._send_json(401, {"error": "Access token required"})
+                return True
+            user = self.store.verify_token(token)
+            if user is None:
+                self._send_json(403, {"error": "Invalid token"})
+                return True
+
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            self._send_json(400, {"error": "Invalid JSON"})
+            return True
+        if not isinstance(body, dict):
+            body = {}
+        status, payload = getattr(self, f"api_{name}")(body, user, **match.groupdict())
+        self._send_json(status, payload)
+        return True
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    # -- endpoints ----------------------------------------------------
+
+    def api_register(self, body, user):
+        try:
+            user_id = self.store.add_user(
+                body.get("username"), body.get("password"), body.get("firstName"),
+                body.get("lastName"), body.get("email"), body.get("age"),
+            )
+        except ValueError:
+            return 500, {"error": "Registration failed"}
+        return 201, {"message": "User registered", "userId": user_id}
+
+    def api_login(self, body, user):
+        username, password = body.get("username"), body.get("password")
+        with self.store.lock:
+            found = next((u for u in self.store.users.values() if u["username"] == username), None)
+        if found is None or not isinstance(password, str) or not self.store.check_password(password, found["password"]):
+            return 401, {"error": "Invalid credentials"}
+        token = self.store.sign_token({"userId": found["user_id"], "username": found["username"], "role": found["role"]})
+        return 200, {"token": token, "user": {"userId": found["user_id"], "username": found["username"], "role": found["role"]}}
+
+    def api_get_products(self, body, user):
+        with self.store.lock:
+            rows = [dict(p, price=_decimal(p["price"])) for p in self.store.products.values()]
+        return 200, rows
+
+    def api_add_product(self, body, user):
+        if user.get("role") != "admin":
+            return 403, {"error": "Admin required"}
+        try:
+            product_id = self.store.add_product(
+                body.get("name"), body.get("price"), body.get("stock"), body.get("category"), body.get("description"),
+            )
+        except (ValueError, TypeError):
+            return 500, {"error": "Database error"}
+        return 201, {"message": "Product added", "productId": product_id}
+
+    def api_get_cart(self, body, user):
+        store = self.store
+        with store.lock:
+            rows = [
+                dict(item, name=store.products[item["product_id"]]["name"],
+                     price=_decimal(store.products[item["product_id"]]["price"]))
+                for item in store.cart.values()
+                if item["user_id"] == user["userId"] and item["product_id"] in store.products
+            ]
+        return 200, rows
+
+    def api_add_to_cart(self, body, user):
+        product_id, quantity = body.get("productId"), body.get("quantity", 1)
+        with self.store.lock:
+            # Foreign key on cart.product_id
+            if product_id not in self.store.products:
+                return 500, {"error": "Database error"}
+            cart_id = self.store._next_id("cart")
+            self.store.cart[cart_id] = {
+                "cart_id": cart_id, "user_id": user["userId"], "product_id": product_id, "quantity": quantity,
+            }
+        return 201, {"message": "Item added to cart"}
+
+    def api_update_cart(self, body, user, id):
+        with self.store.lock:
+            item = self.store.cart.get(int(id)) if id.isdigit() else None
+            if item is not None and item["user_id"] == user["userId"]:
+                item["quantity"] = body.get("quantity")
+        return 200, {"message": "Cart updated"}
+
+    def api_remove_from_cart(self, body, user, id):
+        with self.store.lock:
+            item = self.store.cart.get(int(id)) if id.isdigit() else None
+            if item is not None and item["user_id"] == user["userId"]:
+                del self.store.cart[item["cart_id"]]
+        return 200, {"message": "Item removed from cart"}
+
+    def api_checkout(self, body, user):
+        store = self.store
+        with store.lock:
+            items = [item for item in store.cart.values() if item["user_id"] == user["userId"]]
+            if not items:
+                return 400, {"error": "Cart is empty"}
+            # Priced from the products table (the backend's cart rows carry no price)
+            total = sum((item["quantity"] or 0) * store.products[item["product_id"]]["price"] for item in items)
+            order_id = store._next_id("orders")
+            store.orders[order_id] = {
+                "order_id": order_id, "user_id": user["userId"], "total": round(total, 2),
+                "status": "pending", "created_at": _now(),
+            }
+            for item in items:
+                detail_id = store._next_id("order_details")
+                store.order_details[detail_id] = {
+                    "detail_id": detail_id, "order_id": order_id, "product_id": item["product_id"],
+                    "quantity": item["quantity"], "price": store.products[item["product_id"]]["price"],
+                }
+                del store.cart[item["cart_id"]]
+        return 200, {"message": "Checkout successful", "orderId": order_id}
+
+    def api_get_orders(self, body, user):
+        with self.store.lock:
+            rows = [dict(o, total=_decimal(o["total"])) for o in self.store.orders.values()
+                    if o["user_id"] == user["userId"]]
+        return 200, rows
+
+
+class StandInBackend(StaticSiteServer):
+    """Threaded HTTP server running the stand-in API and static website"""
+
+    handler_class = StandInRequestHandler
+
+    def __init__(self, host="127.0.0.1", port=0, website_dir=WEBSITE_DIR, store=None, **kwargs):
+        """
+        Initialize StandInBackend
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0: any free port)
+            website_dir (str): Folder served for non-API paths
+            store (InMemoryStore): Store to serve (default: a freshly seeded one)
+            **kwargs: gzip / max_age of StaticSiteServer
+        """
+        self.store = store or InMemoryStore()
+        super().__init__(host, port, website_dir, **kwargs)
+
+    def handler_attributes(self):
+        return {"store": self.store}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the in-memory stand-in for backend/server.js")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "3000")), help="Port to bind")
+    options = parser.parse_args()
+
+    backend = StandInBackend(options.host, options.port)
+    print(f"Stand-in backend listening on {backend.url}")
+    backend.serve_forever()
@@ -0,0 +1,198 @@
+"""
+StaticSiteServer - Threaded local HTTP server for the website/ folder
+Gives page objects real HTTP semantics instead of file:// URLs: keep-alive
+connections, ETag/Last-Modified revalidation, Cache-Control so repeat
+navigations hit the browser cache, and optional gzip
+
+Run standalone:
+    python -m utils.StaticSiteServer --port 8000
+"""
+
+import gzip
+import io
+import os
+import threading
+from email.utils import formatdate
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+WEBSITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "website")
+
+# Content types worth compressing; images and fonts are already compressed
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+GZIP_MIN_SIZE = 1024
+
+
+@lru_cache(maxsize=256)
+def _gzip_file(path, mtime_ns, size):
+    # mtime_ns and size are part of the cache key, so edited files are recompressed
+    with open(path, "rb") as file:
+        return gzip.compress(file.read(), compresslevel=6, mtime=0)
+
+
+class StaticSiteRequestHandler(SimpleHTTPRequestHandler):
+    """Serves website/ at / and /website/ with caching headers and gzip"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "StaticSiteServer/1.0"
+    gzip = True
+    max_age = 3600
+
+    def __init__(self, *args, directory=None, **kwargs):
+        super().__init__(*args, directory=directory or WEBSITE_DIR, **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def translate_path(self, path):
+        # Page objects use /website/<page>; the site is also served at /<page> like Express static
+        parts = urlsplit(path)
+        if parts.path == "/website" or parts.path.startswith("/website/"):
+            path = parts.path[len("/website"):] or "/"
+        return super().translate_path(path)
+
+    def cache_control(self, content_type):
+        """HTML is revalidated on every navigation, assets are cached for max_age seconds"""
+        if content_type.startswith("text/html") or not self.max_age:
+            return "no-cache"
+        return f"public, max-age={self.max_age}"
+
+    def _accepts_gzip(self):
+        encodings = self.headers.get("Accept-Encoding", "")
+        return any(part.split(";")[0].strip() == "gzip" for part in encodings.split(","))
+
+    def _etag_matches(self, etag):
+        candidates = [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+        return "*" in candidates or etag in candidates
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not urlsplit(self.path).path.endswith("/") or not os.path.isfile(index):
+                # Redirects, directory listings and 404s stay with the base class
+                return super().send_head()
+            path = index
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return super().send_head()
+
+        content_type = self.guess_type(path)
+        compress = (self.gzip and stat.st_size >= GZIP_MIN_SIZE
+                    and content_type.startswith(COMPRESSIBLE_TYPES) and self._accepts_gzip())
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-gz" if compress else ""}"'
+
+        if self._etag_matches(etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(etag, stat, content_type)
+            self.end_headers()
+            return None
+
+        if compress:
+            body = io.BytesIO(_gzip_file(path, stat.st_mtime_ns, stat.st_size))
+            length = len(body.getbuffer())
+        else:
+            try:
+                body = open(path, "rb")
+            except OSError:
+                self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+                return None
+            length = stat.st_size
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(length))
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self._send_cache_headers(etag, stat, content_type)
+        self.end_headers()
+        return body
+
+    def _send_cache_headers(self, etag, stat, content_type):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("Cache-Control", self.cache_control(content_type))
+        if self.gzip:
+            self.send_header("Vary", "Accept-Encoding")
+
+
+class StaticSiteServer:
+    """Threaded HTTP server for website/, startable in a background thread"""
+
+    handler_class = StaticSiteRequestHandler
+
+    def __init__(self, host="127.0.0.1", port=0, website_dir=WEBSITE_DIR, gzip=True, max_age=3600):
+        """
+        Initialize StaticSiteServer
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0: any free port)
+            website_dir (str): Folder to serve
+            gzip (bool): Compress text responses for clients that accept gzip
+            max_age (int): Cache lifetime of non-HTML assets in seconds (0: always revalidate)
+        """
+        handler = type(f"Bound{self.handler_class.__name__}", (self.handler_class,),
+                       {"gzip": gzip, "max_age": max_age, **self.handler_attributes()})
+        self.server = ThreadingHTTPServer(
+            (host, port), lambda *args, **kwargs: handler(*args, directory=website_dir, **kwargs)
+        )
+        self.server.daemon_threads = True
+        self._thread = None
+
+    def handler_attributes(self):
+        """Extra class attributes for the request handler of this server"""
+        return {}
+
+    @property
+    def url(self):
+        """Base URL of the running server"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread; returns self"""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted"""
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve website/ over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind")
+    parser.add_argument("--max-age", type=int, default=3600, help="Cache lifetime of assets in seconds")
+    parser.add_argument("--no-gzip", action="store_true", help="Disable gzip compression")
+    options = parser.parse_args()
+
+    site = StaticSiteServer(options.host, options.port, gzip=not options.no_gzip, max_age=options.max_age)
+    print(f"Serving {WEBSITE_DIR} on {site.url}")
+    site.serve_forever()
@@ -0,0 +1,50 @@
+"""
+SuiteScheduler - Longest-processing-time scheduling of tests across workers
+Orders tests slowest-first and packs them onto the least loaded worker so long
+tests start early instead of becoming the tail of the run
+"""
+
+import heapq
+
+
+class SuiteScheduler:
+    """Scheduling helpers driven by expected per-test durations"""
+
+    @staticmethod
+    def order_slowest_first(node_ids, estimates):
+        """
+        Order tests by expected duration, slowest first
+
+        Args:
+            node_ids (list): Pytest node IDs
+            estimates (dict): Mapping of node ID to expected duration in seconds
+
+        Returns:
+            list: Node IDs sorted slowest-first (ties keep collection order)
+        """
+        return sorted(node_ids, key=lambda n: -estimates.get(n, 0.0))
+
+    @staticmethod
+    def lpt_schedule(node_ids, workers, estimates):
+        """
+        Pack tests into workers with the LPT (longest processing time) algorithm
+
+        Args:
+            node_ids (list): Pytest node IDs
+            workers (int): Number of workers
+            estimates (dict): Mapping of node ID to expected duration in seconds
+
+        Returns:
+            list: One dict per non-empty worker with 'node_ids' (slowest-first)
+            and 'expected' (sum of expected durations)
+        """
+        shards = [{"node_ids": [], "expected": 0.0} for _ in range(max(1, workers))]
+        # Ties on expected load go to the worker with fewer tests, so tests
+        # without estimates are still spread across workers
+        heap = [(0.0, 0, index) for index in range(len(shards))]
+        for node_id in SuiteScheduler.order_slowest_first(node_ids, estimates):
+            load, count, index = heapq.heappop(heap)
+            shards[index]["node_ids"].append(node_id)
+            shards[index]["expected"] = load + estimates.get(node_id, 0.0)
+            heapq.heappush(heap, (shards[index]["expected"], count + 1, index))
+        return [s for s in shards if s["node_ids"]]
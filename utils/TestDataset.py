@@ -0,0 +1,361 @@
+"""
+TestDataset - Columnar, typed container for data-driven test data
+Stores each column as one compact array (typed numbers/booleans, dictionary
+encoded strings), filters by scanning only the columns involved and turns rows
+into pytest.param objects with stable IDs
+"""
+
+import hashlib
+import re
+from array import array
+
+from utils.ExcelUtility import ExcelUtility
+
+
+TRUE_VALUES = {"true", "1", "yes", "y", "success", "pass", "passed", "valid"}
+FALSE_VALUES = {"false", "0", "no", "n", "fail", "failed", "failure", "invalid"}
+
+
+def parse_bool(value):
+    """
+    Convert a cell value to bool
+
+    Args:
+        value: Cell value ('success'/'fail', 'true'/'false', 1/0, ...)
+
+    Returns:
+        bool: Parsed value, or None for empty cells
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"Cannot interpret {value!r} as a boolean")
+
+
+def _parse_number(kind):
+    def parse(value):
+        if value is None or value == "":
+            return None
+        return kind(value)
+    return parse
+
+
+def _parse_str(value):
+    return "" if value is None else str(value)
+
+
+PARSERS = {
+    bool: parse_bool,
+    int: _parse_number(int),
+    float: _parse_number(float),
+    str: _parse_str,
+}
+
+# array typecodes for columns without missing values
+TYPECODES = {bool: "b", int: "q", float: "d"}
+
+
+class _Column:
+    """One column: typed array, dictionary-encoded strings or a plain list"""
+
+    __slots__ = ("data", "categories", "kind")
+
+    def __init__(self, data, categories=None, kind=None):
+        self.data = data
+        self.categories = categories
+        self.kind = kind
+
+    @classmethod
+    def build(cls, values, kind=None):
+        values = list(values)
+        if kind in TYPECODES and None not in values:
+            return cls(array(TYPECODES[kind], values), kind=kind)
+        if kind in (None, str):
+            codes = {}
+            encoded = array("I", (codes.setdefault(v, len(codes)) for v in values))
+            if len(codes) <= max(len(values) // 2, 1):
+                return cls(encoded, list(codes), kind)
+        return cls(values, kind=kind)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        value = self.data[index]
+        if self.categories is not None:
+            return self.categories[value]
+        if self.kind is bool and isinstance(value, int):
+            return bool(value)
+        return value
+
+    def to_list(self):
+        if self.categories is not None:
+            return [self.categories[code] for code in self.data]
+        if self.kind is bool:
+            return [bool(v) if v is not None else None for v in self.data]
+        return list(self.data)
+
+    def matching(self, predicate):
+        """Indexes of the values for which predicate(value) is true"""
+        if self.categories is not None:
+            # Evaluate the predicate once per distinct value
+            accepted = {code for code, value in enumerate(self.categories) if predicate(value)}
+            return [i for i, code in enumerate(self.data) if code in accepted]
+        if self.kind is bool:
+            accepted = {v for v in (True, False, None) if predicate(v)}
+            return [i for i, v in enumerate(self.data) if (bool(v) if v is not None else None) in accepted]
+        return [i for i, v in enumerate(self.data) if predicate(v)]
+
+    def take(self, indexes):
+        data = self.data
+        if isinstance(data, array):
+            taken = array(data.typecode, (data[i] for i in indexes))
+        else:
+            taken = [data[i] for i in indexes]
+        return _Column(taken, self.categories, self.kind)
+
+
+class TestDataset:
+    """Column-oriented, typed test data that feeds pytest.mark.parametrize"""
+
+    # Not a test class, despite the name
+    __test__ = False
+
+    def __init__(self, columns, types=None, id_column=None):
+        """
+        Initialize TestDataset
+
+        Args:
+            columns (dict): Mapping of column name to its values
+            types (dict): Column name to type (bool, int, float, str or a
+                parser callable); undeclared columns are kept as read
+            id_column (str): Column whose values name the parametrized tests
+                (default: a hash of the row content)
+        """
+        types = types or {}
+        unknown = set(types) - set(columns)
+        if unknown:
+            raise ValueError(f"Types declared for unknown columns: {sorted(unknown)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        if id_column is not None and id_column not in columns:
+            raise ValueError(f"id_column {id_column!r} is not a column")
+
+        self.id_column = id_column
+        self._ids = None
+        self._columns = {}
+        for name, values in columns.items():
+            if isinstance(values, _Column):
+                self._columns[name] = values
+                continue
+            kind = types.get(name)
+            parser = PARSERS.get(kind, kind)
+            if parser is not None:
+                values = [parser(v) for v in values]
+            self._columns[name] = _Column.build(values, kind if kind in PARSERS else None)
+        self._length = lengths.pop() if lengths else 0
+
+    # -- construction -------------------------------------------------
+
+    @classmethod
+    def from_table(cls, headers, rows, types=None, id_column=None):
+        """
+        Build a dataset from a header list and row tuples
+
+        Args:
+            headers (list): Column names
+            rows (list): Row tuples in header order
+            types (dict): Column types (see __init__)
+            id_column (str): Column used for test IDs
+
+        Returns:
+            TestDataset: The dataset
+        """
+        columns = list(zip(*rows)) if rows else [()] * len(headers)
+        return cls(dict(zip(headers, columns)), types, id_column)
+
+    @classmethod
+    def from_csv(cls, file_path, types=None, id_column=None):
+        """
+        Load a CSV file through the parsed test-data cache
+
+        Args:
+            file_path (str): Path to the CSV file
+            types (dict): Column types (see __init__)
+            id_column (str): Column used for test IDs
+
+        Returns:
+            TestDataset: The dataset
+        """
+        headers, rows = ExcelUtility.read_csv_table(file_path)
+        return cls.from_table(headers, rows, types, id_column)
+
+    @classmethod
+    def from_excel(cls, file_path, sheet_name=None, types=None, id_column=None):
+        """
+        Load an Excel sheet through the parsed test-data cache
+
+        Args:
+            file_path (str): Path to the Excel file
+            sheet_name (str): Name of the sheet to read (default: first sheet)
+            types (dict): Column types (see __init__)
+            id_column (str): Column used for test IDs
+
+        Returns:
+            TestDataset: The dataset
+        """
+        headers, rows = ExcelUtility.read_excel_table(file_path, sheet_name)
+        return cls.from_table(headers, rows, types, id_column)
+
+    # -- access -------------------------------------------------------
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("TestDataset index out of range")
+        return {name: column[index] for name, column in self._columns.items()}
+
+    def __repr__(self):
+        return f"TestDataset({self._length} rows, columns={self.columns})"
+
+    @property
+    def columns(self):
+        """Column names in order"""
+        return list(self._columns)
+
+    def column(self, name):
+        """
+        Get the values of one column
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            list: Column values
+        """
+        return self._columns[name].to_list()
+
+    # -- selection ----------------------------------------------------
+
+    def where(self, **conditions):
+        """
+        Select the rows matching every condition
+
+        A condition is a value to compare with (``expected_result=False``) or a
+        predicate on the column value (``age=lambda a: a >= 18``). Each column
+        is scanned once; string columns evaluate the predicate once per
+        distinct value.
+
+        Returns:
+            TestDataset: The matching rows
+        """
+        selected = None
+        for name, condition in conditions.items():
+            if name not in self._columns:
+                raise KeyError(f"Unknown column: {name}")
+            predicate = condition if callable(condition) else (lambda v, expected=condition: v == expected)
+            matching = self._columns[name].matching(predicate)
+            selected = matching if selected is None else sorted(set(selected).intersection(matching))
+        return self if selected is None else self.take(selected)
+
+    def select(self, *names):
+        """
+        Keep only some columns
+
+        Returns:
+            TestDataset: Dataset with the given columns, in this order
+        """
+        missing = [name for name in names if name not in self._columns]
+        if missing:
+            raise KeyError(f"Unknown columns: {missing}")
+        id_column = self.id_column if self.id_column in names else None
+        dataset = TestDataset({name: self._columns[name] for name in names}, id_column=id_column)
+        dataset._length = self._length
+        dataset._ids = self.ids()
+        return dataset
+
+    def take(self, indexes):
+        """
+        Keep the rows at the given positions
+
+        Returns:
+            TestDataset: Dataset with those rows, in this order
+        """
+        dataset = TestDataset({name: column.take(indexes) for name, column in self._columns.items()},
+                              id_column=self.id_column)
+        dataset._length = len(indexes)
+        # Rows keep the IDs they had in the full dataset
+        ids = self.ids()
+        dataset._ids = [ids[i] for i in indexes]
+        return dataset
+
+    # -- pytest -------------------------------------------------------
+
+    def ids(self):
+        """
+        Stable test IDs for the rows
+
+        IDs come from id_column, or from a hash of the row content, so they do
+        not change when rows are added, removed or reordered; rows selected
+        with where/select/take keep the IDs of the dataset they came from.
+
+        Returns:
+            list: One ID per row
+        """
+        if self._ids is not None:
+            return self._ids
+        seen = {}
+        used = set()
+        result = []
+        for row in self:
+            if self.id_column is not None:
+                base = re.sub(r"[^\w.@-]+", "_", str(row[self.id_column])).strip("_") or "empty"
+            else:
+                base = hashlib.sha1(repr(sorted(row.items())).encode("utf-8")).hexdigest()[:10]
+            test_id = base
+            # A value such as 'a-2' may already be taken by a suffixed duplicate
+            while test_id in used:
+                seen[base] = seen.get(base, 1) + 1
+                test_id = f"{base}-{seen[base]}"
+            used.add(test_id)
+            result.append(test_id)
+        self._ids = result
+        return result
+
+    def params(self, *names):
+        """
+        Rows as pytest.param objects with stable IDs
+
+        Args:
+            names (str): Columns to pass as separate arguments; without names
+                each param is the whole row dictionary
+
+        Returns:
+            list: pytest.param objects for pytest.mark.parametrize
+        """
+        import pytest
+
+        columns = [self._columns[name] for name in names]
+        params = []
+        for index, test_id in enumerate(self.ids()):
+            if names:
+                values = tuple(column[index] for column in columns)
+            else:
+                values = (self[index],)
+            params.append(pytest.param(*values, id=test_id))
+        return params
@@ -5,7 +5,8 @@ Implements explicit waits and custom wait conditions
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from utils.DomScripts import FIND_ELEMENTS
 
 
 class WaitUtility:
@@ -145,3 +146,92 @@ class WaitUtility:
             return self.wait.until(EC.alert_is_present())
         except TimeoutException:
             raise TimeoutException("Alert not present")
+    
+    def wait_for_text_to_change(self, locator, previous_text):
+        """
+        Wait for the text of an element to differ from a previous value
+        
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            previous_text (str): Text before the action
+            
+        Returns:
+            str: The new element text
+        """
+        def text_changed(driver):
+            try:
+                text = driver.find_element(*locator).text
+            except (NoSuchElementException, StaleElementReferenceException):
+                return False
+            return text if text != previous_text else False
+        
+        try:
+            return self.wait.until(text_changed)
+        except TimeoutException:
+            raise TimeoutException(f"Text of {locator} still '{previous_text}'")
+    
+    def wait_for_staleness(self, element):
+        """
+        Wait for an element to be removed from the DOM (e.g. a re-rendered row)
+        
+        Args:
+            element (WebElement): Element captured before the action
+            
+        Returns:
+            bool: True once the element is stale
+        """
+        try:
+            return self.wait.until(EC.staleness_of(element))
+        except TimeoutException:
+            raise TimeoutException("Element was not removed from the DOM")
+    
+    def wait_for_script_condition(self, script, *args, message="Script condition not met"):
+        """
+        Wait for a JavaScript expression to return a truthy value
+        
+        Args:
+            script (str): JavaScript to execute; must return a value
+            *args: Arguments for the script
+            message (str): Timeout message
+            
+        Returns:
+            Any: The truthy script return value
+        """
+        try:
+            return self.wait.until(lambda driver: driver.execute_script(script, *args))
+        except TimeoutException:
+            raise TimeoutException(message)
+    
+    def wait_for_elements_stable(self, locator):
+        """
+        Wait for a group of elements to finish re-rendering
+        
+        The visibility, order and text of all matches is sampled in one script
+        call per poll and the wait ends when two consecutive samples are identical.
+        
+        Args:
+            locator (tuple): Locator tuple (By.METHOD, "value")
+            
+        Returns:
+            list: List of WebElements
+        """
+        previous = {}
+        by, value = locator
+        
+        def snapshot_stable(driver):
+            elements, snapshot = driver.execute_script(
+                FIND_ELEMENTS +
+                "var elements = findElements(arguments[0], arguments[1]);"
+                "return [elements, elements.map(function (el) {"
+                "  return [el.offsetParent !== null, el.textContent.length, el.textContent.slice(0, 40)];"
+                "})];",
+                by, value
+            )
+            stable = previous.get("snapshot") == snapshot
+            previous["snapshot"] = snapshot
+            return elements if stable else False
+        
+        try:
+            return WebDriverWait(self.driver, self.timeout, poll_frequency=0.05).until(snapshot_stable)
+        except TimeoutException:
+            raise TimeoutException(f"Elements kept changing: {locator}")
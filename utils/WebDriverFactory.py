@@ -6,8 +6,8 @@ Supports Chrome and Firefox with configurable options
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from utils.DriverBinaryCache import DriverBinaryCache
+from utils.CommandProfiler import CommandProfiler
 import subprocess
 import socket
 import time
@@ -30,11 +30,15 @@ class WebDriverFactory:
             WebDriver: Configured WebDriver instance
         """
         if browser.lower() == "chrome":
-            return WebDriverFactory._create_chrome_driver(headless)
+            driver = WebDriverFactory._create_chrome_driver(headless)
         elif browser.lower() == "firefox":
-            return WebDriverFactory._create_firefox_driver(headless)
+            driver = WebDriverFactory._create_firefox_driver(headless)
         else:
             raise ValueError(f"Unsupported browser: {browser}. Use 'chrome' or 'firefox'")
+        
+        if CommandProfiler.active is not None:
+            CommandProfiler.active.instrument(driver)
+        return driver
     
     @staticmethod
     def _create_chrome_driver(headless=False):
@@ -50,7 +54,7 @@ class WebDriverFactory:
         options.add_argument("--disable-notifications")
         options.add_argument("--ignore-certificate-errors")
         
-        service_path = ChromeDriverManager().install()
+        service_path = DriverBinaryCache.get_driver_path("chrome")
         try:
             service = ChromeService(service_path)
             driver = webdriver.Chrome(service=service, options=options)
@@ -90,7 +94,7 @@ class WebDriverFactory:
         if headless:
             options.add_argument("--headless")
         
-        service_path = GeckoDriverManager().install()
+        service_path = DriverBinaryCache.get_driver_path("firefox")
         try:
             service = FirefoxService(service_path)
             driver = webdriver.Firefox(service=service, options=options)
@@ -3,5 +3,7 @@
 from .WebDriverFactory import WebDriverFactory
 from .ExcelUtility import ExcelUtility
 from .WaitUtility import WaitUtility
+from .DriverPool import DriverPool
+from .EventWaitUtility import EventWaitUtility
 
-__all__ = ['WebDriverFactory', 'ExcelUtility', 'WaitUtility']
+__all__ = ['WebDriverFactory', 'ExcelUtility', 'WaitUtility', 'DriverPool', 'EventWaitUtility']